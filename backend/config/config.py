@@ -8,9 +8,9 @@ def get_spreadsheet_config():
         return json.load(f)
     
 # config RIOT API Environment Variables
-def get_riot_api_config(param: str = None):
+def get_riot_api_config(param: str = None, default: str = None):
     dotenv.load_dotenv("config/api.env")
     if param:
-        return os.getenv(param)
+        return os.getenv(param, default)
     else:
         return f"No parameter found for {param}"
@@ -6,6 +6,7 @@
 from __init__ import update_sys_path
 update_sys_path()
 from modules.utils.file_utils import save_json_to_file, load_json_from_file
+from constants.static_registry import get_static_registry
 
 class Constants:
     def __init__(self):
@@ -17,28 +18,27 @@ class Constants:
         self.ZEPHYR_RATE_LIMITS = load_json_from_file("constants/zephyrRateLimits.json")
         self.GCS_TEAMS = load_json_from_file("constants/gcsTeams.json")
     
-    # get champion name from champion id
+    # get champion name from champion id (hash lookup in the shared static registry)
     def get_champion_name(self, champion_id):
-        champion_keys = self.CHAMPION_CONSTANTS['data'].keys()
-        for champ in champion_keys:
-            if self.CHAMPION_CONSTANTS['data'][champ]['key'] == str(champion_id):
-                return self.CHAMPION_CONSTANTS['data'][champ]['id']
-        else:
-            return -1
+        return get_static_registry().champion_name(champion_id)
 
     def update_original_json(self, constant_str: str):
         match constant_str:
             case "CHAMPION_CONSTANTS":
                 save_json_to_file(self.CHAMPION_CONSTANTS, "constants/champions.json")
+                get_static_registry().reload("champions")  # cached registry tables re-read the saved file
                 return
             case "GAME_TYPES":
                 save_json_to_file(self.GAME_TYPES, "constants/gameTypes.json")
+                get_static_registry().reload("game_types")
                 return
             case "MAP_TYPES":
                 save_json_to_file(self.MAP_TYPES, "constants/maps.json")
+                get_static_registry().reload("maps")
                 return 
             case "QUEUE_TYPES":
                 save_json_to_file(self.QUEUE_TYPES, "constants/queues.json")
+                get_static_registry().reload("queues")
                 return 
             case "RESPONSE_CODES":
                 save_json_to_file(self.RESPONSE_CODES, "constants/responseCodes.json")
@@ -0,0 +1,211 @@
+###############
+### Imports ###
+###############
+
+# global imports
+import threading
+import numpy as np
+
+# local imports
+from . import update_sys_path
+update_sys_path()
+from modules.utils.file_utils import load_json_from_file
+
+CHAMPIONS_FILE = "constants/champions.json"
+QUEUES_FILE = "constants/queues.json"
+MAPS_FILE = "constants/maps.json"
+GAME_TYPES_FILE = "constants/gameTypes.json"
+UNKNOWN_CHAMPION = -1       # same "not found" value as Constants.get_champion_name
+
+
+class StaticRegistry:
+    """
+    [info] Process-wide, read-only lookups over the Data Dragon / static constants json files
+
+    Each file is loaded lazily on first use and kept until reload(), then indexed into hash maps:
+    champion key <-> id <-> display name, queueId -> queue, mapId -> map, gametype -> description.
+    champion_names() decodes whole arrays of champion keys (lists, NumPy arrays, pandas Series)
+    with one table lookup instead of a Python loop.
+
+    Usage:
+        registry = get_static_registry()
+        registry.champion_name(266)                 # "Aatrox"
+        registry.champion_names([62, 64, -1])       # array(["MonkeyKing", "LeeSin", -1])
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self._champions = None      # dict of lookup tables, built by _load_champions
+        self._queues = None
+        self._maps = None
+        self._game_types = None
+
+    def reload(self, table: str = None) -> None:
+        """
+        [info] Drop cached tables so the next lookup re-reads the json file (ex. after champions.json is updated)
+        [param] table: champions, queues, maps or game_types (default: None, every table)
+        [return] None
+        """
+        tables = (table,) if table else ("champions", "queues", "maps", "game_types")
+        with self.lock:
+            for name in tables:
+                if not hasattr(self, f"_{name}"):
+                    raise ValueError(f"Unknown static table: {name}")
+                setattr(self, f"_{name}", None)
+
+    #################
+    ### CHAMPIONS ###
+    #################
+    def _load_champions(self) -> dict:
+        with self.lock:
+            if self._champions is None:
+                data = load_json_from_file(CHAMPIONS_FILE)["data"]
+                by_key = {int(champion["key"]): champion for champion in data.values()}
+                max_key = max(by_key)
+                ids = np.empty(max_key + 1, dtype=object)   # dense key -> id table for vectorized decoding
+                ids[:] = UNKNOWN_CHAMPION
+                for key, champion in by_key.items():
+                    ids[key] = champion["id"]
+                self._champions = {
+                    "version": next(iter(data.values()))["version"],
+                    "by_key": by_key,
+                    "key_by_name": {
+                        **{champion["name"].lower(): key for key, champion in by_key.items()},
+                        **{champion["id"].lower(): key for key, champion in by_key.items()},
+                    },
+                    "ids": ids,
+                }
+            return self._champions
+
+    @property
+    def champion_version(self) -> str:
+        # Data Dragon patch of champions.json (ex. 15.1.1)
+        return self._load_champions()["version"]
+
+    def champion(self, champion_key: int) -> dict:
+        """
+        [info] Full champions.json entry of a champion
+        [param] champion_key: Champion key as int or str (ex. 266, matches championId in MatchDTOs)
+        [return] Dictionary or None if unknown
+        """
+        try:
+            return self._load_champions()["by_key"].get(int(champion_key))
+        except (TypeError, ValueError):
+            return None
+
+    def champion_name(self, champion_key: int):
+        """
+        [info] Champion id string of a champion key (same result as Constants.get_champion_name)
+        [param] champion_key: Champion key as int or str (ex. 62)
+        [return] Champion id (ex. "MonkeyKing") or -1 if unknown
+        """
+        champion = self.champion(champion_key)
+        return champion["id"] if champion else UNKNOWN_CHAMPION
+
+    def champion_display_name(self, champion_key: int):
+        """
+        [info] In-game name of a champion key
+        [param] champion_key: Champion key as int or str (ex. 62)
+        [return] Display name (ex. "Wukong") or -1 if unknown
+        """
+        champion = self.champion(champion_key)
+        return champion["name"] if champion else UNKNOWN_CHAMPION
+
+    def champion_key(self, champion_name: str) -> int:
+        """
+        [info] Champion key of a champion id or display name (case insensitive)
+        [param] champion_name: Champion id or display name (ex. "MonkeyKing" / "Wukong")
+        [return] Champion key (ex. 62) or -1 if unknown
+        """
+        return self._load_champions()["key_by_name"].get(str(champion_name).lower(), UNKNOWN_CHAMPION)
+
+    def champion_names(self, champion_keys) -> np.ndarray:
+        """
+        [info] Vectorized champion_name() over many champion keys (ex. a bans / picks column)
+        [param] champion_keys: List, NumPy array or pandas Series of int champion keys
+        [return] NumPy object array of champion ids, -1 where unknown (ex. skipped bans)
+        """
+        ids = self._load_champions()["ids"]
+        keys = np.asarray(champion_keys, dtype=np.int64)
+        valid = (keys >= 0) & (keys < len(ids))
+        names = np.full(keys.shape, UNKNOWN_CHAMPION, dtype=object)
+        names[valid] = ids[keys[valid]]
+        return names
+
+    ##############
+    ### QUEUES ###
+    ##############
+    def _load_queues(self) -> dict:
+        with self.lock:
+            if self._queues is None:
+                self._queues = {queue["queueId"]: queue for queue in load_json_from_file(QUEUES_FILE)}
+            return self._queues
+
+    def queue(self, queue_id: int) -> dict:
+        """
+        [info] queues.json entry of a queue
+        [param] queue_id: Queue ID (ex. 420)
+        [return] Dictionary with queueId, map, description, notes (or None if unknown)
+        """
+        return self._load_queues().get(int(queue_id))
+
+    def queue_description(self, queue_id: int) -> str:
+        """
+        [info] Readable queue name
+        [param] queue_id: Queue ID (ex. 420)
+        [return] Description (ex. "5v5 Ranked Solo games"), map name if the queue has no description, None if unknown
+        """
+        queue = self.queue(queue_id)
+        return (queue["description"] or queue["map"]) if queue else None
+
+    ############
+    ### MAPS ###
+    ############
+    def _load_maps(self) -> dict:
+        with self.lock:
+            if self._maps is None:
+                self._maps = {game_map["mapId"]: game_map for game_map in load_json_from_file(MAPS_FILE)}
+            return self._maps
+
+    def map_name(self, map_id: int) -> str:
+        """
+        [info] Map name of a map ID
+        [param] map_id: Map ID (ex. 11)
+        [return] Map name (ex. "Summoner's Rift") or None if unknown
+        """
+        game_map = self._load_maps().get(int(map_id))
+        return game_map["mapName"] if game_map else None
+
+    ##################
+    ### GAME TYPES ###
+    ##################
+    def _load_game_types(self) -> dict:
+        with self.lock:
+            if self._game_types is None:
+                self._game_types = {game_type["gametype"]: game_type["description"] for game_type in load_json_from_file(GAME_TYPES_FILE)}
+            return self._game_types
+
+    def game_type_description(self, game_type: str) -> str:
+        """
+        [info] Description of a game type
+        [param] game_type: Game type (ex. CUSTOM_GAME, MATCHED_GAME)
+        [return] Description (ex. "Custom games") or None if unknown
+        """
+        return self._load_game_types().get(game_type)
+
+
+##############################
+### SHARED STATIC REGISTRY ###
+##############################
+_SHARED_STATIC_REGISTRY = None
+_SHARED_STATIC_REGISTRY_LOCK = threading.Lock()
+
+def get_static_registry() -> StaticRegistry:
+    """
+    [info] Process-wide static data registry (files load lazily on first lookup)
+    [return] Shared StaticRegistry instance
+    """
+    global _SHARED_STATIC_REGISTRY
+    with _SHARED_STATIC_REGISTRY_LOCK:
+        if _SHARED_STATIC_REGISTRY is None:
+            _SHARED_STATIC_REGISTRY = StaticRegistry()
+        return _SHARED_STATIC_REGISTRY
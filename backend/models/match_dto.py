@@ -0,0 +1,311 @@
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import sys
+import json
+
+# Compact MatchDTO model layer (match-v5). Every DTO stores its fields in __slots__ (no per-object
+# __dict__), repeated strings (puuids, champion names, positions) are interned, and the large,
+# rarely read participant sub-objects (challenges, perks, missions) are kept as compact json bytes
+# until first accessed. Keys Riot adds in later patches are kept in `extra` so to_dict() round-trips.
+
+
+class SlotsDTO:
+    """
+    [info] Base for __slots__ DTOs built from Riot json (subclasses list their json keys in FIELDS)
+    """
+    __slots__ = ("extra",)
+    FIELDS = ()             # json keys stored as slots, missing keys are None
+    NESTED = {}             # json key -> DTO class (dict) or (DTO class,) (list of dicts)
+    INTERNED = ()           # string fields shared across many objects
+    LAZY = ()               # json keys kept encoded until first access (subclass handles them)
+
+    @classmethod
+    def from_json(cls, json_data: dict):
+        """
+        [info] Create DTO from JSON
+        [param] json_data: Riot json object
+        [return] DTO instance
+        """
+        dto = cls.__new__(cls)
+        for field in cls.FIELDS:
+            value = json_data.get(field)
+            if value is not None:
+                nested = cls.NESTED.get(field)
+                if nested is None:
+                    if field in cls.INTERNED and isinstance(value, str):
+                        value = sys.intern(value)
+                elif isinstance(nested, tuple):
+                    value = tuple(nested[0].from_json(entry) for entry in value)
+                else:
+                    value = nested.from_json(value)
+            setattr(dto, field, value)
+        dto._load_extra(json_data)
+        return dto
+
+    def _load_extra(self, json_data: dict) -> None:
+        known = self.FIELDS + self.LAZY
+        extra = {key: value for key, value in json_data.items() if key not in known}
+        self.extra = extra or None
+
+    def to_dict(self) -> dict:
+        """
+        [info] Convert DTO back to its Riot json shape
+        [return] Dictionary (nested DTOs converted too)
+        """
+        json_data = {}
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if isinstance(value, SlotsDTO):
+                value = value.to_dict()
+            elif isinstance(value, tuple):
+                value = [entry.to_dict() if isinstance(entry, SlotsDTO) else entry for entry in value]
+            json_data[field] = value
+        if self.extra:
+            json_data.update(self.extra)
+        return json_data
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS[:3])
+        return f"{type(self).__name__}({fields})"
+
+
+############
+### BANS ###
+############
+class BanDTO(SlotsDTO):
+    FIELDS = ("championId", "pickTurn")
+    __slots__ = FIELDS
+
+
+##################
+### OBJECTIVES ###
+##################
+class ObjectiveDTO(SlotsDTO):
+    FIELDS = ("first", "kills")
+    __slots__ = FIELDS
+
+
+class ObjectivesDTO(SlotsDTO):
+    FIELDS = ("atakhan", "baron", "champion", "dragon", "horde", "inhibitor", "riftHerald", "tower")
+    __slots__ = FIELDS
+    NESTED = {field: ObjectiveDTO for field in FIELDS}
+
+    def to_dict(self) -> dict:
+        json_data = super().to_dict()
+        if json_data["atakhan"] is None:
+            del json_data["atakhan"]    # only present in newer patches
+        return json_data
+
+
+#############
+### TEAMS ###
+#############
+class TeamDTO(SlotsDTO):
+    FIELDS = ("teamId", "win", "bans", "objectives")
+    __slots__ = FIELDS
+    NESTED = {"bans": (BanDTO,), "objectives": ObjectivesDTO}
+
+    @property
+    def side(self) -> str:
+        return "blue" if self.teamId == 100 else "red"
+
+    def ban_champion_ids(self) -> list:
+        """
+        [info] Banned champion keys in pick turn order
+        [return] List of champion IDs (-1 for skipped bans)
+        """
+        return [ban.championId for ban in sorted(self.bans or (), key=lambda ban: ban.pickTurn)]
+
+
+#############
+### PERKS ###
+#############
+class PerkSelectionDTO(SlotsDTO):
+    FIELDS = ("perk", "var1", "var2", "var3")
+    __slots__ = FIELDS
+
+
+class PerkStyleDTO(SlotsDTO):
+    FIELDS = ("description", "selections", "style")
+    __slots__ = FIELDS
+    NESTED = {"selections": (PerkSelectionDTO,)}
+    INTERNED = ("description",)
+
+
+class PerkStatsDTO(SlotsDTO):
+    FIELDS = ("defense", "flex", "offense")
+    __slots__ = FIELDS
+
+
+class PerksDTO(SlotsDTO):
+    FIELDS = ("statPerks", "styles")
+    __slots__ = FIELDS
+    NESTED = {"statPerks": PerkStatsDTO, "styles": (PerkStyleDTO,)}
+
+    @property
+    def keystone(self) -> int:
+        # first selection of the primary style (ex. 8437 Grasp of the Undying)
+        return self.styles[0].selections[0].perk if self.styles else None
+
+
+####################
+### PARTICIPANTS ###
+####################
+PARTICIPANT_LAZY_FIELDS = ("challenges", "perks", "missions")   # decoded on first access
+PLAYER_SCORE_FIELDS = tuple(f"PlayerScore{idx}" for idx in range(12))  # on every participant (mostly 0), slots instead of `extra`
+
+
+def _encode_lazy(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8") if value is not None else None
+
+
+class ParticipantDTO(SlotsDTO):
+    """
+    [info] One player of a match (ParticipantDto); challenges / perks / missions are decoded lazily
+    """
+    FIELDS = (
+        "allInPings", "assistMePings", "assists", "baronKills", "basicPings", "bountyLevel", "champExperience",
+        "champLevel", "championId", "championName", "championTransform", "commandPings", "consumablesPurchased",
+        "damageDealtToBuildings", "damageDealtToObjectives", "damageDealtToTurrets", "damageSelfMitigated",
+        "dangerPings", "deaths", "detectorWardsPlaced", "doubleKills", "dragonKills", "eligibleForProgression",
+        "enemyMissingPings", "enemyVisionPings", "firstBloodAssist", "firstBloodKill", "firstTowerAssist",
+        "firstTowerKill", "gameEndedInEarlySurrender", "gameEndedInSurrender", "getBackPings", "goldEarned",
+        "goldSpent", "holdPings", "individualPosition", "inhibitorKills", "inhibitorTakedowns", "inhibitorsLost",
+        "item0", "item1", "item2", "item3", "item4", "item5", "item6", "itemsPurchased", "killingSprees", "kills",
+        "lane", "largestCriticalStrike", "largestKillingSpree", "largestMultiKill", "longestTimeSpentLiving",
+        "magicDamageDealt", "magicDamageDealtToChampions", "magicDamageTaken", "needVisionPings",
+        "neutralMinionsKilled", "nexusKills", "nexusLost", "nexusTakedowns", "objectivesStolen",
+        "objectivesStolenAssists", "onMyWayPings", "participantId", "pentaKills", "physicalDamageDealt",
+        "physicalDamageDealtToChampions", "physicalDamageTaken", "placement", "playerAugment1", "playerAugment2",
+        "playerAugment3", "playerAugment4", "playerAugment5", "playerAugment6", "playerSubteamId", "profileIcon",
+        "pushPings", "puuid", "quadraKills", "retreatPings", "riotIdGameName", "riotIdTagline", "role",
+        "sightWardsBoughtInGame", "spell1Casts", "spell2Casts", "spell3Casts", "spell4Casts", "subteamPlacement",
+        "summoner1Casts", "summoner1Id", "summoner2Casts", "summoner2Id", "summonerId", "summonerLevel",
+        "summonerName", "teamEarlySurrendered", "teamId", "teamPosition", "timeCCingOthers", "timePlayed",
+        "totalAllyJungleMinionsKilled", "totalDamageDealt", "totalDamageDealtToChampions",
+        "totalDamageShieldedOnTeammates", "totalDamageTaken", "totalEnemyJungleMinionsKilled", "totalHeal",
+        "totalHealsOnTeammates", "totalMinionsKilled", "totalTimeCCDealt", "totalTimeSpentDead", "totalUnitsHealed",
+        "tripleKills", "trueDamageDealt", "trueDamageDealtToChampions", "trueDamageTaken", "turretKills",
+        "turretTakedowns", "turretsLost", "unrealKills", "visionClearedPings", "visionScore",
+        "visionWardsBoughtInGame", "wardsKilled", "wardsPlaced", "win",
+    ) + PLAYER_SCORE_FIELDS
+    __slots__ = FIELDS + ("_challenges", "_perks", "_missions")
+    INTERNED = ("championName", "individualPosition", "lane", "puuid", "riotIdGameName", "riotIdTagline", "role", "summonerId", "summonerName", "teamPosition")
+    LAZY = PARTICIPANT_LAZY_FIELDS
+
+    @classmethod
+    def from_json(cls, json_data: dict):
+        dto = super().from_json(json_data)
+        dto._challenges = _encode_lazy(json_data.get("challenges"))
+        dto._perks = _encode_lazy(json_data.get("perks"))
+        dto._missions = _encode_lazy(json_data.get("missions"))
+        return dto
+
+    ### Lazy sub-objects (decoded once, on first access) ###
+    @property
+    def challenges(self) -> dict:
+        # ~130 derived stats (ex. kda, killParticipation, damagePerMinute)
+        if isinstance(self._challenges, bytes):
+            self._challenges = json.loads(self._challenges)
+        return self._challenges
+
+    @property
+    def perks(self) -> PerksDTO:
+        if isinstance(self._perks, bytes):
+            self._perks = PerksDTO.from_json(json.loads(self._perks))
+        return self._perks
+
+    @property
+    def missions(self) -> dict:
+        if isinstance(self._missions, bytes):
+            self._missions = json.loads(self._missions)
+        return self._missions
+
+    @property
+    def riot_id(self) -> str:
+        return f"{self.riotIdGameName}#{self.riotIdTagline}"
+
+    @property
+    def items(self) -> list:
+        return [self.item0, self.item1, self.item2, self.item3, self.item4, self.item5, self.item6]
+
+    @property
+    def player_scores(self) -> list:
+        return [getattr(self, field) for field in PLAYER_SCORE_FIELDS]
+
+    def to_dict(self) -> dict:
+        json_data = super().to_dict()
+        json_data["challenges"] = self.challenges
+        json_data["perks"] = self.perks.to_dict() if self.perks is not None else None
+        json_data["missions"] = self.missions
+        return json_data
+
+    def __repr__(self):
+        return f"ParticipantDTO(riot_id={self.riot_id}, championName={self.championName}, teamPosition={self.teamPosition}, win={self.win})"
+
+
+#############
+### MATCH ###
+#############
+class MetadataDTO(SlotsDTO):
+    FIELDS = ("dataVersion", "matchId", "participants")
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_json(cls, json_data: dict):
+        dto = super().from_json(json_data)
+        dto.participants = tuple(sys.intern(puuid) for puuid in dto.participants or ())
+        return dto
+
+
+class InfoDTO(SlotsDTO):
+    FIELDS = (
+        "endOfGameResult", "gameCreation", "gameDuration", "gameEndTimestamp", "gameId", "gameMode", "gameName",
+        "gameStartTimestamp", "gameType", "gameVersion", "mapId", "participants", "platformId", "queueId", "teams",
+        "tournamentCode",
+    )
+    __slots__ = FIELDS
+    NESTED = {"participants": (ParticipantDTO,), "teams": (TeamDTO,)}
+    INTERNED = ("endOfGameResult", "gameMode", "gameType", "gameVersion", "platformId")
+
+
+class MatchDTO(SlotsDTO):
+    """
+    [info] Compact match-v5 MatchDto (metadata + info), built from MATCH_V5.get_match_by_id json or saved tourney files
+
+    Usage:
+        match = MatchDTO.from_json(MATCH_V5.get_match_by_id(match_id)[1])
+        match.info.participants[0].championName, match.team(100).bans, match.participant(puuid).challenges["kda"]
+    """
+    FIELDS = ("metadata", "info")
+    __slots__ = FIELDS
+    NESTED = {"metadata": MetadataDTO, "info": InfoDTO}
+
+    @property
+    def match_id(self) -> str:
+        return self.metadata.matchId
+
+    def participant(self, puuid: str) -> ParticipantDTO:
+        """
+        [info] Participant of a player
+        [param] puuid: Player's unique identifier
+        [return] ParticipantDTO or None if the player is not in this match
+        """
+        return next((participant for participant in self.info.participants if participant.puuid == puuid), None)
+
+    def team(self, team_id: int) -> TeamDTO:
+        """
+        [info] Team of a side
+        [param] team_id: 100 (blue) or 200 (red)
+        [return] TeamDTO or None
+        """
+        return next((team for team in self.info.teams if team.teamId == team_id), None)
+
+    def participants_by_team(self, team_id: int) -> list:
+        return [participant for participant in self.info.participants if participant.teamId == team_id]
+
+    def __repr__(self):
+        return f"MatchDTO(matchId={self.metadata.matchId}, gameVersion={self.info.gameVersion}, gameDuration={self.info.gameDuration})"
@@ -0,0 +1,252 @@
+###############
+### IMPORTS ###
+###############
+
+# global imports
+import os, re, json, logging, threading
+
+# local imports
+from . import update_sys_path
+update_sys_path()
+from modules.utils.json_projection import load_json_projected, Projection
+
+TOURNEY_GAMES_DIR = "../data/official_tourney_games"                     # relative to backend/
+MATCH_INDEX_FILE = "../data/cache/tourney_match_index.json"
+TOURNEY_FILE_PATTERN = re.compile(r"^NA1_(\d+)_(D\d+S\d+)_match_(\d+)\.json$")   # NA1_<game id>_<series>_match_<game>.json
+SIDES = {100: "blue", 200: "red"}
+
+# only what the indexes are built from is kept in memory (files are still parsed in full)
+MATCH_INDEX_PROJECTION = Projection((
+    "metadata.matchId",
+    "info.gameCreation",
+    "info.teams[].teamId",
+    "info.teams[].win",
+    "info.participants[].puuid",
+    "info.participants[].teamId",
+    "info.participants[].teamPosition",
+    "team_ids",
+    "winning_team_id",
+))
+
+
+class TourneyMatchIndex:
+    """
+    [info] Persistent secondary indexes over the saved tourney games
+
+    Maps team ID -> match IDs, PUUID -> (match ID, side, role) and GCS series ID (ex. D1S4) -> games,
+    plus one record per match (file, series, game number, team IDs by side, winner). refresh()
+    compares the directory listing with the files already indexed (size + mtime) and only parses
+    new or changed files, so keeping the index current costs O(new files). Per-team / per-player
+    lookups are dictionary hits instead of re-reading every NA1_* file.
+
+    Usage:
+        index = get_match_index()                       # loads ../data/cache/tourney_match_index.json and refreshes it
+        for match_id in index.matches_for_team("V8"): record = index.match(match_id)
+        index.series("D1S4")                            # games of one series in order
+    """
+    def __init__(self, games_dir: str = TOURNEY_GAMES_DIR, index_file: str = MATCH_INDEX_FILE) -> None:
+        """
+        [info] Load the persisted index (or start empty)
+        [param] games_dir: Directory of tourney MatchDTO files (default: ../data/official_tourney_games)
+        [param] index_file: Json file the index is persisted to (default: ../data/cache/tourney_match_index.json)
+        [return] None
+        """
+        self.games_dir = games_dir
+        self.index_file = index_file
+        self.lock = threading.RLock()
+        self.files = {}         # file name -> [size, mtime_ns, match ID]
+        self.matches = {}       # match ID -> record
+        self.teams = {}         # team ID -> [match IDs]
+        self.puuids = {}        # puuid -> [[match ID, side, role]]
+        self.series_games = {}  # series ID -> [match IDs] ordered by game number
+        self._load()
+
+    def _load(self) -> None:
+        """
+        [info] Load the persisted index, empty if missing or corrupt
+        [return] None
+        """
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file) as f:
+                data = json.load(f)
+            self.files, self.matches = data["files"], data["matches"]
+            self.teams, self.puuids, self.series_games = data["teams"], data["puuids"], data["series"]
+        except (OSError, KeyError, json.JSONDecodeError) as e:
+            logging.warning(f"[TourneyMatchIndex] Rebuilding unreadable index {self.index_file}: {e}")
+            self.files, self.matches, self.teams, self.puuids, self.series_games = {}, {}, {}, {}, {}
+
+    def save(self) -> None:
+        """
+        [info] Atomically persist the index
+        [return] None
+        """
+        with self.lock:
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            tmp_path = f"{self.index_file}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"files": self.files, "matches": self.matches, "teams": self.teams, "puuids": self.puuids, "series": self.series_games}, f)
+            os.replace(tmp_path, self.index_file)
+
+    ################
+    ### UPDATING ###
+    ################
+    def refresh(self) -> int:
+        """
+        [info] Index new / changed files and drop removed ones (saves the index if anything changed)
+        [return] Number of files (re)indexed or removed
+        """
+        with self.lock:
+            listing = {}
+            for file in os.listdir(self.games_dir):
+                if TOURNEY_FILE_PATTERN.match(file):
+                    stat = os.stat(os.path.join(self.games_dir, file))
+                    listing[file] = [stat.st_size, stat.st_mtime_ns]
+
+            changes = 0
+            for file in list(self.files):
+                if listing.get(file) != self.files[file][:2]:
+                    self._remove(file)
+                    changes += 1
+            for file in sorted(listing):
+                if file not in self.files:
+                    self._add(file, listing[file])
+                    changes += 1
+            if changes:
+                self.save()
+                logging.info(f"[TourneyMatchIndex] {changes} file(s) indexed / removed, {len(self.matches)} matches")
+            return changes
+
+    def _add(self, file: str, stat: list) -> None:
+        """
+        [info] Index one tourney file
+        [param] file: File name in games_dir
+        [param] stat: [size, mtime_ns]
+        [return] None
+        """
+        series_id, game = TOURNEY_FILE_PATTERN.match(file).group(2, 3)
+        data = load_json_projected(os.path.join(self.games_dir, file), MATCH_INDEX_PROJECTION)
+        match_id = data["metadata"]["matchId"]
+        info = data["info"]
+
+        # the annotated winner's side pins down which team played which side
+        team_ids = data.get("team_ids") or []
+        winning_team_id = data.get("winning_team_id")
+        winning_side = next((team["teamId"] for team in info["teams"] if team.get("win")), None)
+        side_team_ids = {}
+        if winning_team_id and len(team_ids) == 2 and winning_side in SIDES:
+            losing_team_id = team_ids[1] if team_ids[0] == winning_team_id else team_ids[0]
+            side_team_ids = {SIDES[winning_side]: winning_team_id, SIDES[300 - winning_side]: losing_team_id}
+
+        self.files[file] = stat + [match_id]
+        self.matches[match_id] = {
+            "file": file, "series": series_id, "game": int(game), "game_creation": info.get("gameCreation"),
+            "team_ids": team_ids, "winning_team_id": winning_team_id,
+            "blue_team_id": side_team_ids.get("blue"), "red_team_id": side_team_ids.get("red"),
+        }
+        for team_id in team_ids:
+            self.teams.setdefault(team_id, []).append(match_id)
+        for participant in info["participants"]:
+            self.puuids.setdefault(participant["puuid"], []).append([match_id, SIDES.get(participant["teamId"]), participant.get("teamPosition")])
+        games = self.series_games.setdefault(series_id, [])
+        games.append(match_id)
+        games.sort(key=lambda game_match_id: self.matches[game_match_id]["game"])
+
+    def _remove(self, file: str) -> None:
+        """
+        [info] Drop one file's entries from every index
+        [param] file: File name in games_dir
+        [return] None
+        """
+        match_id = self.files.pop(file)[2]
+        record = self.matches.pop(match_id, None)
+        if record is None:
+            return
+        for index in (self.teams, self.series_games):
+            for key in list(index):
+                if match_id in index[key]:
+                    index[key].remove(match_id)
+                    if not index[key]:
+                        del index[key]
+        for puuid in list(self.puuids):
+            self.puuids[puuid] = [entry for entry in self.puuids[puuid] if entry[0] != match_id]
+            if not self.puuids[puuid]:
+                del self.puuids[puuid]
+
+    ###############
+    ### LOOKUPS ###
+    ###############
+    def match(self, match_id: str) -> dict:
+        """
+        [info] Index record of a match
+        [param] match_id: Match ID (ex. NA1_5209438443)
+        [return] Dictionary with file, series, game, game_creation, team_ids, winning_team_id, blue_team_id, red_team_id (or None)
+        """
+        return self.matches.get(match_id)
+
+    def path(self, match_id: str) -> str:
+        """
+        [info] File path of an indexed match
+        [param] match_id: Match ID
+        [return] Path to the MatchDTO json, or None if not indexed
+        """
+        record = self.matches.get(match_id)
+        return os.path.join(self.games_dir, record["file"]) if record else None
+
+    def matches_for_team(self, team_id: str, opponent_team_id: str = None) -> list:
+        """
+        [info] Match IDs a team played, oldest first
+        [param] team_id: Team ID (ex. V8)
+        [param] opponent_team_id: Only matches against this team (default: None)
+        [return] List of match IDs
+        """
+        match_ids = self.teams.get(team_id, [])
+        if opponent_team_id:
+            match_ids = [match_id for match_id in match_ids if opponent_team_id in self.matches[match_id]["team_ids"]]
+        return sorted(match_ids, key=lambda match_id: self.matches[match_id]["game_creation"] or 0)
+
+    def matches_for_puuid(self, puuid: str) -> list:
+        """
+        [info] Games a player appears in
+        [param] puuid: Player's unique identifier
+        [return] List of (match ID, side, role) tuples, ex. ("NA1_5209438443", "blue", "JUNGLE")
+        """
+        return [tuple(entry) for entry in self.puuids.get(puuid, [])]
+
+    def series(self, series_id: str) -> list:
+        """
+        [info] Games of a GCS series
+        [param] series_id: Series ID (ex. D1S4)
+        [return] List of match IDs ordered by game number
+        """
+        return list(self.series_games.get(series_id, []))
+
+    def side_of(self, match_id: str, team_id: str) -> str:
+        """
+        [info] Side a team played in a match
+        [param] match_id: Match ID
+        [param] team_id: Team ID
+        [return] "blue", "red" or None if unknown
+        """
+        record = self.matches.get(match_id) or {}
+        return "blue" if record.get("blue_team_id") == team_id else "red" if record.get("red_team_id") == team_id else None
+
+
+##########################
+### SHARED MATCH INDEX ###
+##########################
+_SHARED_MATCH_INDEX = None
+_SHARED_MATCH_INDEX_LOCK = threading.Lock()
+
+def get_match_index() -> TourneyMatchIndex:
+    """
+    [info] Process-wide tourney match index (refreshed against ../data/official_tourney_games on first use)
+    [return] Shared TourneyMatchIndex instance
+    """
+    global _SHARED_MATCH_INDEX
+    with _SHARED_MATCH_INDEX_LOCK:
+        if _SHARED_MATCH_INDEX is None:
+            _SHARED_MATCH_INDEX = TourneyMatchIndex()
+            _SHARED_MATCH_INDEX.refresh()
+        return _SHARED_MATCH_INDEX
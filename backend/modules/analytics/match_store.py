@@ -0,0 +1,364 @@
+###############
+### IMPORTS ###
+###############
+
+# global imports
+import os, json, shutil, logging, threading
+import numpy as np
+
+# local imports
+from . import update_sys_path
+update_sys_path()
+from modules.utils.json_projection import load_json_projected, Projection
+
+MATCH_STORE_DIR = "../data/cache/match_store"               # relative to backend/
+MATCH_SOURCE_DIRS = ("../data/official_tourney_games",)     # hand-saved tourney MatchDTOs (NA1_*.json)
+MANIFEST_FILE_NAME = "manifest.json"
+DICTIONARIES_FILE_NAME = "dictionaries.json"
+MISSING = -1                                                # code / value for absent fields (ex. no tourney annotation)
+UNKNOWN = -2                                                # query code of a value that never occurs, matches no stored row (not even MISSING ones)
+
+# only the fields the tables are built from are kept in memory (files are still parsed in full)
+MATCH_STORE_PROJECTION = Projection((
+    "metadata.matchId",
+    "info.gameCreation",
+    "info.gameDuration",
+    "info.gameVersion",
+    "info.teams",
+    "info.participants[].puuid",
+    "info.participants[].participantId",
+    "info.participants[].teamId",
+    "info.participants[].championId",
+    "info.participants[].championName",
+    "info.participants[].teamPosition",
+    "info.participants[].kills",
+    "info.participants[].deaths",
+    "info.participants[].assists",
+    "info.participants[].goldEarned",
+    "info.participants[].totalDamageDealtToChampions",
+    "info.participants[].visionScore",
+    "info.participants[].totalMinionsKilled",
+    "info.participants[].neutralMinionsKilled",
+    "info.participants[].champLevel",
+    "info.participants[].win",
+    "team_ids",
+    "winning_team_id",
+))
+
+# table -> column -> dtype (columns named after a dictionary hold its codes)
+TABLE_SCHEMAS = {
+    "matches": {
+        "match": np.int32, "game_creation": np.int64, "game_duration": np.int32, "game_version": np.int32,
+        "blue_team_id": np.int32, "red_team_id": np.int32, "winning_team_id": np.int32,
+    },
+    "participants": {
+        "match": np.int32, "side": np.int16, "participant_id": np.int8, "puuid": np.int32, "champion": np.int32,
+        "champion_id": np.int16, "position": np.int8, "kills": np.int16, "deaths": np.int16, "assists": np.int16,
+        "gold_earned": np.int32, "damage_to_champions": np.int32, "vision_score": np.int16, "cs": np.int16,
+        "champ_level": np.int8, "win": np.bool_,
+    },
+    "teams": {
+        "match": np.int32, "side": np.int16, "team_id": np.int32, "win": np.bool_,
+    },
+    "bans": {
+        "match": np.int32, "side": np.int16, "team_id": np.int32, "pick_turn": np.int8, "champion_id": np.int16,
+    },
+    "objectives": {
+        "match": np.int32, "side": np.int16, "team_id": np.int32, "objective": np.int8, "first": np.bool_, "kills": np.int16,
+    },
+}
+
+# dictionary-encoded columns (column name -> dictionary name)
+ENCODED_COLUMNS = {
+    "match": "match_ids", "game_version": "game_versions", "blue_team_id": "team_ids", "red_team_id": "team_ids",
+    "winning_team_id": "team_ids", "team_id": "team_ids", "puuid": "puuids", "champion": "champions",
+    "position": "positions", "objective": "objectives",
+}
+
+
+class ColumnarMatchStore:
+    """
+    [info] Columnar copy of the saved tourney matches for vectorized scouting queries
+
+    build() flattens every MatchDTO once into five tables (matches, participants, teams, bans,
+    objectives), one NumPy .npy file per column, with match IDs, PUUIDs, champions, team IDs,
+    positions and objectives dictionary-encoded as int codes (dictionaries.json holds the values).
+    Columns are memory-mapped on load, so queries are boolean masks / bincounts over arrays instead
+    of re-listing and re-parsing every json file. Sides follow Riot's teamId (100 blue, 200 red);
+    tourney team IDs come from the files' team_ids / winning_team_id annotations.
+
+    Usage:
+        store = get_match_store()                       # builds on first use, rebuilds if source files changed
+        store.champion_stats(team_id="V8")              # champion -> (games, wins) for one team
+        store.ban_counts(against_team_id="V8")          # champions banned against a team
+    """
+    def __init__(self, store_dir: str = MATCH_STORE_DIR, source_dirs: tuple = MATCH_SOURCE_DIRS) -> None:
+        """
+        [info] Initialize an (unloaded) store
+        [param] store_dir: Directory holding the column files (default: ../data/cache/match_store)
+        [param] source_dirs: Directories of MatchDTO json files to ingest (default: ../data/official_tourney_games)
+        [return] None
+        """
+        self.store_dir = store_dir
+        self.source_dirs = tuple(source_dirs)
+        self.tables = {}            # table -> column -> np.ndarray (memory-mapped)
+        self.dictionaries = {}      # dictionary name -> list of values (code = index)
+        self.codes = {}             # dictionary name -> value -> code
+
+    ##############
+    ### INGEST ###
+    ##############
+    def _source_manifest(self) -> dict:
+        """
+        [info] Source files with their size / mtime (a changed manifest means the store is stale)
+        [return] Dictionary of path -> [size, mtime_ns]
+        """
+        manifest = {}
+        for source_dir in self.source_dirs:
+            for file in sorted(os.listdir(source_dir)):
+                if file.startswith("NA1_") and file.endswith(".json"):
+                    stat = os.stat(os.path.join(source_dir, file))
+                    manifest[os.path.join(source_dir, file)] = [stat.st_size, stat.st_mtime_ns]
+        return manifest
+
+    def is_stale(self) -> bool:
+        """
+        [info] Whether the source files changed since the last build
+        [return] True if the store is missing or out of date
+        """
+        manifest_path = os.path.join(self.store_dir, MANIFEST_FILE_NAME)
+        if not os.path.exists(manifest_path):
+            return True
+        with open(manifest_path) as f:
+            return json.load(f) != self._source_manifest()
+
+    def build(self) -> int:
+        """
+        [info] Flatten every source MatchDTO into column files (replaces the previous build)
+        [return] Number of ingested matches
+        """
+        manifest = self._source_manifest()
+        dictionaries = {name: [] for name in set(ENCODED_COLUMNS.values())}
+        codes = {name: {} for name in dictionaries}
+        rows = {table: {column: [] for column in schema} for table, schema in TABLE_SCHEMAS.items()}
+
+        def encode(name: str, value) -> int:
+            if value is None:
+                return MISSING
+            code = codes[name].get(value)
+            if code is None:
+                code = codes[name][value] = len(dictionaries[name])
+                dictionaries[name].append(value)
+            return code
+
+        def append(table: str, **values) -> None:
+            for column, value in values.items():
+                rows[table][column].append(value)
+
+        seen = set()
+        for path in manifest:
+            data = load_json_projected(path, MATCH_STORE_PROJECTION)
+            match_id = data["metadata"]["matchId"]
+            if match_id in seen:
+                continue
+            seen.add(match_id)
+            match = encode("match_ids", match_id)
+            info = data["info"]
+
+            # tourney annotations name both teams and the winner, the winner's side pins down the other
+            team_ids = data.get("team_ids") or []
+            winning_team_id = data.get("winning_team_id")
+            winning_side = next((team["teamId"] for team in info["teams"] if team.get("win")), None)
+            side_team_ids = {}
+            if winning_team_id and len(team_ids) == 2 and winning_side:
+                losing_team_id = team_ids[1] if team_ids[0] == winning_team_id else team_ids[0]
+                side_team_ids = {winning_side: winning_team_id, 300 - winning_side: losing_team_id}
+
+            append("matches", match=match, game_creation=info["gameCreation"], game_duration=info["gameDuration"],
+                   game_version=encode("game_versions", info.get("gameVersion")),
+                   blue_team_id=encode("team_ids", side_team_ids.get(100)), red_team_id=encode("team_ids", side_team_ids.get(200)),
+                   winning_team_id=encode("team_ids", winning_team_id))
+
+            for participant in info["participants"]:
+                append("participants", match=match, side=participant["teamId"], participant_id=participant["participantId"],
+                       puuid=encode("puuids", participant["puuid"]), champion=encode("champions", participant["championName"]),
+                       champion_id=participant["championId"], position=encode("positions", participant.get("teamPosition") or None),
+                       kills=participant["kills"], deaths=participant["deaths"], assists=participant["assists"],
+                       gold_earned=participant["goldEarned"], damage_to_champions=participant["totalDamageDealtToChampions"],
+                       vision_score=participant["visionScore"], cs=participant["totalMinionsKilled"] + participant["neutralMinionsKilled"],
+                       champ_level=participant["champLevel"], win=participant["win"])
+
+            for team in info["teams"]:
+                side = team["teamId"]
+                team_code = encode("team_ids", side_team_ids.get(side))
+                append("teams", match=match, side=side, team_id=team_code, win=team["win"])
+                for ban in team.get("bans", []):
+                    append("bans", match=match, side=side, team_id=team_code, pick_turn=ban["pickTurn"], champion_id=ban["championId"])
+                for objective, values in team.get("objectives", {}).items():
+                    append("objectives", match=match, side=side, team_id=team_code, objective=encode("objectives", objective),
+                           first=values["first"], kills=values["kills"])
+
+        # write everything next to the old build, then swap directories
+        tmp_dir = f"{self.store_dir}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        for table, schema in TABLE_SCHEMAS.items():
+            os.makedirs(os.path.join(tmp_dir, table))
+            for column, dtype in schema.items():
+                np.save(os.path.join(tmp_dir, table, f"{column}.npy"), np.asarray(rows[table][column], dtype=dtype))
+        with open(os.path.join(tmp_dir, DICTIONARIES_FILE_NAME), "w") as f:
+            json.dump(dictionaries, f, indent=4)
+        with open(os.path.join(tmp_dir, MANIFEST_FILE_NAME), "w") as f:
+            json.dump(manifest, f, indent=4)
+        shutil.rmtree(self.store_dir, ignore_errors=True)
+        os.replace(tmp_dir, self.store_dir)
+
+        logging.info(f"[ColumnarMatchStore] Ingested {len(seen)} matches into {self.store_dir}")
+        self.tables = {}
+        return len(seen)
+
+    def load(self) -> "ColumnarMatchStore":
+        """
+        [info] Memory-map every column file, building the store first if it is missing or stale
+        [return] self
+        """
+        if self.is_stale():
+            self.build()
+        self.tables = {
+            table: {column: np.load(os.path.join(self.store_dir, table, f"{column}.npy"), mmap_mode="r") for column in schema}
+            for table, schema in TABLE_SCHEMAS.items()
+        }
+        with open(os.path.join(self.store_dir, DICTIONARIES_FILE_NAME)) as f:
+            self.dictionaries = json.load(f)
+        self.codes = {name: {value: code for code, value in enumerate(values)} for name, values in self.dictionaries.items()}
+        return self
+
+    ###############
+    ### QUERIES ###
+    ###############
+    def table(self, table: str) -> dict:
+        """
+        [info] Columns of a table
+        [param] table: matches, participants, teams, bans or objectives
+        [return] Dictionary of column -> np.ndarray
+        """
+        if not self.tables:
+            self.load()
+        return self.tables[table]
+
+    def encode(self, dictionary: str, value) -> int:
+        """
+        [info] Code of a value in a dictionary-encoded column
+        [param] dictionary: Dictionary name (ex. puuids, champions, team_ids)
+        [param] value: Raw value (ex. a PUUID)
+        [return] Code, or UNKNOWN (-2) if the value never occurs (masks then match nothing)
+        """
+        if not self.tables:
+            self.load()
+        return self.codes[dictionary].get(value, UNKNOWN)
+
+    def decode(self, dictionary: str, codes) -> list:
+        """
+        [info] Values of dictionary codes
+        [param] dictionary: Dictionary name
+        [param] codes: Iterable of codes
+        [return] List of values (None for MISSING / UNKNOWN)
+        """
+        values = self.dictionaries[dictionary]
+        return [values[code] if code >= 0 else None for code in codes]
+
+    def _participant_mask(self, puuid: str = None, team_id: str = None, position: str = None) -> np.ndarray:
+        participants = self.table("participants")
+        mask = np.ones(len(participants["match"]), dtype=bool)
+        if puuid is not None:
+            mask &= participants["puuid"] == self.encode("puuids", puuid)
+        if position is not None:
+            mask &= participants["position"] == self.encode("positions", position)
+        if team_id is not None:
+            # a participant belongs to a team if the team played the participant's side of that match
+            matches = self.table("matches")
+            team_code = self.encode("team_ids", team_id)
+            side_team = np.where(participants["side"] == 100, matches["blue_team_id"][participants["match"]], matches["red_team_id"][participants["match"]])
+            mask &= side_team == team_code
+        return mask
+
+    def matches_for_team(self, team_id: str) -> list:
+        """
+        [info] Match IDs a tourney team played
+        [param] team_id: Team ID (ex. V8)
+        [return] List of match IDs
+        """
+        matches = self.table("matches")
+        team_code = self.encode("team_ids", team_id)
+        mask = (matches["blue_team_id"] == team_code) | (matches["red_team_id"] == team_code)
+        return self.decode("match_ids", matches["match"][mask])
+
+    def champion_stats(self, puuid: str = None, team_id: str = None, position: str = None) -> dict:
+        """
+        [info] Games and wins per champion (ex. a player's champion pool or a team's picks)
+        [param] puuid: Only this player (default: None)
+        [param] team_id: Only picks by this tourney team (default: None)
+        [param] position: Only this teamPosition, ex. JUNGLE (default: None)
+        [return] Dictionary of champion name -> (games, wins), most played first
+        """
+        participants = self.table("participants")
+        mask = self._participant_mask(puuid, team_id, position)
+        size = len(self.dictionaries["champions"])
+        games = np.bincount(participants["champion"][mask], minlength=size)
+        wins = np.bincount(participants["champion"][mask & participants["win"]], minlength=size)
+        order = np.argsort(-games, kind="stable")
+        return {self.dictionaries["champions"][code]: (int(games[code]), int(wins[code])) for code in order if games[code]}
+
+    def ban_counts(self, by_team_id: str = None, against_team_id: str = None) -> dict:
+        """
+        [info] Ban counts per champion key
+        [param] by_team_id: Only bans made by this tourney team (default: None)
+        [param] against_team_id: Only bans made against this tourney team (default: None)
+        [return] Dictionary of champion ID -> bans, most banned first (-1 = skipped ban)
+        """
+        bans = self.table("bans")
+        mask = np.ones(len(bans["match"]), dtype=bool)
+        if by_team_id is not None:
+            mask &= bans["team_id"] == self.encode("team_ids", by_team_id)
+        if against_team_id is not None:
+            matches = self.table("matches")
+            opponent = np.where(bans["side"] == 100, matches["red_team_id"][bans["match"]], matches["blue_team_id"][bans["match"]])
+            mask &= opponent == self.encode("team_ids", against_team_id)
+        champion_ids, counts = np.unique(bans["champion_id"][mask], return_counts=True)
+        order = np.argsort(-counts, kind="stable")
+        return {int(champion_ids[idx]): int(counts[idx]) for idx in order}
+
+    def player_averages(self, puuid: str) -> dict:
+        """
+        [info] Per-game averages of a player across stored matches
+        [param] puuid: Player's unique identifier
+        [return] Dictionary of games, winrate, kda and averages of kills / deaths / assists / cs / gold / damage / vision
+        """
+        participants = self.table("participants")
+        mask = self._participant_mask(puuid=puuid)
+        games = int(mask.sum())
+        if not games:
+            return {"games": 0}
+        sums = {column: int(participants[column][mask].sum()) for column in ("kills", "deaths", "assists", "cs", "gold_earned", "damage_to_champions", "vision_score")}
+        averages = {column: round(total / games, 2) for column, total in sums.items()}
+        averages["games"] = games
+        averages["winrate"] = round(float(participants["win"][mask].mean()) * 100, 2)
+        averages["kda"] = round((sums["kills"] + sums["assists"]) / max(sums["deaths"], 1), 2)
+        return averages
+
+
+##########################
+### SHARED MATCH STORE ###
+##########################
+_SHARED_MATCH_STORE = None
+_SHARED_MATCH_STORE_LOCK = threading.Lock()
+
+def get_match_store() -> ColumnarMatchStore:
+    """
+    [info] Process-wide columnar store over ../data/official_tourney_games (built / refreshed on first use)
+    [return] Shared, loaded ColumnarMatchStore instance
+    """
+    global _SHARED_MATCH_STORE
+    with _SHARED_MATCH_STORE_LOCK:
+        if _SHARED_MATCH_STORE is None:
+            _SHARED_MATCH_STORE = ColumnarMatchStore().load()
+        return _SHARED_MATCH_STORE
@@ -9,6 +9,8 @@ import requests
 from urllib.parse import urlencode
 import logging
 
+from .http_session import get_session_pool
+
 # setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -17,29 +19,63 @@ class APIObject:
     """
     [info] Represents an API request object with retry logic and rate limiting support
     """
-    def __init__(self, url: str, params: dict, callback, max_retries: int = 5) -> None:
+    def __init__(self, url: str, params: dict, callback, max_retries: int = 5, method: str = None, priority: str = None) -> None:
         """
         [info] Initialize API object with request parameters
         [param] url: API endpoint URL
         [param] params: Dictionary of query parameters
-        [param] callback: Callback function to handle response
+        [param] callback: Callback function to handle response (None when the result is consumed through a future)
         [param] max_retries: Maximum number of retry attempts (default: 5)
+        [param] method: Rate limit method path template (default: resolved from url by the rate limiter)
+        [param] priority: APIQueue priority class, interactive / roster_refresh / backfill (default: interactive)
         [return] None
         """
         self.url = url
         self.params = params
         self.callback = callback
         self.max_retries = max_retries
+        self.retry_attempts = max_retries   # remaining retries, decremented by APIQueue
+        self.retry_delay = None             # previous backoff delay (decorrelated jitter grows from it)
+        self.key_rotations = 0              # resends with another key after this one's key was retired (capped by APIQueue)
+        self.method = method
+        self.priority = priority
+        self.future = None                  # concurrent.futures.Future set by APIQueue.submit()
+        self.deadline = None                # monotonic time after which the request is dropped (APIQueue.submit timeout)
+        self.key = None                     # idempotency key in the DurableQueue (default: url + params)
         self.last_request_time = None
         # some sort of delay before adding back to queue?
 
+    def resolve(self, response) -> None:
+        """
+        [info] Hand a successful response to the future (if submitted) and the callback (if any)
+        [param] response: Response object
+        [return] None
+        """
+        if self.future is not None:
+            self.future.set_result(response)
+        if self.callback:
+            self.callback(response)
+
+    def fail(self, error: Exception = None) -> None:
+        """
+        [info] Finish a request that will not be retried (the callback is not called, same as before futures)
+        [param] error: Exception for the future (default: None, future resolves to None like the service wrappers)
+        [return] None
+        """
+        if self.future is None or self.future.done():
+            return
+        if error is not None:
+            self.future.set_exception(error)
+        else:
+            self.future.set_result(None)
+
     def make_request(self):
         """
         [info] Execute the API request with error handling
         [return] Response object or None if request fails
         """
         try:
-            response = requests.get(self.url, params=urlencode(self.params))
+            response = get_session_pool().get(self.url, params=urlencode(self.params))
             return response
             # response.status_code, response.json()
         except requests.RequestException as e:
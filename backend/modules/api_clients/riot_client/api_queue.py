@@ -1,62 +1,438 @@
 # data_models/api_queue.py
-from queue import Queue
+from queue import Queue, Empty
 import time
+import asyncio
 import logging
-from threading import Thread
+from concurrent.futures import Future, as_completed
+from threading import Thread, Event, Lock
+from urllib.parse import urlparse
+
+from .rate_limiter import get_rate_limiter, derive_method_template
+from .key_pool import get_key_pool, RETIRE_STATUS_CODES, MAX_KEY_ROTATIONS
+from .priority_lanes import PriorityLanes, DEFAULT_PRIORITY, PRIORITY_CLASSES
+from .durable_queue import request_key, STATUS_DONE, STATUS_LEASED
+from .retry_scheduler import get_retry_scheduler, RETRY_RATE_LIMITED
+from .api_object import APIObject
+from .services import update_sys_path
+update_sys_path()
+from config.config import get_riot_api_config
+from modules.utils.circuit_breaker import get_riot_circuit_breaker, CircuitOpenError
 
 logging.basicConfig(level=logging.INFO)
 
+IDLE_WAIT_TIMEOUT = 5.0     # max seconds the worker blocks on an empty queue before re-checking for shutdown
+RESERVATION_RECHECK = 0.05  # minimum wait when every due request is held back by another class's reserved budget
+
 class APIQueue:
     """
     [info] Queue manager for API requests with rate limiting and retry logic
+
+    Riot enforces limits per routing value, so requests are sharded by routing host
+    (americas.api.riotgames.com, na1.api.riotgames.com, ...). Each shard has its own intake queue,
+    priority lanes, rate limiter and worker thread, so a match download backlog on americas never
+    stalls summoner lookups on na1 and multi-region work uses every region's budget in parallel.
+
+    With a DurableQueue every request is also recorded in SQLite under an idempotent key, so a
+    crashed backfill continues with resume() instead of starting over.
     """
-    def __init__(self, rate_limit: int, interval: float) -> None:
+    def __init__(self, rate_limit: int, interval: float, rate_limiter=None, priority_classes: dict = None, durable_queue=None) -> None:
         """
-        [info] Initialize API queue with rate limiting parameters
+        [info] Initialize API queue with rate limiting parameters (shards are created on first use)
         [param] rate_limit: Maximum number of requests per interval
-        [param] interval: Time interval in seconds between requests
+        [param] interval: Time interval in seconds between requests (per routing host)
+        [param] rate_limiter: RateLimiter shared by every shard (default: shared key pool, per-key limiters of each routing value)
+        [param] priority_classes: Custom class weights / reserved shares for PriorityLanes (default: PRIORITY_CLASSES)
+        [param] durable_queue: DurableQueue persisting requests across restarts (default: None, in-memory only)
         [return] None
         """
-        self.queue = Queue()
         self.rate_limit = rate_limit
         self.interval = interval
-        self.last_request_time = time.time()
+        self.rate_limiter = rate_limiter
+        self.priority_classes = priority_classes if priority_classes else PRIORITY_CLASSES
+        self.durable_queue = durable_queue
+        self.shards = {}    # routing host -> RegionShard
+        self.lock = Lock()
+
+    def _shard(self, url: str):
+        """
+        [info] Shard owning a request URL's routing host (created and started on first use)
+        [param] url: Full request URL (ex. https://na1.api.riotgames.com/lol/summoner/v4/...)
+        [return] RegionShard
+        """
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            shard = self.shards.get(host)
+            if shard is None:
+                rate_limiter = self.rate_limiter if self.rate_limiter else get_rate_limiter(host)
+                key_pool = None if self.rate_limiter else get_key_pool()
+                shard = RegionShard(host, self.interval, rate_limiter, PriorityLanes(self.priority_classes), self.durable_queue, key_pool)
+                self.shards[host] = shard
+            return shard
+
+    def add_to_queue(self, api_object, delay: float = 0.0, priority: str = None) -> None:
+        """
+        [info] Add an API object to the processing queue of its routing host
+        [param] api_object: APIObject instance to be queued
+        [param] delay: Seconds to wait before the request becomes eligible (default: 0.0)
+        [param] priority: Priority class (interactive, roster_refresh, backfill) overriding api_object.priority
+        [return] None
+        """
+        if priority:
+            api_object.priority = priority
+        if not getattr(api_object, "priority", None):
+            api_object.priority = DEFAULT_PRIORITY
+        shard = self._shard(api_object.url)
+        shard.lanes.validate(api_object.priority)
+        if self.durable_queue and not self._record(api_object):
+            return
+        get_retry_scheduler().record_request()
+        shard.queue.put((time.monotonic() + delay, api_object))
+        logging.info(f"Added to queue: {api_object.url}")
+
+    def _record(self, api_object) -> bool:
+        """
+        [info] Record a request in the durable queue under its idempotency key
+        [param] api_object: APIObject instance being queued (api_object.key defaults to request_key(url, params))
+        [return] True if it should be queued in memory, False if it completed within done_ttl or is in flight elsewhere
+        """
+        if not api_object.key:
+            api_object.key = request_key(api_object.url, api_object.params)
+        if self.durable_queue.enqueue(api_object.key, api_object.url, api_object.params, api_object.method, api_object.priority, api_object.max_retries):
+            return True
+        status = self.durable_queue.status(api_object.key)
+        if status in (STATUS_DONE, STATUS_LEASED):
+            # idempotent: don't spend budget twice on a key that just completed (or is being sent), failed keys were reset to pending
+            logging.info(f"Already {status}, not queued: {api_object.key}")
+            if api_object.future is not None and api_object.future.set_running_or_notify_cancel():
+                api_object.fail()
+            return False
+        return True
+
+    def resume(self, make_callback=None, priority: str = None, api_key: str = None) -> list:
+        """
+        [info] Requeue every unfinished request of the durable queue (after a crash / restart)
+        [param] make_callback: Function (key, url, params) -> callback for each resumed request (default: None, futures only)
+        [param] priority: Priority class for resumed requests (default: the priority they were queued with)
+        [param] api_key: Riot API key re-added to requests that carried one (default: RIOT_API_KEY from config/api.env)
+        [return] List of futures, one per resumed request (use APIQueue.as_completed)
+        """
+        if not self.durable_queue:
+            return []
+        api_key = api_key if api_key else get_riot_api_config("RIOT_API_KEY")
+        futures = []
+        for row in self.durable_queue.unfinished():
+            params = dict(row["params"], api_key=api_key) if row["has_api_key"] else row["params"]
+            callback = make_callback(row["key"], row["url"], params) if make_callback else None
+            api_object = APIObject(row["url"], params, callback, max_retries=row["max_retries"], method=row["method"], priority=priority or row["priority"])
+            api_object.retry_attempts = row["retry_attempts"]
+            api_object.key = row["key"]
+            futures.append(self.submit(api_object))
+        logging.info(f"Resumed {len(futures)} unfinished requests from {self.durable_queue.db_path}")
+        return futures
+
+    def submit(self, api_object, delay: float = 0.0, priority: str = None, timeout: float = None) -> Future:
+        """
+        [info] Queue an API object and get a future for its response instead of (or on top of) a callback
+        [param] api_object: APIObject instance to be queued (callback may be None)
+        [param] delay: Seconds to wait before the request becomes eligible (default: 0.0)
+        [param] priority: Priority class (interactive, roster_refresh, backfill) overriding api_object.priority
+        [param] timeout: Seconds from now after which the request is dropped unsent and the future raises TimeoutError (default: None)
+        [return] concurrent.futures.Future resolving to the Response, or None once retries are exhausted
+        """
+        api_object.future = Future()
+        if timeout is not None:
+            api_object.deadline = time.monotonic() + timeout
+        self.add_to_queue(api_object, delay, priority)
+        return api_object.future
+
+    def submit_many(self, api_objects: list, priority: str = None, timeout: float = None) -> list:
+        """
+        [info] Queue a batch of API objects (ex. a roster's worth of lookups) and get one future per request
+        [param] api_objects: List of APIObject instances
+        [param] priority: Priority class applied to every request (default: each api_object.priority)
+        [param] timeout: Per-request deadline in seconds from now (default: None)
+        [return] List of futures in the same order as api_objects (use APIQueue.as_completed to consume as they land)
+        """
+        return [self.submit(api_object, priority=priority, timeout=timeout) for api_object in api_objects]
+
+    def submit_async(self, api_object, delay: float = 0.0, priority: str = None, timeout: float = None):
+        """
+        [info] submit() for asyncio callers (must be called from a running event loop)
+        [param] api_object: APIObject instance to be queued
+        [param] delay: Seconds to wait before the request becomes eligible (default: 0.0)
+        [param] priority: Priority class overriding api_object.priority
+        [param] timeout: Seconds from now after which the request is dropped unsent (default: None)
+        [return] asyncio.Future awaitable resolving to the Response (or None)
+        """
+        return asyncio.wrap_future(self.submit(api_object, delay, priority, timeout))
+
+    @staticmethod
+    def as_completed(futures: list, timeout: float = None):
+        """
+        [info] Iterate futures from submit() / submit_many() in completion order
+        [param] futures: Futures returned by submit()
+        [param] timeout: Max seconds to wait for all of them (default: None, no limit)
+        [return] Iterator of completed futures
+        """
+        return as_completed(futures, timeout=timeout)
+
+    def stop(self, timeout: float = None) -> None:
+        """
+        [info] Stop every shard's worker thread (pending requests are dropped)
+        [param] timeout: Max seconds to wait for each worker to exit (default: None, wait forever)
+        [return] None
+        """
+        with self.lock:
+            shards = list(self.shards.values())
+        for shard in shards:
+            shard.stop_event.set()
+            shard.queue.put(None)           # wake the worker if it is blocked on an empty queue
+        for shard in shards:
+            shard.processing_thread.join(timeout)
+
+    def stats(self) -> dict:
+        """
+        [info] Per-routing-host, per-priority-class queue depth and wait time metrics
+        [return] Dictionary of host -> class -> depth, dispatched, avg / p50 / p95 / max wait (see PriorityLanes.stats)
+        """
+        with self.lock:
+            shards = list(self.shards.values())
+        now = time.monotonic()
+        return {shard.host: shard.lanes.stats(now) for shard in shards}
+
+
+class RegionShard:
+    """
+    [info] Intake queue, priority lanes and worker thread for one routing host
+
+    New requests land on a thread-safe intake queue. The worker blocks on it with a timeout and
+    moves everything it receives onto per-priority deadline heaps (PriorityLanes), so it only wakes
+    up when there is new work or when the next scheduled request becomes due. Interactive lookups
+    are served ahead of roster refreshes and backfill downloads by weight, without starving them.
+    """
+    def __init__(self, host: str, interval: float, rate_limiter, lanes: PriorityLanes, durable_queue=None, key_pool=None) -> None:
+        """
+        [info] Initialize a shard and start its worker thread
+        [param] host: Routing host served by this shard (ex. americas.api.riotgames.com)
+        [param] interval: Time interval in seconds between requests
+        [param] rate_limiter: RateLimiter enforcing this routing value's app / method windows
+        [param] lanes: PriorityLanes holding this shard's scheduled requests
+        [param] durable_queue: DurableQueue tracking request state (default: None)
+        [param] key_pool: APIKeyPool routing keyed requests across API keys (default: None, use rate_limiter and the request's own key)
+        [return] None
+        """
+        self.host = host
+        self.queue = Queue()                # intake: (ready_time, api_object) from any thread
+        self.lanes = lanes                  # worker-owned per-priority deadline heaps
+        self.interval = interval
+        self.last_request_time = time.monotonic() - interval
+        self.rate_limiter = rate_limiter
+        self.durable_queue = durable_queue
+        self.key_pool = key_pool
+        self.stop_event = Event()
 
         # Create a thread to process the queue (background, runs process_queue())
-        self.processing_thread = Thread(target=self.process_queue)
+        self.processing_thread = Thread(target=self.process_queue, name=f"api-queue-{host}")
         self.processing_thread.daemon = True    # don't prevent program from exiting
         self.processing_thread.start()          # start the thread
 
-    def add_to_queue(self, api_object) -> None:
+    def _schedule(self, item) -> None:
         """
-        [info] Add an API object to the processing queue
-        [param] api_object: APIObject instance to be queued
+        [info] Move an intake item onto its priority lane
+        [param] item: (ready_time, api_object) tuple or None (wake-up sentinel)
         [return] None
         """
-        self.queue.put(api_object)
-        logging.info(f"Added to queue: {api_object.url}")
+        if item is None:
+            return
+        ready_time, api_object = item
+        self.lanes.push(api_object.priority, ready_time, api_object)
+
+    def _next_deadline(self) -> float:
+        """
+        [info] Earliest time a lane head may be dispatched (deadline and request interval)
+        [return] Monotonic timestamp or None if nothing is scheduled
+        """
+        ready_time = self.lanes.next_ready_time()
+        if ready_time is None:
+            return None
+        return max(ready_time, self.last_request_time + self.interval)
 
     def process_queue(self) -> None:
         """
         [info] Background thread function to process queued API requests with rate limiting
         [return] None
         """
-        while True:
-            if not self.queue.empty():
-                current_time = time.time()
-                if current_time - self.last_request_time >= self.interval:
-                    api_object = self.queue.get()
-                    response = api_object.make_request()
-                    self.last_request_time = current_time
-                    
-                    if response and response.status_code < 500:
-                        api_object.callback(response)
-                    else:
-                        if api_object.retry_attempts > 0:
-                            api_object.retry_attempts -= 1
-                            self.queue.put(api_object)
-                            logging.warning(f"Retrying: {api_object.url}")
-                        else:
-                            logging.error(f"Max retries reached for: {api_object.url}")
-            else:
-                time.sleep(1)
+        while not self.stop_event.is_set():
+            deadline = self._next_deadline()
+            now = time.monotonic()
+
+            if deadline is not None and deadline <= now:
+                api_object = self.lanes.pop_next(now, self._headroom())
+                if api_object is not None:
+                    try:
+                        self.dispatch(api_object)
+                    except Exception as e:
+                        # never let one bad request kill the shard's worker, fail just that request
+                        # (a durable lease it holds expires and the request is picked up by resume())
+                        logging.exception(f"Unexpected error dispatching {api_object.url}: {e}")
+                        api_object.fail(e)
+                    continue
+                # every due request is held back by another class's reserved budget share,
+                # headroom only grows once the limiter frees a slot, so sleep until then (new work still wakes us)
+                deadline = now + max(self._headroom_wait(), RESERVATION_RECHECK)
+
+            # block until new work arrives or the next scheduled request is due
+            timeout = IDLE_WAIT_TIMEOUT if deadline is None else deadline - now
+            try:
+                self._schedule(self.queue.get(timeout=timeout))
+            except Empty:
+                continue
+
+            # drain anything else that arrived while we were blocked
+            while True:
+                try:
+                    self._schedule(self.queue.get_nowait())
+                except Empty:
+                    break
+
+    def _headroom(self) -> float:
+        """
+        [info] App-level headroom budget reservations are checked against (best key when pooled)
+        [return] 0.0 - 1.0
+        """
+        return self.key_pool.headroom(self.host) if self.key_pool else self.rate_limiter.headroom()
+
+    def _headroom_wait(self) -> float:
+        """
+        [info] Seconds until the app-level headroom next grows (best key when pooled)
+        [return] Seconds
+        """
+        return self.key_pool.headroom_wait(self.host) if self.key_pool else self.rate_limiter.headroom_wait()
+
+    def _claim(self, api_object) -> bool:
+        """
+        [info] Check a popped request is still wanted (future not cancelled, deadline not passed)
+        [param] api_object: APIObject instance about to be sent
+        [return] True if the request should be sent
+        """
+        future = api_object.future
+        if future is not None and not future.running():
+            if not future.set_running_or_notify_cancel():
+                self._finish(api_object, None)  # cancelled by the caller while queued
+                return False
+        if api_object.deadline is not None and time.monotonic() > api_object.deadline:
+            logging.warning(f"Deadline exceeded, dropped: {api_object.url}")
+            api_object.fail(TimeoutError(f"Deadline exceeded before request was sent: {api_object.url}"))
+            self._finish(api_object, None)
+            return False
+        if self.durable_queue and api_object.key and not self.durable_queue.lease(api_object.key):
+            logging.info(f"Already handled, skipped: {api_object.key}")
+            api_object.fail()
+            return False
+        return True
+
+    def _finish(self, api_object, response) -> None:
+        """
+        [info] Record the final outcome of a request in the durable queue
+        [param] api_object: Finished APIObject
+        [param] response: Successful Response, or None if the request failed / was dropped
+        [return] None
+        """
+        if not (self.durable_queue and api_object.key):
+            return
+        if response is not None:
+            self.durable_queue.complete(api_object.key, response.status_code)
+        else:
+            self.durable_queue.fail(api_object.key)
+
+    def _requeue(self, api_object, delay: float) -> None:
+        """
+        [info] Schedule a retry / 429 requeue (persisting the remaining retries)
+        [param] api_object: APIObject to send again
+        [param] delay: Seconds until it becomes eligible
+        [return] None
+        """
+        if self.durable_queue and api_object.key:
+            self.durable_queue.release(api_object.key, api_object.retry_attempts)
+        self._schedule((time.monotonic() + delay, api_object))
+
+    def dispatch(self, api_object) -> None:
+        """
+        [info] Execute a single API request and handle its response / retry
+        [param] api_object: APIObject instance to execute
+        [return] None
+        """
+        if not self._claim(api_object):
+            return
+        if not api_object.method:
+            # unlisted endpoints get a template derived from the path, so limits learned from headers apply to it
+            api_object.method = self.rate_limiter.resolve_method(api_object.url) or derive_method_template(api_object.url)
+        breaker = get_riot_circuit_breaker(self.host, api_object.method)
+        if not breaker.allow():
+            # endpoint degraded: fail fast so the worker moves on, durable requests stay pending for resume()
+            logging.warning(f"Circuit open, failed fast: {api_object.url}")
+            if self.durable_queue and api_object.key:
+                self.durable_queue.release(api_object.key, api_object.retry_attempts)
+            api_object.fail(CircuitOpenError(breaker.name, breaker.retry_after()))
+            return
+        api_key = None
+        if self.key_pool and "api_key" in (api_object.params or {}):
+            # keyed Riot call: send it with the pool key that has the most headroom (waits for its capacity)
+            api_key = self.key_pool.acquire(self.host, api_object.method)
+            api_object.params = dict(api_object.params, api_key=api_key)
+        else:
+            self.rate_limiter.acquire(api_object.method)    # wait for app + method window capacity
+        self.last_request_time = time.monotonic()
+        response = api_object.make_request()
+        retry_scheduler = get_retry_scheduler()
+        hold = 0.0
+        if response is not None and api_key:
+            hold = self.key_pool.observe_response(api_key, self.host, api_object.method, response.status_code, response.headers)
+        elif response is not None:
+            hold = self.rate_limiter.observe_response(api_object.method, response.status_code, response.headers)
+
+        if response is not None and response.status_code < 400:
+            breaker.record_success()
+            self._finish(api_object, response)
+            try:
+                api_object.resolve(response)
+            except Exception as e:
+                # a failing callback is the caller's bug, the request itself succeeded
+                logging.exception(f"Callback failed for {api_object.url}: {e}")
+            return
+
+        if (api_key and response is not None and response.status_code in RETIRE_STATUS_CODES and self.key_pool.is_retired(api_key)
+                and self.key_pool.active_keys() and api_object.key_rotations < MAX_KEY_ROTATIONS):
+            # key retired by the pool: resend right away with the next key, without spending a retry (capped per request)
+            api_object.key_rotations += 1
+            breaker.release_trial()     # not an endpoint health signal, free a half-open trial slot
+            self._requeue(api_object, 0.0)
+            logging.warning(f"API key rejected ({response.status_code}), requeued with another key: {api_object.url}")
+            return
+
+        retry_kind = retry_scheduler.classify(response.status_code if response is not None else None)
+        if retry_kind is None:
+            breaker.record_success()    # endpoint answered, the request itself is bad
+        elif retry_kind != RETRY_RATE_LIMITED:
+            breaker.record_failure()    # 5XX / connection error counts towards opening the circuit
+        if retry_kind == RETRY_RATE_LIMITED:
+            # rate limited: requeue without spending a retry, limiter holds the scope until Retry-After elapses (+ jitter)
+            breaker.release_trial()     # not an endpoint health signal, free a half-open trial slot
+            delay = retry_scheduler.next_delay(retry_kind, retry_after=hold)
+            self._requeue(api_object, delay)
+            logging.warning(f"Rate limited, requeued in {delay:.2f}s: {api_object.url}")
+            return
+        if retry_kind is None:
+            logging.error(f"Request failed ({response.status_code}), not retryable: {api_object.url}")
+        elif api_object.retry_attempts <= 0:
+            logging.error(f"Max retries reached for: {api_object.url}")
+        else:
+            api_object.retry_delay = retry_scheduler.next_delay(retry_kind, api_object.retry_delay)
+            if api_object.retry_delay is not None:
+                api_object.retry_attempts -= 1
+                # parked on the lane heap until its jittered ready time, the worker keeps serving other requests
+                self._requeue(api_object, api_object.retry_delay)
+                logging.warning(f"Retrying ({retry_kind}) in {api_object.retry_delay:.2f}s: {api_object.url}")
+                return
+        self._finish(api_object, None)
+        api_object.fail()
@@ -0,0 +1,370 @@
+# api_clients/riot_client/async_client.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import asyncio
+import logging
+import aiohttp
+
+# local imports
+from .services import update_sys_path
+update_sys_path()
+from config.config import get_riot_api_config
+from modules.api_clients.riot_client.key_pool import get_key_pool
+from modules.api_clients.riot_client.single_flight import AsyncSingleFlight
+from modules.api_clients.riot_client.services.match_v5 import IncompleteMatchListError
+from modules.api_clients.riot_client.riot_request import RiotRetryPolicy
+from modules.utils.time_utils import get_current_epoch_timestamp, get_epoch_timestamp, get_time_windows
+
+# access API Environment Variables
+DEFAULT_REGION_CODE = get_riot_api_config("DEFAULT_REGION_CODE", "americas")             # americas
+DEFAULT_REGION_EXECUTION = get_riot_api_config("DEFAULT_REGION_EXECUTION", "na1")   # NA1
+
+DEFAULT_MAX_CONCURRENCY = 10     # in-flight requests per routing region
+DEFAULT_POOL_SIZE = 50           # total keep-alive connections across all routing hosts
+MAX_MATCH_IDS_PER_PAGE = 100     # MATCH_V5 by-puuid/ids hard cap on count
+
+
+#########################
+### ASYNC_RIOT_CLIENT ###
+#########################
+class AsyncRiotClient:
+    """
+    [info] asyncio counterpart of the riot_client/services wrappers
+
+    All coroutines share one aiohttp connection pool, the shared APIKeyPool (per-key RateLimiters)
+    and one semaphore per routing region, so fan-outs (ex. 100 match IDs x 80 players) run concurrently without exceeding
+    the key budget. Coroutines return the same (status_code, json) tuples as the sync wrappers.
+
+    Usage:
+        async with AsyncRiotClient() as client:
+            results = await client.get_matches_by_ids(match_ids)
+    """
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, pool_size: int = DEFAULT_POOL_SIZE, rate_limiter=None, base_url: str = None, api_key: str = None) -> None:
+        """
+        [info] Initialize async client settings (session is opened in __aenter__ / open())
+        [param] max_concurrency: Max in-flight requests per routing region (default: 10)
+        [param] pool_size: Max keep-alive connections in the shared pool (default: 50)
+        [param] rate_limiter: RateLimiter to admit calls through (default: the key pool's limiters of each routing value)
+        [param] base_url: Override for https://{region}.api.riotgames.com (default: RIOT_API_BASE_URL in config/api.env if set, ex. local stub server http://127.0.0.1:8787)
+        [param] api_key: Riot API key pinned for every call (default: None, route each call through the shared key pool)
+        [return] None
+        """
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter
+        base_url = base_url or get_riot_api_config("RIOT_API_BASE_URL")
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.api_key = api_key
+        self.key_pool = get_key_pool()
+        self.use_key_pool = not (api_key or rate_limiter)  # a pinned key / injected limiter bypasses the pool
+        self.session = None
+        self.semaphores = {}    # region -> asyncio.Semaphore
+        self.single_flight = AsyncSingleFlight()    # identical in-flight requests share one call
+
+    async def open(self) -> None:
+        """
+        [info] Open the shared aiohttp session / connection pool
+        [return] None
+        """
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self) -> None:
+        """
+        [info] Close the shared session and all pooled connections
+        [return] None
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _semaphore(self, region: str) -> asyncio.Semaphore:
+        """
+        [info] Concurrency cap for a routing region (created on first use)
+        [param] region: Routing value (ex. americas, na1)
+        [return] asyncio.Semaphore
+        """
+        region = region.lower()
+        if region not in self.semaphores:
+            self.semaphores[region] = asyncio.Semaphore(self.max_concurrency)
+        return self.semaphores[region]
+
+    def _rate_limiter(self, region: str, api_key: str):
+        """
+        [info] Limiter a routing region's calls with a given key are admitted through
+        [param] region: Routing value (ex. americas, na1)
+        [param] api_key: API key the call is sent with
+        [return] Injected RateLimiter or the key pool's limiter of that key and routing value
+        """
+        return self.rate_limiter if self.rate_limiter else self.key_pool.rate_limiter(api_key, region)
+
+    async def _acquire(self, region: str, method: str) -> str:
+        """
+        [info] Wait for rate limit capacity and pick the key a call is sent with
+        [param] region: Routing value (ex. americas, na1)
+        [param] method: Rate limit method path template
+        [return] API key (the pinned key, or the pool key with the most headroom)
+        """
+        if self.use_key_pool:
+            return await self.key_pool.async_acquire(region, method)
+        api_key = self.api_key if self.api_key else self.key_pool.primary
+        await self._rate_limiter(region, api_key).async_acquire(method)
+        return api_key
+
+    def _observe(self, api_key: str, region: str, method: str, response) -> float:
+        """
+        [info] Sync the limiter of the key a call was sent with (the pool also retires keys on 401 / repeated 403)
+        [param] api_key: API key the call was sent with
+        [param] region: Routing value (ex. americas, na1)
+        [param] method: Rate limit method path template
+        [param] response: aiohttp response
+        [return] Seconds the limiter holds the call's scope
+        """
+        if self.use_key_pool:
+            return self.key_pool.observe_response(api_key, region, method, response.status, response.headers)
+        return self._rate_limiter(region, api_key).observe_response(method, response.status, response.headers)
+
+    def _url(self, region: str, path: str) -> str:
+        """
+        [info] Build the request URL for a routing region (or the stub server)
+        [param] region: Routing value (ex. americas, na1)
+        [param] path: Request path (ex. /lol/match/v5/matches/NA1_123)
+        [return] Full request URL
+        """
+        if self.base_url:
+            return f"{self.base_url}{path}"
+        return f"https://{region}.api.riotgames.com{path}"
+
+    async def _get(self, region: str, path: str, method: str, params: dict = None, caller: str = "") -> tuple:
+        """
+        [info] Coalesced GET, concurrent callers of the same path + params await one request
+        [param] region: Routing value (ex. americas, na1)
+        [param] path: Concrete request path
+        [param] method: Rate limit method path template
+        [param] params: Query parameters (api_key is added automatically)
+        [param] caller: Name of calling coroutine for log messages
+        [return] Tuple of (status_code, json) or None if failed
+        """
+        key = (region.lower(), path, tuple(sorted(params.items())) if params else ())
+        return await self.single_flight.do(key, lambda: self._fetch(region, path, method, params, caller))
+
+    async def _fetch(self, region: str, path: str, method: str, params: dict = None, caller: str = "") -> tuple:
+        """
+        [info] Rate limited GET with 5XX / 429 retries, bounded by the region semaphore and the endpoint's circuit breaker
+        [param] region: Routing value (ex. americas, na1)
+        [param] path: Concrete request path
+        [param] method: Rate limit method path template
+        [param] params: Query parameters (api_key is added automatically)
+        [param] caller: Name of calling coroutine for log messages
+        [return] Tuple of (status_code, json) or None if failed
+        """
+        if self.session is None:
+            await self.open()
+
+        query = dict(params) if params else {}
+        url = self._url(region, path)
+
+        policy = RiotRetryPolicy(region, method, caller)
+        async with self._semaphore(region):
+            while policy.allow():                                    # gives up once retries are exhausted or the circuit opens
+                api_key = await self._acquire(region, method)        # wait for app + method rate limit capacity
+                query['api_key'] = api_key
+                status, hold = None, 0.0
+                try:
+                    async with self.session.get(url, params=query) as response:
+                        hold = self._observe(api_key, region, method, response)   # sync the key's buckets w/ Riot's rate limit headers
+                        if response.status < 400:
+                            policy.succeeded()
+                            return response.status, await response.json()
+                        status = response.status
+                except aiohttp.ClientError as e:
+                    logging.warning(f"[{caller}] Connection error: {e}")
+
+                can_rotate_key = self.use_key_pool and self.key_pool.is_retired(api_key) and bool(self.key_pool.active_keys())
+                delay = policy.failed(status, hold, can_rotate_key)
+                if delay is None:
+                    return None
+                await asyncio.sleep(delay)
+        return None
+
+    ##################
+    ### ACCOUNT_V1 ###
+    ##################
+    async def get_account_by_riot_id(self, game_name: str, tag_line: str, region: str = DEFAULT_REGION_CODE) -> tuple:
+        """
+        [info] Access player PUUID by their Riot ID from ACCOUNT_V1 API Portal
+        [param] game_name: Player's Riot game name (without #tag)
+        [param] tag_line: Player's Riot tag line (after #)
+        [param] region: Region code for API request (default: configured region)
+        [return] Tuple of (status_code, account_json) containing PUUID, or None if failed
+        """
+        path = f"/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
+        return await self._get(region, path, "/riot/account/v1/accounts/by-riot-id/{gameName}/{tagLine}", caller="get_account_by_riot_id")
+
+    async def get_account_by_puuid(self, puuid: str, region: str = DEFAULT_REGION_CODE) -> tuple:
+        """
+        [info] Access player IGN & Tag by their PUUID from ACCOUNT_V1 API Portal
+        [param] puuid: Player's unique identifier to lookup IGN and tag
+        [param] region: Region code for API request (default: configured region)
+        [return] Tuple of (status_code, account_json) containing IGN & Tag, or None if failed
+        """
+        path = f"/riot/account/v1/accounts/by-puuid/{puuid}"
+        return await self._get(region, path, "/riot/account/v1/accounts/by-puuid/{puuid}", caller="get_account_by_puuid")
+
+    ###################
+    ### SUMMONER_V4 ###
+    ###################
+    async def get_summoner_info_by_puuid(self, puuid: str, region: str = DEFAULT_REGION_EXECUTION) -> tuple:
+        """
+        [info] Access accountID, summonerID, summonerLevel by their PUUID from SUMMONER_V4 API Portal
+        [param] puuid: Player's unique identifier to lookup summoner info
+        [param] region: Region execution code for API request (default: configured region)
+        [return] Tuple of (status_code, summoner_json) containing IDs & level, or None if failed
+        """
+        path = f"/lol/summoner/v4/summoners/by-puuid/{puuid}"
+        return await self._get(region, path, "/lol/summoner/v4/summoners/by-puuid/{encryptedPUUID}", caller="get_summoner_info_by_puuid")
+
+    ################
+    ### MATCH_V5 ###
+    ################
+    async def get_match_ids_by_puuid(self, puuid: str, startTime: int = None, endTime: int = None, queue: int = None, start: int = None, count: int = None, region: str = DEFAULT_REGION_CODE) -> tuple:
+        """
+        [info] Access match IDs by player PUUID from MATCH_V5 API Portal (same defaults as MATCH_V5)
+        [param] puuid: Player's unique identifier to lookup match history
+        [param] startTime: Epoch timestamp in seconds (default: June 17th, 2021)
+        [param] endTime: Epoch timestamp in seconds (default: current time)
+        [param] queue: Filter by queue ID (default: 420, ranked solo / duo)
+        [param] start: Start index for pagination (default: 0)
+        [param] count: Number of matches to return (default: 20, max: 100)
+        [param] region: Region code for API request (default: configured region)
+        [return] Tuple of (status_code, match_id_list) or None if failed
+        """
+        params = {
+            'startTime': startTime if startTime else get_epoch_timestamp(6, 17, 2021),
+            'endTime': endTime if endTime else get_current_epoch_timestamp(),
+            'queue': queue if queue is not None else 420,
+            'start': start if start else 0,
+            'count': count if count else 20,
+        }
+        path = f"/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        return await self._get(region, path, "/lol/match/v5/matches/by-puuid/{puuid}/ids", params=params, caller="get_match_ids_by_puuid")
+
+    async def get_match_by_id(self, match_id: str, region: str = DEFAULT_REGION_CODE) -> tuple:
+        """
+        [info] Access detailed match data by match ID from MATCH_V5 API Portal
+        [param] match_id: Unique match identifier (string)
+        [param] region: Region code for API request (default: configured region)
+        [return] Tuple of (status_code, match_json) containing MatchDTO, or None if failed
+        """
+        path = f"/lol/match/v5/matches/{match_id}"
+        return await self._get(region, path, "/lol/match/v5/matches/{matchId}", caller="get_match_by_id")
+
+    async def iter_match_ids_by_puuid(self, puuid: str, startTime: int = None, endTime: int = None, queue: int = None, page_size: int = MAX_MATCH_IDS_PER_PAGE, window_days: int = None, stop_when=None, max_matches: int = None, prefetch: bool = True, raise_on_error: bool = False, region: str = DEFAULT_REGION_CODE):
+        """
+        [info] Async iterator over a player's match history (newest first), same paging as MATCH_V5.iter_match_ids_by_puuid
+        [param] puuid: Player's unique identifier to lookup match history
+        [param] startTime: Epoch timestamp in seconds, oldest match to include (default: June 17th, 2021)
+        [param] endTime: Epoch timestamp in seconds, newest match to include (default: current time)
+        [param] queue: Filter by queue ID (default: 420, ranked solo / duo)
+        [param] page_size: Match IDs requested per page (default: 100, max: 100)
+        [param] window_days: Also split [startTime, endTime] into windows of this many days (default: None, one window)
+        [param] stop_when: Predicate called with each match ID, iteration stops before the first ID it returns True for
+        [param] max_matches: Stop after yielding this many match IDs (default: None, no limit)
+        [param] prefetch: Request the next page while the caller is still consuming the current one (default: True)
+        [param] raise_on_error: Raise IncompleteMatchListError instead of stopping quietly when a page request fails (default: False)
+        [param] region: Region code for API request (default: configured region)
+        [return] Async generator of match IDs (strings), stops early (or raises, see raise_on_error) if a page request fails
+
+        Usage:
+            async for match_id in client.iter_match_ids_by_puuid(puuid, startTime=split_start):
+                match = await client.get_match_by_id(match_id)
+        """
+        if not startTime:
+            startTime = get_epoch_timestamp(6, 17, 2021)
+
+        if not endTime:
+            endTime = get_current_epoch_timestamp()
+
+        page_size = min(page_size, MAX_MATCH_IDS_PER_PAGE)
+        windows = iter(get_time_windows(startTime, endTime, window_days * 24 * 60 * 60 if window_days else None))
+
+        def fetch_page(window: tuple, start: int):
+            return asyncio.ensure_future(self.get_match_ids_by_puuid(puuid, startTime=window[0], endTime=window[1], queue=queue, start=start, count=page_size, region=region))
+
+        window, page_start = next(windows, None), 0
+        if window is None:                              # empty range (startTime >= endTime)
+            return
+        pending = fetch_page(window, page_start)
+        yielded = 0
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                if not page:
+                    if raise_on_error:
+                        raise IncompleteMatchListError(f"Failed to fetch match ID page (window {window}, start {page_start}) for {puuid}")
+                    logging.warning(f"[iter_match_ids_by_puuid] Stopping early, failed to fetch page for {puuid}")
+                    return
+                match_ids = page[1]
+
+                # a full page means more IDs in this window, a short page means move on to the next window
+                next_page = None
+                if len(match_ids) >= page_size:
+                    page_start += page_size
+                    next_page = (window, page_start)
+                else:
+                    window, page_start = next(windows, None), 0
+                    if window is not None:
+                        next_page = (window, page_start)
+
+                if next_page and prefetch:
+                    pending = fetch_page(*next_page)
+
+                for match_id in match_ids:
+                    if stop_when and stop_when(match_id):
+                        return
+                    yield match_id
+                    yielded += 1
+                    if max_matches and yielded >= max_matches:
+                        return
+
+                if next_page and not prefetch:
+                    pending = fetch_page(*next_page)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    ###############
+    ### FAN-OUT ###
+    ###############
+    async def get_matches_by_ids(self, match_ids: list, region: str = DEFAULT_REGION_CODE) -> dict:
+        """
+        [info] Download many MatchDTOs concurrently (bounded by the region semaphore + rate limiter)
+        [param] match_ids: List of match IDs
+        [param] region: Region code for API request (default: configured region)
+        [return] Dictionary of match_id -> (status_code, match_json) or None
+        """
+        results = await asyncio.gather(*(self.get_match_by_id(match_id, region) for match_id in match_ids))
+        return dict(zip(match_ids, results))
+
+    async def get_match_ids_for_players(self, puuids: list, **kwargs) -> dict:
+        """
+        [info] List match IDs for many players concurrently
+        [param] puuids: List of player PUUIDs
+        [param] kwargs: Filters forwarded to get_match_ids_by_puuid (startTime, queue, count, ...)
+        [return] Dictionary of puuid -> (status_code, match_id_list) or None
+        """
+        results = await asyncio.gather(*(self.get_match_ids_by_puuid(puuid, **kwargs) for puuid in puuids))
+        return dict(zip(puuids, results))
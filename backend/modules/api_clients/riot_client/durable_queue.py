@@ -0,0 +1,231 @@
+# api_clients/riot_client/durable_queue.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import os
+import json
+import time
+import sqlite3
+import threading
+from urllib.parse import urlencode
+
+DURABLE_QUEUE_FILE = "../data/cache/api_queue.sqlite3"     # relative to backend/
+DEFAULT_LEASE_SECONDS = 120.0                              # in-flight requests older than this are resumed after a crash
+
+# request lifecycle: pending -> leased (in flight) -> done | failed, leased rows with an expired lease count as pending
+STATUS_PENDING = "pending"
+STATUS_LEASED = "leased"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    key             TEXT PRIMARY KEY,
+    url             TEXT NOT NULL,
+    params          TEXT NOT NULL,
+    has_api_key     INTEGER NOT NULL,
+    method          TEXT,
+    priority        TEXT,
+    max_retries     INTEGER NOT NULL,
+    retry_attempts  INTEGER NOT NULL,
+    status          TEXT NOT NULL,
+    lease_until     REAL,
+    status_code     INTEGER,
+    created_at      REAL NOT NULL,
+    updated_at      REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS requests_status ON requests (status, created_at);
+"""
+
+
+def request_key(url: str, params: dict) -> str:
+    """
+    [info] Idempotency key of a request (url + sorted query params, api_key excluded)
+    [param] url: Request URL
+    [param] params: Query parameters
+    [return] Key string (ex. https://americas.api.riotgames.com/lol/match/v5/matches/NA1_123)
+    """
+    query = urlencode(sorted((name, value) for name, value in (params or {}).items() if name != "api_key"))
+    return f"{url}?{query}" if query else url
+
+
+class DurableQueue:
+    """
+    [info] Crash-safe request log backing APIQueue (embedded SQLite file in WAL mode)
+
+    Every queued request is recorded under an idempotent key together with its retry state. A request
+    is leased while in flight and marked done / failed once it finishes, so after a crash resume()
+    hands back exactly the pending requests (and in-flight ones whose lease expired) instead of the
+    whole backfill. Queuing a failed key again retries it, and with done_ttl a key that completed
+    recently is not sent again (ex. a restarted backfill script re-submitting its whole work list).
+    """
+    def __init__(self, db_path: str = DURABLE_QUEUE_FILE, lease_seconds: float = DEFAULT_LEASE_SECONDS, done_ttl: float = 0.0) -> None:
+        """
+        [info] Open (or create) the queue database
+        [param] db_path: SQLite file path (default: ../data/cache/api_queue.sqlite3)
+        [param] lease_seconds: Seconds an in-flight request stays leased before it may be resumed (default: 120.0)
+        [param] done_ttl: Seconds a completed key keeps suppressing new submits of the same request (default: 0.0, never suppressed)
+        [return] None
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.done_ttl = done_ttl
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """
+        [info] Close the database connection
+        [return] None
+        """
+        with self.lock:
+            self.connection.close()
+
+    def enqueue(self, key: str, url: str, params: dict, method: str = None, priority: str = None, max_retries: int = 5) -> bool:
+        """
+        [info] Record a request unless its key is already queued, in flight or completed within done_ttl
+        [param] key: Idempotency key (see request_key)
+        [param] url: Request URL
+        [param] params: Query parameters (api_key is not persisted, it is re-added on resume)
+        [param] method: Rate limit method path template
+        [param] priority: APIQueue priority class
+        [param] max_retries: Retry budget of the request
+        [return] True if newly recorded (or a finished key was reset to pending), False if the key is queued, in flight or recently done
+        """
+        now = time.time()
+        stored_params = json.dumps({name: value for name, value in (params or {}).items() if name != "api_key"})
+        has_api_key = int("api_key" in (params or {}))
+        with self.lock:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO requests (key, url, params, has_api_key, method, priority, max_retries, retry_attempts, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, stored_params, has_api_key, method, priority, max_retries, max_retries, STATUS_PENDING, now, now),
+            )
+            if cursor.rowcount == 1:
+                return True
+            # finished keys start over with a fresh retry budget: failed ones always, done ones once done_ttl has passed
+            cursor = self.connection.execute(
+                "UPDATE requests SET url = ?, params = ?, has_api_key = ?, method = ?, priority = ?, max_retries = ?, retry_attempts = ?, "
+                "status = ?, lease_until = NULL, status_code = NULL, updated_at = ? "
+                "WHERE key = ? AND (status = ? OR (status = ? AND updated_at <= ?))",
+                (url, stored_params, has_api_key, method, priority, max_retries, max_retries, STATUS_PENDING, now, key, STATUS_FAILED, STATUS_DONE, now - self.done_ttl),
+            )
+            return cursor.rowcount == 1
+
+    def status(self, key: str) -> str:
+        """
+        [info] Lifecycle status of a request
+        [param] key: Idempotency key
+        [return] pending / leased / done / failed (an expired lease reports pending), or None if unknown
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT status, lease_until FROM requests WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None
+        status, lease_until = row
+        if status == STATUS_LEASED and lease_until < time.time():
+            return STATUS_PENDING
+        return status
+
+    def lease(self, key: str) -> bool:
+        """
+        [info] Atomically claim a request before sending it
+        [param] key: Idempotency key
+        [return] True if claimed, False if it is finished or leased by someone else
+        """
+        now = time.time()
+        with self.lock:
+            cursor = self.connection.execute(
+                "UPDATE requests SET status = ?, lease_until = ?, updated_at = ? "
+                "WHERE key = ? AND (status = ? OR (status = ? AND lease_until < ?))",
+                (STATUS_LEASED, now + self.lease_seconds, now, key, STATUS_PENDING, STATUS_LEASED, now),
+            )
+            return cursor.rowcount == 1
+
+    def release(self, key: str, retry_attempts: int) -> None:
+        """
+        [info] Put a leased request back to pending (retry / 429 requeue) with its remaining retries
+        [param] key: Idempotency key
+        [param] retry_attempts: Remaining retries
+        [return] None
+        """
+        with self.lock:
+            self.connection.execute(
+                "UPDATE requests SET status = ?, lease_until = NULL, retry_attempts = ?, updated_at = ? WHERE key = ?",
+                (STATUS_PENDING, retry_attempts, time.time(), key),
+            )
+
+    def complete(self, key: str, status_code: int) -> None:
+        """
+        [info] Mark a request done
+        [param] key: Idempotency key
+        [param] status_code: HTTP status of the final response
+        [return] None
+        """
+        self._finish(key, STATUS_DONE, status_code)
+
+    def fail(self, key: str, status_code: int = None) -> None:
+        """
+        [info] Mark a request failed (retries exhausted, deadline passed or cancelled)
+        [param] key: Idempotency key
+        [param] status_code: HTTP status of the last response if any
+        [return] None
+        """
+        self._finish(key, STATUS_FAILED, status_code)
+
+    def _finish(self, key: str, status: str, status_code: int) -> None:
+        with self.lock:
+            self.connection.execute(
+                "UPDATE requests SET status = ?, lease_until = NULL, status_code = ?, updated_at = ? WHERE key = ?",
+                (status, status_code, time.time(), key),
+            )
+
+    def unfinished(self) -> list:
+        """
+        [info] Requests to resume after a restart (pending, or leased with an expired lease), oldest first
+        [return] List of dictionaries with key, url, params, has_api_key, method, priority, max_retries, retry_attempts
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT key, url, params, has_api_key, method, priority, max_retries, retry_attempts FROM requests "
+                "WHERE status = ? OR (status = ? AND lease_until < ?) ORDER BY created_at",
+                (STATUS_PENDING, STATUS_LEASED, time.time()),
+            ).fetchall()
+        return [
+            {
+                "key": key, "url": url, "params": json.loads(params), "has_api_key": bool(has_api_key), "method": method,
+                "priority": priority, "max_retries": max_retries, "retry_attempts": retry_attempts,
+            }
+            for key, url, params, has_api_key, method, priority, max_retries, retry_attempts in rows
+        ]
+
+    def purge(self, older_than: float = 7 * 24 * 60 * 60) -> int:
+        """
+        [info] Delete finished requests (their keys can then be queued again)
+        [param] older_than: Only purge requests finished more than this many seconds ago (default: 7 days)
+        [return] Number of deleted rows
+        """
+        with self.lock:
+            cursor = self.connection.execute(
+                "DELETE FROM requests WHERE status IN (?, ?) AND updated_at < ?",
+                (STATUS_DONE, STATUS_FAILED, time.time() - older_than),
+            )
+            return cursor.rowcount
+
+    def stats(self) -> dict:
+        """
+        [info] Request counts per status
+        [return] Dictionary of status -> count
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT status, COUNT(*) FROM requests GROUP BY status").fetchall()
+        counts = {STATUS_PENDING: 0, STATUS_LEASED: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+        counts.update(dict(rows))
+        return counts
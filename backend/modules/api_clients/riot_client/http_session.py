@@ -0,0 +1,142 @@
+# api_clients/riot_client/http_session.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import threading
+from urllib.parse import urlsplit, urlunsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# local imports
+from .services import update_sys_path
+update_sys_path()
+from config.config import get_riot_api_config
+
+# pool settings (optional overrides in config/api.env)
+DEFAULT_POOL_SIZE = 10              # keep-alive connections per routing host (ex. americas, na1)
+DEFAULT_CONNECT_RETRIES = 3         # transport-level retries (connection resets / refused connections)
+DEFAULT_BACKOFF_FACTOR = 0.5        # seconds, doubled per transport retry
+RIOT_API_HOST_SUFFIX = ".api.riotgames.com"
+
+
+class RiotSessionPool:
+    """
+    [info] One keep-alive requests.Session per routing host, shared by every Riot API caller
+
+    Each session mounts an HTTPAdapter sized to `pool_size`, so repeated calls to
+    americas.api.riotgames.com / na1.api.riotgames.com reuse open TCP + TLS connections
+    instead of handshaking on every request.
+    """
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, connect_retries: int = DEFAULT_CONNECT_RETRIES, backoff_factor: float = DEFAULT_BACKOFF_FACTOR, base_url: str = None) -> None:
+        """
+        [info] Initialize an empty pool of per-host sessions
+        [param] pool_size: Max keep-alive connections kept open per routing host (default: 10)
+        [param] connect_retries: Transport-level retries for connection errors (default: 3)
+        [param] backoff_factor: Backoff factor between transport retries in seconds (default: 0.5)
+        [param] base_url: Send every *.api.riotgames.com request here instead (ex. local stub server http://127.0.0.1:8787)
+        [return] None
+        """
+        self.pool_size = pool_size
+        self.connect_retries = connect_retries
+        self.backoff_factor = backoff_factor
+        self.base_url = urlsplit(base_url.rstrip("/")) if base_url else None
+        self.sessions = {}      # host -> requests.Session
+        self.lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        """
+        [info] Create a session with a pooled, retrying HTTPAdapter
+        [return] requests.Session
+        """
+        # only transport failures are retried here, HTTP status handling (429 / 5XX) stays with the callers
+        retry = Retry(
+            total=self.connect_retries,
+            connect=self.connect_retries,
+            read=0,
+            status=0,
+            backoff_factor=self.backoff_factor,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry, pool_block=False)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        [info] Session for the routing host of a request URL (created on first use)
+        [param] url: Full request URL or bare host (ex. https://americas.api.riotgames.com/riot/...)
+        [return] requests.Session bound to that host's connection pool
+        """
+        host = urlsplit(url).netloc or url
+        session = self.sessions.get(host)
+        if session is None:
+            with self.lock:
+                session = self.sessions.get(host)
+                if session is None:
+                    session = self._build_session()
+                    self.sessions[host] = session
+        return session
+
+    def resolve_url(self, url: str) -> str:
+        """
+        [info] Point a Riot API URL at the base URL override, if one is set
+        [param] url: Full request URL (ex. https://americas.api.riotgames.com/riot/account/v1/...)
+        [return] Rewritten URL (ex. http://127.0.0.1:8787/riot/account/v1/...), or the URL unchanged
+        """
+        if self.base_url is None:
+            return url
+        parts = urlsplit(url)
+        if not parts.netloc.endswith(RIOT_API_HOST_SUFFIX):
+            return url
+        return urlunsplit((self.base_url.scheme, self.base_url.netloc, self.base_url.path + parts.path, parts.query, parts.fragment))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        [info] GET through the pooled session of the URL's routing host
+        [param] url: Full request URL
+        [param] kwargs: Extra arguments forwarded to requests.Session.get (params, timeout, ...)
+        [return] requests.Response
+        """
+        url = self.resolve_url(url)
+        return self.get_session(url).get(url, **kwargs)
+
+    def close(self) -> None:
+        """
+        [info] Close every pooled session and its open connections
+        [return] None
+        """
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions = {}
+
+
+###########################
+### SHARED SESSION POOL ###
+###########################
+_SHARED_SESSION_POOL = None
+_SHARED_SESSION_POOL_LOCK = threading.Lock()
+
+def get_session_pool() -> RiotSessionPool:
+    """
+    [info] Process-wide session pool shared by APIObject and all riot_client services
+    [return] Shared RiotSessionPool (sized from HTTP_POOL_SIZE / HTTP_CONNECT_RETRIES, pointed at RIOT_API_BASE_URL in config/api.env if set)
+    """
+    global _SHARED_SESSION_POOL
+    with _SHARED_SESSION_POOL_LOCK:
+        if _SHARED_SESSION_POOL is None:
+            pool_size = get_riot_api_config("HTTP_POOL_SIZE")
+            connect_retries = get_riot_api_config("HTTP_CONNECT_RETRIES")
+            _SHARED_SESSION_POOL = RiotSessionPool(
+                pool_size=int(pool_size) if pool_size else DEFAULT_POOL_SIZE,
+                connect_retries=int(connect_retries) if connect_retries else DEFAULT_CONNECT_RETRIES,
+                base_url=get_riot_api_config("RIOT_API_BASE_URL"),
+            )
+        return _SHARED_SESSION_POOL
@@ -0,0 +1,227 @@
+# api_clients/riot_client/key_pool.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import asyncio
+import logging
+import threading
+
+# local imports
+from .rate_limiter import get_rate_limiter
+from .services import update_sys_path
+update_sys_path()
+from config.config import get_riot_api_config
+
+RETIRE_STATUS_CODES = (401, 403)    # key expired / revoked / blacklisted, stop routing calls to it
+MAX_KEY_ROTATIONS = 2               # times one call may be resent with another key after its key was retired
+
+
+def load_api_keys() -> list:
+    """
+    [info] Riot API keys from config/api.env (RIOT_API_KEY first, then comma separated RIOT_API_KEYS)
+    [return] List of unique keys, primary key first
+
+    Example config/api.env:
+        RIOT_API_KEY=RGAPI-production-key
+        RIOT_API_KEYS=RGAPI-dev-key-1,RGAPI-dev-key-2
+    """
+    keys = [get_riot_api_config("RIOT_API_KEY")]
+    keys += (get_riot_api_config("RIOT_API_KEYS") or "").split(",")
+    return list(dict.fromkeys(key.strip() for key in keys if key and key.strip()))
+
+
+class APIKeyPool:
+    """
+    [info] Pool of Riot API keys with their own rate limit buckets
+
+    Riot counts app and method limits per key and routing value, so every key gets its own
+    RateLimiter per routing value (the primary key uses the default shared limiter, so code that
+    does not go through the pool keeps sharing its buckets). acquire() routes each call to the
+    active key with the most headroom and admits it through that key's buckets, so throughput
+    scales with the number of keys. Keys answering 401 are retired for the rest of the run; a 403
+    only retires a key on an endpoint it has served before (a first 403 can be an endpoint the key
+    was never granted, ex. a dev key, which says nothing about the key itself).
+    """
+    def __init__(self, keys: list = None) -> None:
+        """
+        [info] Initialize the pool
+        [param] keys: API keys, primary first (default: load_api_keys())
+        [return] None
+        """
+        self.keys = list(dict.fromkeys(keys if keys is not None else load_api_keys()))
+        self.primary = self.keys[0] if self.keys else None
+        self.lock = threading.Lock()
+        self.retired = {}                               # key -> status code it was retired for
+        self.served = {key: set() for key in self.keys} # key -> methods it got a successful response from
+        self.dispatched = {key: 0 for key in self.keys}
+
+    @staticmethod
+    def _label(key: str) -> str:
+        return f"...{key[-6:]}" if key else "None"      # never log full keys
+
+    def rate_limiter(self, key: str, routing: str):
+        """
+        [info] Limiter holding one key's buckets for a routing value
+        [param] key: API key
+        [param] routing: Routing value or host (ex. americas, na1.api.riotgames.com)
+        [return] Shared RateLimiter instance
+        """
+        return get_rate_limiter(routing, None if key == self.primary else key)
+
+    def active_keys(self) -> list:
+        """
+        [info] Keys that have not been retired
+        [return] List of keys in configuration order
+        """
+        with self.lock:
+            return [key for key in self.keys if key not in self.retired]
+
+    def is_retired(self, key: str) -> bool:
+        """
+        [info] Check whether a key was retired (callers resend with another key when theirs just was)
+        [param] key: API key
+        [return] True if the pool no longer routes calls to the key
+        """
+        with self.lock:
+            return key in self.retired
+
+    def _candidates(self, routing: str) -> list:
+        """
+        [info] Active keys ordered by app-level headroom on a routing value, most headroom first
+        [param] routing: Routing value or host
+        [return] List of keys (the primary key alone if every key was retired, calls then fail with 401 / 403)
+        """
+        keys = self.active_keys()
+        if not keys:
+            logging.error("[APIKeyPool] Every Riot API key was retired (401 / 403), check config/api.env")
+            keys = [self.primary]
+        return sorted(keys, key=lambda key: self.rate_limiter(key, routing).headroom(), reverse=True)
+
+    def try_acquire(self, routing: str, method: str = None) -> tuple:
+        """
+        [info] Admit a call through the key with the most headroom, without blocking
+        [param] routing: Routing value or host
+        [param] method: Method path template (ex. /lol/match/v5/matches/{matchId})
+        [return] Tuple of (key, 0.0) if admitted, else (None, seconds until some key could admit it)
+        """
+        wait = None
+        for key in self._candidates(routing):
+            key_wait = self.rate_limiter(key, routing).try_acquire(method)
+            if key_wait <= 0:
+                with self.lock:
+                    self.dispatched[key] = self.dispatched.get(key, 0) + 1
+                return key, 0.0
+            wait = key_wait if wait is None else min(wait, key_wait)
+        return None, wait
+
+    def acquire(self, routing: str, method: str = None) -> str:
+        """
+        [info] Block until some key has capacity for the call, consume one slot of its buckets
+        [param] routing: Routing value or host
+        [param] method: Method path template
+        [return] API key to send the call with
+        """
+        while True:
+            key, wait = self.try_acquire(routing, method)
+            if key is not None:
+                return key
+            self.rate_limiter(self.primary, routing).clock.sleep(wait)
+
+    async def async_acquire(self, routing: str, method: str = None) -> str:
+        """
+        [info] Coroutine version of acquire() that yields to the event loop instead of blocking
+        [param] routing: Routing value or host
+        [param] method: Method path template
+        [return] API key to send the call with
+        """
+        while True:
+            key, wait = self.try_acquire(routing, method)
+            if key is not None:
+                return key
+            await asyncio.sleep(wait)
+
+    def headroom(self, routing: str) -> float:
+        """
+        [info] Best app-level headroom across active keys (used for per-class budget reservations)
+        [param] routing: Routing value or host
+        [return] 0.0 - 1.0
+        """
+        return max((self.rate_limiter(key, routing).headroom() for key in self._candidates(routing)), default=0.0)
+
+    def headroom_wait(self, routing: str) -> float:
+        """
+        [info] Seconds until the best active key's app-level headroom next grows
+        [param] routing: Routing value or host
+        [return] Seconds (0.0 if some key has no app window in use)
+        """
+        return min((self.rate_limiter(key, routing).headroom_wait() for key in self._candidates(routing)), default=0.0)
+
+    def observe_response(self, key: str, routing: str, method: str, status_code: int, headers) -> float:
+        """
+        [info] Sync the key's buckets with the response headers and retire the key on 401 (or 403 from an endpoint it served before)
+        [param] key: API key the call was sent with
+        [param] routing: Routing value or host
+        [param] method: Method path template
+        [param] status_code: HTTP status code
+        [param] headers: Response headers
+        [return] Seconds the limiter holds the call's scope (see RateLimiter.observe_response)
+        """
+        if status_code < 400:
+            with self.lock:
+                self.served.setdefault(key, set()).add(method)
+        elif status_code == 401:
+            self.retire(key, status_code)
+        elif status_code == 403:
+            with self.lock:
+                served_before = method in self.served.get(key, ())
+            if served_before:
+                self.retire(key, status_code)
+            else:
+                logging.warning(f"[APIKeyPool] Key {self._label(key)} got 403 on {method} it never served, not retired")
+        return self.rate_limiter(key, routing).observe_response(method, status_code, headers)
+
+    def retire(self, key: str, status_code: int) -> None:
+        """
+        [info] Stop routing calls to a key
+        [param] key: API key
+        [param] status_code: Status code that caused the retirement
+        [return] None
+        """
+        with self.lock:
+            if key in self.retired or key not in self.keys:
+                return
+            self.retired[key] = status_code
+            remaining = len(self.keys) - len(self.retired)
+        logging.error(f"[APIKeyPool] Retired key {self._label(key)} after {status_code}, {remaining} key(s) left")
+
+    def stats(self) -> dict:
+        """
+        [info] Per-key usage for logging (keys are masked)
+        [return] Dictionary of masked key -> dispatched count and retirement status
+        """
+        with self.lock:
+            return {
+                self._label(key): {"dispatched": self.dispatched.get(key, 0), "retired": self.retired.get(key)}
+                for key in self.keys
+            }
+
+
+#######################
+### SHARED KEY POOL ###
+#######################
+_SHARED_KEY_POOL = None
+_SHARED_KEY_POOL_LOCK = threading.Lock()
+
+def get_key_pool() -> APIKeyPool:
+    """
+    [info] Process-wide API key pool loaded from config/api.env
+    [return] Shared APIKeyPool instance
+    """
+    global _SHARED_KEY_POOL
+    with _SHARED_KEY_POOL_LOCK:
+        if _SHARED_KEY_POOL is None:
+            _SHARED_KEY_POOL = APIKeyPool()
+        return _SHARED_KEY_POOL
@@ -0,0 +1,223 @@
+# api_clients/riot_client/match_cache.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import os
+import gzip
+import json
+import time
+import atexit
+import hashlib
+import logging
+import threading
+
+# local imports
+from .services import update_sys_path
+update_sys_path()
+from models.match_dto import MatchDTO
+from modules.utils.json_projection import fast_loads, loads_projected
+
+MATCH_CACHE_DIR = "../data/cache/matches"      # relative to backend/ (same convention as ../data/official_tourney_games)
+INDEX_FILE_NAME = "index.json"
+INDEX_FLUSH_EVERY = 25                          # rewrite index.json after this many new entries
+MATCHDTO_KEYS = ("metadata", "info")            # hand-saved tourney files carry extra keys (team_ids, winning_team_id)
+
+
+class MatchCache:
+    """
+    [info] Persistent on-disk cache of immutable MatchDTOs keyed by match ID
+
+    A finished match never changes, so each MatchDTO is stored once as gzip-compressed json
+    (<match_id>.json.gz) with an index.json recording its size and content hash. Lookups check
+    the file directly, so an index that was not flushed (crash) never causes a re-download.
+    """
+    def __init__(self, cache_dir: str = MATCH_CACHE_DIR, compress_level: int = 6) -> None:
+        """
+        [info] Open (or create) a match cache directory and load its index
+        [param] cache_dir: Directory holding compressed MatchDTOs and index.json (default: ../data/cache/matches)
+        [param] compress_level: gzip compression level 1-9 (default: 6)
+        [return] None
+        """
+        self.cache_dir = cache_dir
+        self.compress_level = compress_level
+        self.index_path = os.path.join(cache_dir, INDEX_FILE_NAME)
+        self.lock = threading.Lock()
+        self.pending_index_writes = 0
+
+        # counters
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0        # raw json bytes served from disk instead of the network
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self) -> dict:
+        """
+        [info] Load index.json (match_id -> entry), empty if missing or corrupt
+        [return] Dictionary index
+        """
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"[MatchCache] Rebuilding unreadable index {self.index_path}: {e}")
+            return {}
+
+    def _path(self, match_id: str) -> str:
+        """
+        [info] File path of a cached MatchDTO
+        [param] match_id: Match ID (ex. NA1_5209438443)
+        [return] Path to <match_id>.json.gz
+        """
+        return os.path.join(self.cache_dir, f"{match_id}.json.gz")
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self.index or os.path.exists(self._path(match_id))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get(self, match_id: str, projection=None) -> dict:
+        """
+        [info] Read a MatchDTO from the cache
+        [param] match_id: Match ID (ex. NA1_5209438443)
+        [param] projection: Only keep these paths, Projection or tuple of paths (default: None, whole match)
+        [return] MatchDTO json or None on a miss
+        """
+        path = self._path(match_id)
+        try:
+            with gzip.open(path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            with self.lock:
+                self.misses += 1
+            return None
+        except (OSError, EOFError) as e:
+            logging.warning(f"[MatchCache] Dropping corrupt entry {match_id}: {e}")
+            with self.lock:
+                self.misses += 1
+                self.index.pop(match_id, None)
+            os.remove(path)
+            return None
+
+        with self.lock:
+            self.hits += 1
+            self.bytes_saved += len(raw)
+        return loads_projected(raw, projection)
+
+    def get_dto(self, match_id: str, projection=None):
+        """
+        [info] Read a cached match as a compact MatchDTO (for holding many matches in memory)
+        [param] match_id: Match ID (ex. NA1_5209438443)
+        [param] projection: Only keep these paths, unprojected fields are None (default: None, whole match)
+        [return] MatchDTO or None on a miss
+        """
+        match_json = self.get(match_id, projection)
+        return MatchDTO.from_json(match_json) if match_json is not None else None
+
+    def put(self, match_id: str, match_json: dict) -> None:
+        """
+        [info] Store a MatchDTO (no-op if already cached, matches are immutable)
+        [param] match_id: Match ID (ex. NA1_5209438443)
+        [param] match_json: MatchDTO json (extra non-MatchDTO keys are dropped)
+        [return] None
+        """
+        if match_id in self.index:
+            return
+        match_json = {key: match_json[key] for key in MATCHDTO_KEYS if key in match_json}
+        raw = json.dumps(match_json, separators=(",", ":")).encode("utf-8")
+        compressed = gzip.compress(raw, compresslevel=self.compress_level)
+
+        # write to a temp file first so a crash never leaves a truncated entry behind
+        path = self._path(match_id)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+
+        with self.lock:
+            self.index[match_id] = {
+                "sha256": hashlib.sha256(raw).hexdigest(),
+                "raw_bytes": len(raw),
+                "stored_bytes": len(compressed),
+                "game_end_timestamp": match_json.get("info", {}).get("gameEndTimestamp"),
+                "cached_at": int(time.time()),
+            }
+            self.pending_index_writes += 1
+            flush = self.pending_index_writes >= INDEX_FLUSH_EVERY
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        [info] Atomically rewrite index.json
+        [return] None
+        """
+        with self.lock:
+            if not self.pending_index_writes:
+                return
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.index, f, indent=4)
+            os.replace(tmp_path, self.index_path)
+            self.pending_index_writes = 0
+
+    def import_directory(self, directory: str) -> int:
+        """
+        [info] Seed the cache from hand-saved MatchDTO json files (ex. ../data/official_tourney_games)
+        [param] directory: Directory of *.json files containing a MatchDTO
+        [return] Number of newly cached matches
+        """
+        imported = 0
+        for file in sorted(os.listdir(directory)):
+            if not file.endswith(".json"):
+                continue
+            with open(os.path.join(directory, file), "rb") as f:
+                data = fast_loads(f.read())
+            match_id = data.get("metadata", {}).get("matchId") if isinstance(data, dict) else None
+            if not match_id or match_id in self.index:
+                continue
+            self.put(match_id, data)
+            imported += 1
+        self.flush()
+        return imported
+
+    def stats(self) -> dict:
+        """
+        [info] Cache counters for logging
+        [return] Dictionary of hits, misses, bytes saved, entry count and on-disk / raw sizes
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_saved": self.bytes_saved,
+                "entries": len(self.index),
+                "raw_bytes": sum(entry["raw_bytes"] for entry in self.index.values()),
+                "stored_bytes": sum(entry["stored_bytes"] for entry in self.index.values()),
+            }
+
+
+##########################
+### SHARED MATCH CACHE ###
+##########################
+_SHARED_MATCH_CACHE = None
+_SHARED_MATCH_CACHE_LOCK = threading.Lock()
+
+def get_match_cache() -> MatchCache:
+    """
+    [info] Process-wide match cache used by MATCH_V5.get_match_by_id (index flushed at exit)
+    [return] Shared MatchCache instance
+    """
+    global _SHARED_MATCH_CACHE
+    with _SHARED_MATCH_CACHE_LOCK:
+        if _SHARED_MATCH_CACHE is None:
+            _SHARED_MATCH_CACHE = MatchCache()
+            atexit.register(_SHARED_MATCH_CACHE.flush)
+        return _SHARED_MATCH_CACHE
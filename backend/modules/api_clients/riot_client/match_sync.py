@@ -0,0 +1,190 @@
+# api_clients/riot_client/match_sync.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import os
+import json
+import time
+import logging
+import threading
+
+# local imports
+from .services import update_sys_path
+update_sys_path()
+from modules.api_clients.riot_client.services.match_v5 import MATCH_V5, IncompleteMatchListError, DEFAULT_REGION_CODE
+from modules.api_clients.riot_client.match_cache import get_match_cache
+from modules.utils.time_utils import get_epoch_timestamp
+
+MATCH_SYNC_STATE_FILE = "../data/cache/match_sync_state.json"     # relative to backend/
+DEFAULT_SYNC_QUEUE = 420                                           # ranked solo / duo
+
+
+class MatchSync:
+    """
+    [info] Incremental match-history sync with per-PUUID + queue high-water marks
+
+    Each (puuid, queue) remembers the newest ingested match ID and its gameEndTimestamp. A refresh
+    only lists matches with startTime after that watermark and only downloads IDs that are not in
+    the match cache, so its cost grows with the number of new games instead of history length.
+
+    Usage:
+        sync = MatchSync()
+        new_match_ids = sync.sync_player(puuid, queue=420)
+        sync.save()
+    """
+    def __init__(self, state_file: str = MATCH_SYNC_STATE_FILE, match_cache=None) -> None:
+        """
+        [info] Load persisted watermarks (or start empty)
+        [param] state_file: Json file the watermarks are persisted to (default: ../data/cache/match_sync_state.json)
+        [param] match_cache: MatchCache used to skip already downloaded matches (default: shared match cache)
+        [return] None
+        """
+        self.state_file = state_file
+        self.match_cache = match_cache if match_cache else get_match_cache()
+        self.lock = threading.Lock()
+        self.watermarks = {}    # "puuid:queue" -> {"match_id", "game_end_timestamp", "synced_at"}
+        self.dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """
+        [info] Load persisted watermarks, empty if missing or corrupt
+        [return] None
+        """
+        if not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file) as f:
+                self.watermarks = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"[MatchSync] Ignoring unreadable state file {self.state_file}: {e}")
+
+    @staticmethod
+    def _key(puuid: str, queue: int) -> str:
+        return f"{puuid}:{queue}"
+
+    def get_watermark(self, puuid: str, queue: int = DEFAULT_SYNC_QUEUE) -> dict:
+        """
+        [info] Newest ingested match for a player / queue
+        [param] puuid: Player's unique identifier
+        [param] queue: Queue ID (default: 420, ranked solo / duo)
+        [return] Dictionary with match_id, game_end_timestamp (ms) and synced_at, or None if never synced
+        """
+        with self.lock:
+            return self.watermarks.get(self._key(puuid, queue))
+
+    def reset(self, puuid: str, queue: int = DEFAULT_SYNC_QUEUE) -> None:
+        """
+        [info] Forget a watermark so the next sync re-lists the full history
+        [param] puuid: Player's unique identifier
+        [param] queue: Queue ID (default: 420, ranked solo / duo)
+        [return] None
+        """
+        with self.lock:
+            if self.watermarks.pop(self._key(puuid, queue), None) is not None:
+                self.dirty = True
+
+    def sync_player(self, puuid: str, queue: int = DEFAULT_SYNC_QUEUE, region: str = DEFAULT_REGION_CODE) -> list:
+        """
+        [info] Download a player's matches newer than their watermark and advance it
+        [param] puuid: Player's unique identifier
+        [param] queue: Queue ID (default: 420, ranked solo / duo)
+        [param] region: Region code for API request (default: configured region)
+        [return] List of newly ingested match IDs (newest first)
+        """
+        if queue is None:
+            # the watermark is stored per queue, it must match the queue that is actually listed
+            raise ValueError("sync_player needs an explicit queue ID (ex. 420 ranked solo / duo, 0 custom games)")
+        watermark = self.get_watermark(puuid, queue)
+        if watermark:
+            start_time = watermark["game_end_timestamp"] // 1000 + 1     # gameEndTimestamp is ms, startTime is s
+        else:
+            start_time = get_epoch_timestamp(6, 17, 2021)
+        last_match_id = watermark["match_id"] if watermark else None
+
+        # list only the new IDs, the watermark match itself ends the walk if Riot returns it anyway
+        # a truncated listing would leave a gap below its newest match, so the watermark must not move
+        try:
+            new_match_ids = list(MATCH_V5.iter_match_ids_by_puuid(puuid, startTime=start_time, queue=queue, region=region, stop_when=lambda match_id: match_id == last_match_id, raise_on_error=True))
+        except IncompleteMatchListError as e:
+            logging.warning(f"[MatchSync] Incomplete match listing, watermark for {puuid} held at {last_match_id}: {e}")
+            return []
+
+        # download oldest first, the watermark only advances over a contiguous run of ingested matches
+        ingested = []
+        for match_id in reversed(new_match_ids):
+            if match_id in self.match_cache:
+                match_json = self.match_cache.get(match_id)
+            else:
+                result = MATCH_V5.get_match_by_id(match_id, region=region)
+                match_json = result[1] if result else None
+            if not match_json:
+                logging.warning(f"[MatchSync] Failed to ingest {match_id}, watermark for {puuid} held at {last_match_id}")
+                break
+            ingested.append(match_id)
+            self._advance(puuid, queue, match_id, self._game_end_timestamp(match_json["info"]))
+            last_match_id = match_id
+        ingested.reverse()
+        return ingested
+
+    def sync_players(self, puuids: list, queue: int = DEFAULT_SYNC_QUEUE, region: str = DEFAULT_REGION_CODE) -> dict:
+        """
+        [info] Incrementally sync many players, saving the watermarks afterwards
+        [param] puuids: List of player PUUIDs
+        [param] queue: Queue ID (default: 420, ranked solo / duo)
+        [param] region: Region code for API request (default: configured region)
+        [return] Dictionary of puuid -> list of newly ingested match IDs
+        """
+        results = {}
+        for puuid in puuids:
+            results[puuid] = self.sync_player(puuid, queue, region)
+        self.save()
+        return results
+
+    @staticmethod
+    def _game_end_timestamp(info: dict) -> int:
+        """
+        [info] End of a match in ms, derived for matches from before patch 11.20 (no gameEndTimestamp)
+        [param] info: MatchDTO info dictionary
+        [return] Epoch timestamp in ms
+        """
+        if info.get("gameEndTimestamp"):
+            return info["gameEndTimestamp"]
+        # pre 11.20 gameDuration is in ms, later matches always carry gameEndTimestamp
+        return (info.get("gameStartTimestamp") or info.get("gameCreation") or 0) + (info.get("gameDuration") or 0)
+
+    def _advance(self, puuid: str, queue: int, match_id: str, game_end_timestamp: int) -> None:
+        """
+        [info] Move a watermark forward (never backwards)
+        [param] puuid: Player's unique identifier
+        [param] queue: Queue ID
+        [param] match_id: Newly ingested match ID
+        [param] game_end_timestamp: Its end timestamp (ms), see _game_end_timestamp
+        [return] None
+        """
+        key = self._key(puuid, queue)
+        with self.lock:
+            current = self.watermarks.get(key)
+            if current and current["game_end_timestamp"] >= game_end_timestamp:
+                return
+            self.watermarks[key] = {"match_id": match_id, "game_end_timestamp": game_end_timestamp, "synced_at": int(time.time())}
+            self.dirty = True
+
+    def save(self) -> None:
+        """
+        [info] Atomically persist watermarks to the state file
+        [return] None
+        """
+        with self.lock:
+            if not self.dirty:
+                return
+            watermarks = dict(self.watermarks)
+            self.dirty = False
+        os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(watermarks, f, indent=4)
+        os.replace(tmp_path, self.state_file)
@@ -0,0 +1,162 @@
+# api_clients/riot_client/priority_lanes.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import heapq
+import itertools
+import threading
+from collections import deque
+
+PRIORITY_INTERACTIVE = "interactive"          # on-demand coach / user lookups
+PRIORITY_ROSTER_REFRESH = "roster_refresh"    # scheduled roster + rank refreshes
+PRIORITY_BACKFILL = "backfill"                # bulk match history downloads
+
+# weight: relative share of dispatches while every class has work waiting
+# reserved_share: fraction of the app rate limit budget other classes may not spend while this class has work waiting
+PRIORITY_CLASSES = {
+    PRIORITY_INTERACTIVE: {"weight": 8, "reserved_share": 0.20},
+    PRIORITY_ROSTER_REFRESH: {"weight": 3, "reserved_share": 0.10},
+    PRIORITY_BACKFILL: {"weight": 1, "reserved_share": 0.0},
+}
+DEFAULT_PRIORITY = PRIORITY_INTERACTIVE
+STARVATION_AGE = 30.0       # seconds a due request may wait before it is served ahead of the weights
+WAIT_SAMPLES = 500          # recent wait times kept per class for percentiles
+
+
+class PriorityLanes:
+    """
+    [info] Per-priority-class deadline heaps with weighted fair selection
+
+    Each class keeps its own heap of (ready_time, sequence, item). Among classes with a due request
+    the one with the lowest virtual time (dispatches / weight) goes next, so with interactive=8 and
+    backfill=1 a saturated queue still serves 1 backfill request per 8 interactive ones. A request
+    that has been due for longer than starvation_age jumps ahead of the weights, and a class may only
+    spend the app budget down to the reserved shares of the other classes that have work waiting.
+    """
+    def __init__(self, classes: dict = None, starvation_age: float = STARVATION_AGE) -> None:
+        """
+        [info] Create one empty lane per priority class
+        [param] classes: Dictionary of class -> {"weight", "reserved_share"} (default: PRIORITY_CLASSES)
+        [param] starvation_age: Seconds a due request may wait before bypassing the weights (default: 30.0)
+        [return] None
+        """
+        self.classes = classes if classes else PRIORITY_CLASSES
+        self.starvation_age = starvation_age
+        self.lock = threading.Lock()
+        self.sequence = itertools.count()   # FIFO tie-breaker for equal deadlines
+        self.heaps = {priority: [] for priority in self.classes}
+        self.virtual_time = {priority: 0.0 for priority in self.classes}
+
+        # per-class metrics
+        self.dispatched = {priority: 0 for priority in self.classes}
+        self.starved = {priority: 0 for priority in self.classes}
+        self.total_wait = {priority: 0.0 for priority in self.classes}
+        self.max_wait = {priority: 0.0 for priority in self.classes}
+        self.recent_waits = {priority: deque(maxlen=WAIT_SAMPLES) for priority in self.classes}
+
+    def __len__(self) -> int:
+        with self.lock:
+            return sum(len(heap) for heap in self.heaps.values())
+
+    def validate(self, priority: str) -> None:
+        """
+        [info] Reject unknown priority classes before they reach the worker thread
+        [param] priority: Priority class name
+        [return] None
+        """
+        if priority not in self.classes:
+            raise ValueError(f"Unknown priority class: {priority} (expected one of {list(self.classes)})")
+
+    def push(self, priority: str, ready_time: float, item) -> None:
+        """
+        [info] Add an item to its class lane
+        [param] priority: Priority class name (ex. interactive)
+        [param] ready_time: Monotonic time the item becomes eligible
+        [param] item: Queued object
+        [return] None
+        """
+        self.validate(priority)
+        with self.lock:
+            heap = self.heaps[priority]
+            if not heap:
+                # a class returning from idle resumes at the active classes' pace instead of bursting on old credit
+                active = [self.virtual_time[other] for other, other_heap in self.heaps.items() if other_heap]
+                if active:
+                    self.virtual_time[priority] = max(self.virtual_time[priority], min(active))
+            heapq.heappush(heap, (ready_time, next(self.sequence), item))
+
+    def next_ready_time(self) -> float:
+        """
+        [info] Earliest ready time across all lanes
+        [return] Monotonic timestamp or None if every lane is empty
+        """
+        with self.lock:
+            heads = [heap[0][0] for heap in self.heaps.values() if heap]
+        return min(heads) if heads else None
+
+    def pop_next(self, now: float, headroom: float = 1.0):
+        """
+        [info] Take the next item to dispatch (starving first, then weighted fair, subject to reserved shares)
+        [param] now: Current monotonic time
+        [param] headroom: Fraction of the app rate limit budget still available (0.0 - 1.0)
+        [return] Queued item, or None if nothing is due or every due class is held back by reservations
+        """
+        with self.lock:
+            due = [priority for priority, heap in self.heaps.items() if heap and heap[0][0] <= now]
+            if not due:
+                return None
+            starving = sorted((priority for priority in due if now - self.heaps[priority][0][0] > self.starvation_age), key=lambda priority: self.heaps[priority][0][0])
+            fair = sorted((priority for priority in due if priority not in starving), key=lambda priority: self.virtual_time[priority])
+
+            for priority in starving + fair:
+                reserved_for_others = sum(
+                    settings["reserved_share"] for other, settings in self.classes.items()
+                    if other != priority and self.heaps[other]
+                )
+                if headroom <= reserved_for_others:
+                    continue
+                ready_time, _, item = heapq.heappop(self.heaps[priority])
+                self._record(priority, now - ready_time, priority in starving)
+                return item
+            return None
+
+    def _record(self, priority: str, wait: float, starved: bool) -> None:
+        """
+        [info] Update virtual time and wait metrics of a dispatched class (caller holds lock)
+        [param] priority: Priority class name
+        [param] wait: Seconds the item waited after becoming due
+        [param] starved: Whether it was served by starvation protection
+        [return] None
+        """
+        self.virtual_time[priority] += 1.0 / self.classes[priority]["weight"]
+        self.dispatched[priority] += 1
+        self.starved[priority] += starved
+        self.total_wait[priority] += wait
+        self.max_wait[priority] = max(self.max_wait[priority], wait)
+        self.recent_waits[priority].append(wait)
+
+    def stats(self, now: float) -> dict:
+        """
+        [info] Per-class queue depth and wait time metrics
+        [param] now: Current monotonic time
+        [return] Dictionary of class -> depth, oldest due wait, dispatched, starved, avg / p50 / p95 / max wait
+        """
+        with self.lock:
+            stats = {}
+            for priority, heap in self.heaps.items():
+                recent = sorted(self.recent_waits[priority])
+                dispatched = self.dispatched[priority]
+                stats[priority] = {
+                    "depth": len(heap),
+                    "oldest_wait": max(0.0, now - min(entry[0] for entry in heap)) if heap else 0.0,
+                    "dispatched": dispatched,
+                    "starved": self.starved[priority],
+                    "avg_wait": self.total_wait[priority] / dispatched if dispatched else 0.0,
+                    "p50_wait": recent[int(0.50 * (len(recent) - 1))] if recent else 0.0,
+                    "p95_wait": recent[int(0.95 * (len(recent) - 1))] if recent else 0.0,
+                    "max_wait": self.max_wait[priority],
+                }
+            return stats
@@ -0,0 +1,478 @@
+# api_clients/riot_client/rate_limiter.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import re
+import asyncio
+import time
+import logging
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+
+# local imports
+from .services import update_sys_path
+update_sys_path()
+from modules.utils.file_utils import load_json_from_file
+
+RATE_LIMITS_JSON_PATH = "constants/zephyrRateLimits.json"
+
+# "20 requests every 1 seconds", "100 requests every 2 minutes", ...
+RATE_LIMIT_PATTERN = re.compile(r"^\s*(\d+)\s+requests?\s+every\s+(\d+)\s+(second|minute|hour)s?\s*$", re.IGNORECASE)
+UNIT_SECONDS = {"second": 1, "minute": 60, "hour": 3600}
+
+DEFAULT_RETRY_AFTER = 1.0   # seconds to hold a method after a 429 that carries no Retry-After (underlying service limit)
+
+# literal Riot path segments are lowercase words (lol, match, v5, by-puuid, ids), anything else is a path parameter
+LITERAL_SEGMENT_PATTERN = re.compile(r"^[a-z][a-z0-9-]*$")
+
+
+def derive_method_template(url: str) -> str:
+    """
+    [info] Best-effort method path template of a URL whose endpoint is missing from zephyrRateLimits.json
+    [param] url: Full request URL (ex. https://na1.api.riotgames.com/lol/clash/v1/players/by-puuid/abc-123)
+    [return] Path template with parameters replaced (ex. /lol/clash/v1/players/by-puuid/{param})
+    """
+    path = urlsplit(url).path or url.split("?")[0]
+    return "/".join(segment if not segment or LITERAL_SEGMENT_PATTERN.match(segment) else "{param}" for segment in path.split("/"))
+
+
+def parse_rate_limit(rate_limit_str: str) -> tuple:
+    """
+    [info] Parse a human readable rate limit string from zephyrRateLimits.json
+    [param] rate_limit_str: Rate limit string (ex. "100 requests every 2 minutes")
+    [return] Tuple of (limit, period_seconds)
+    """
+    match = RATE_LIMIT_PATTERN.match(rate_limit_str)
+    if not match:
+        raise ValueError(f"Invalid rate limit string: {rate_limit_str}")
+    limit, amount, unit = match.groups()
+    return int(limit), int(amount) * UNIT_SECONDS[unit.lower()]
+
+
+def parse_rate_limit_header(header_value: str) -> list:
+    """
+    [info] Parse a Riot rate limit header (X-App-Rate-Limit / X-*-Rate-Limit-Count)
+    [param] header_value: Header value (ex. "20:1,100:120")
+    [return] List of (value, period_seconds) tuples, empty if header missing / malformed
+    """
+    windows = []
+    if not header_value:
+        return windows
+    for window in header_value.split(","):
+        try:
+            value, period = window.strip().split(":")
+            windows.append((int(value), int(period)))
+        except ValueError:
+            logging.warning(f"Ignoring malformed rate limit header window: {window}")
+    return windows
+
+
+#############
+### CLOCK ###
+#############
+class SystemClock:
+    """
+    [info] Wall clock used by the rate limiter in normal operation
+    """
+    def time(self) -> float:
+        """
+        [info] Current monotonic time in seconds
+        [return] Monotonic timestamp as float
+        """
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        [info] Block the calling thread for the given number of seconds
+        [param] seconds: Time to sleep in seconds
+        [return] None
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    [info] Deterministic clock for testing / benchmarking admission math without sleeping
+    """
+    def __init__(self, start: float = 0.0) -> None:
+        """
+        [info] Initialize virtual clock at a fixed point in time
+        [param] start: Initial virtual time in seconds (default: 0.0)
+        [return] None
+        """
+        self.now = start
+        self.slept = 0.0
+
+    def time(self) -> float:
+        """
+        [info] Current virtual time in seconds
+        [return] Virtual timestamp as float
+        """
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        [info] Advance virtual time instead of blocking
+        [param] seconds: Time to advance in seconds
+        [return] None
+        """
+        if seconds > 0:
+            self.now += seconds
+            self.slept += seconds
+
+
+##########################
+### RATE LIMIT BUCKETS ###
+##########################
+class RateLimitBucket:
+    """
+    [info] Single rate limit window (ex. 20 requests every 1 second)
+
+    Admitted requests are kept as a log of timestamps so that no span of `period` seconds
+    ever holds more than `limit` requests, which keeps us under Riot's fixed windows.
+    """
+    def __init__(self, limit: int, period: float, name: str = "") -> None:
+        """
+        [info] Initialize bucket with its capacity and window length
+        [param] limit: Maximum number of requests per window
+        [param] period: Window length in seconds
+        [param] name: Label used in logs / stats (default: '')
+        [return] None
+        """
+        self.limit = limit
+        self.period = period
+        self.name = name
+        self.history = deque()
+
+    def _expire(self, now: float) -> None:
+        """
+        [info] Drop timestamps that have left the window
+        [param] now: Current clock time
+        [return] None
+        """
+        cutoff = now - self.period
+        while self.history and self.history[0] <= cutoff:
+            self.history.popleft()
+
+    def wait_time(self, now: float) -> float:
+        """
+        [info] Seconds until this bucket has capacity for one more request
+        [param] now: Current clock time
+        [return] 0.0 if a request can be admitted now, else seconds to wait
+        """
+        self._expire(now)
+        if len(self.history) < self.limit:
+            return 0.0
+        return self.history[len(self.history) - self.limit] + self.period - now
+
+    def record(self, now: float) -> None:
+        """
+        [info] Consume one slot of capacity
+        [param] now: Current clock time
+        [return] None
+        """
+        self.history.append(now)
+
+    def sync_count(self, count: int, now: float) -> None:
+        """
+        [info] Catch up with the server's count for this window (requests we did not see, ex. other processes)
+        [param] count: Requests the server has counted in the current window
+        [param] now: Current clock time
+        [return] None
+        """
+        self._expire(now)
+        missing = count - len(self.history)
+        if missing > 0:
+            self.history.extend([now] * missing)
+
+    def remaining(self, now: float) -> int:
+        """
+        [info] Number of requests still allowed in the current window
+        [param] now: Current clock time
+        [return] Remaining capacity as int
+        """
+        self._expire(now)
+        return self.limit - len(self.history)
+
+    def __repr__(self):
+        return f"RateLimitBucket(name={self.name}, limit={self.limit}, period={self.period}, used={len(self.history)})"
+
+
+class RateLimiter:
+    """
+    [info] Multi-window rate limiter shared by every Riot API call
+
+    A call is admitted only when every app-level bucket and every bucket of its method have capacity.
+    """
+    def __init__(self, rate_limits: dict, clock=None, default_retry_after: float = DEFAULT_RETRY_AFTER) -> None:
+        """
+        [info] Build app / method buckets from the zephyrRateLimits.json structure
+        [param] rate_limits: Parsed contents of zephyrRateLimits.json
+        [param] clock: Clock providing time() / sleep() (default: SystemClock, use VirtualClock for tests)
+        [param] default_retry_after: Hold applied after a 429 without Retry-After header (default: 1.0)
+        [return] None
+        """
+        self.clock = clock if clock else SystemClock()
+        self.lock = threading.Lock()
+        self.default_retry_after = default_retry_after
+        self.app_buckets = []
+        self.method_buckets = {}    # method path template -> list of RateLimitBucket
+        self.method_patterns = []   # (compiled regex, method path template)
+        self.discovered_methods = {}  # method path template -> [(limit, period)] learned from response headers
+        self.app_blocked_until = 0.0
+        self.method_blocked_until = {}  # method path template -> clock time the Retry-After hold ends
+        self.admitted = 0
+        self.total_wait = 0.0
+        self.throttled = 0
+
+        for rate_limit_str in rate_limits.get("overall", {}).get("rateLimits", []):
+            limit, period = parse_rate_limit(rate_limit_str)
+            self.app_buckets.append(RateLimitBucket(limit, period, name=f"app:{rate_limit_str}"))
+
+        for service_name, methods in rate_limits.items():
+            if service_name == "overall" or not isinstance(methods, dict):
+                continue
+            for method, method_info in methods.items():
+                buckets = []
+                for rate_limit_str in method_info.get("rateLimits", []):
+                    limit, period = parse_rate_limit(rate_limit_str)
+                    buckets.append(RateLimitBucket(limit, period, name=f"{method}:{rate_limit_str}"))
+                self.method_buckets[method] = buckets
+                self.method_patterns.append((self._compile_method_pattern(method), method))
+
+    @classmethod
+    def from_json(cls, file_name: str = RATE_LIMITS_JSON_PATH, clock=None):
+        """
+        [info] Create a rate limiter from zephyrRateLimits.json
+        [param] file_name: Path to the rate limits json (default: constants/zephyrRateLimits.json)
+        [param] clock: Optional clock (ex. VirtualClock for benchmarks)
+        [return] RateLimiter instance
+        """
+        return cls(load_json_from_file(file_name), clock=clock)
+
+    @staticmethod
+    def _compile_method_pattern(method: str):
+        """
+        [info] Turn a method path template into a regex matching concrete request paths
+        [param] method: Path template (ex. /lol/match/v5/matches/{matchId})
+        [return] Compiled regex
+        """
+        pattern = re.sub(r"\\\{[^}]+\\\}", "[^/]+", re.escape(method))
+        return re.compile(f"{pattern}$")
+
+    def resolve_method(self, url: str) -> str:
+        """
+        [info] Find the method path template a concrete request URL belongs to
+        [param] url: Full request URL (ex. https://americas.api.riotgames.com/lol/match/v5/matches/NA1_123)
+        [return] Method path template or None if unknown
+        """
+        path = url.split("?")[0]
+        for pattern, method in self.method_patterns:
+            if pattern.search(path):
+                return method
+        return None
+
+    def _buckets_for(self, method: str) -> list:
+        """
+        [info] All buckets a call to the given method must pass
+        [param] method: Method path template (or None for app-level only)
+        [return] List of RateLimitBucket
+        """
+        return self.app_buckets + self.method_buckets.get(method, [])
+
+    def try_acquire(self, method: str = None) -> float:
+        """
+        [info] Admit a call if every bucket has capacity, without blocking
+        [param] method: Method path template (ex. /riot/account/v1/accounts/by-puuid/{puuid})
+        [return] 0.0 if admitted, else seconds until the call could be admitted
+        """
+        with self.lock:
+            now = self.clock.time()
+            buckets = self._buckets_for(method)
+            wait = max((bucket.wait_time(now) for bucket in buckets), default=0.0)
+            wait = max(wait, self.app_blocked_until - now, self.method_blocked_until.get(method, 0.0) - now)
+            if wait > 0:
+                return wait
+            for bucket in buckets:
+                bucket.record(now)
+            self.admitted += 1
+            return 0.0
+
+    def acquire(self, method: str = None) -> float:
+        """
+        [info] Block until every bucket of the call has capacity, then consume one slot each
+        [param] method: Method path template (ex. /lol/match/v5/matches/{matchId})
+        [return] Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(method)
+            if wait <= 0:
+                with self.lock:
+                    self.total_wait += waited
+                return waited
+            self.clock.sleep(wait)
+            waited += wait
+
+    async def async_acquire(self, method: str = None) -> float:
+        """
+        [info] Coroutine version of acquire() that yields to the event loop instead of blocking
+        [param] method: Method path template (ex. /lol/match/v5/matches/{matchId})
+        [return] Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(method)
+            if wait <= 0:
+                with self.lock:
+                    self.total_wait += waited
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def _sync_buckets(self, buckets: list, limits: list, counts: list, now: float, prefix: str) -> list:
+        """
+        [info] Reconcile local buckets with the windows / counts reported by the server
+        [param] buckets: Current list of RateLimitBucket for the scope
+        [param] limits: [(limit, period)] from X-App-Rate-Limit / X-Method-Rate-Limit
+        [param] counts: [(count, period)] from X-App-Rate-Limit-Count / X-Method-Rate-Limit-Count
+        [param] now: Current clock time
+        [param] prefix: Bucket name prefix ('app' or method path template)
+        [return] Updated list of RateLimitBucket (server windows are authoritative)
+        """
+        buckets_by_period = {bucket.period: bucket for bucket in buckets}
+        counts_by_period = {period: count for count, period in counts}
+        synced = []
+        for limit, period in limits:
+            bucket = buckets_by_period.get(period)
+            if bucket is None:
+                bucket = RateLimitBucket(limit, period)
+            elif bucket.limit != limit:
+                logging.info(f"[RateLimiter] {prefix} window {period}s limit {bucket.limit} -> {limit} (from headers)")
+            bucket.limit = limit
+            bucket.name = f"{prefix}:{limit} requests every {period} seconds"
+            if period in counts_by_period:
+                bucket.sync_count(counts_by_period[period], now)
+            synced.append(bucket)
+        return synced
+
+    def observe_response(self, method: str, status_code: int, headers) -> float:
+        """
+        [info] Sync bucket state with Riot's rate limit headers and apply Retry-After holds on 429s
+        [param] method: Method path template the response belongs to (None if unknown)
+        [param] status_code: HTTP status code of the response
+        [param] headers: Case-insensitive response headers (requests / aiohttp)
+        [return] Seconds the scope is held for when the response is a 429, else 0.0
+        """
+        with self.lock:
+            now = self.clock.time()
+
+            app_limits = parse_rate_limit_header(headers.get("X-App-Rate-Limit"))
+            if app_limits:
+                app_counts = parse_rate_limit_header(headers.get("X-App-Rate-Limit-Count"))
+                self.app_buckets = self._sync_buckets(self.app_buckets, app_limits, app_counts, now, "app")
+
+            method_limits = parse_rate_limit_header(headers.get("X-Method-Rate-Limit"))
+            if method_limits and method is not None:
+                if method not in self.method_buckets:
+                    # endpoint missing from zephyrRateLimits.json, learn its windows from the server
+                    logging.info(f"[RateLimiter] Discovered limits for {method}: {method_limits}")
+                    self.discovered_methods[method] = method_limits
+                    self.method_patterns.append((self._compile_method_pattern(method), method))
+                method_counts = parse_rate_limit_header(headers.get("X-Method-Rate-Limit-Count"))
+                self.method_buckets[method] = self._sync_buckets(self.method_buckets.get(method, []), method_limits, method_counts, now, method)
+
+            if status_code != 429:
+                return 0.0
+
+            # hold exactly as long as the server asks, for the scope that was exceeded
+            retry_after = headers.get("Retry-After")
+            hold = float(retry_after) if retry_after else self.default_retry_after
+            if (headers.get("X-Rate-Limit-Type") or "").lower() == "application":
+                self.app_blocked_until = max(self.app_blocked_until, now + hold)
+            else:
+                self.method_blocked_until[method] = max(self.method_blocked_until.get(method, 0.0), now + hold)
+            self.throttled += 1
+            logging.warning(f"[RateLimiter] 429 on {method} ({headers.get('X-Rate-Limit-Type', 'service')}), holding for {hold:.2f}s")
+            return hold
+
+    def headroom(self) -> float:
+        """
+        [info] Fraction of the tightest app-level window still available (used for per-class budget reservations)
+        [return] 0.0 - 1.0, 1.0 if no app limits are known
+        """
+        with self.lock:
+            now = self.clock.time()
+            if self.app_blocked_until > now:
+                return 0.0
+            return min((max(0, bucket.remaining(now)) / bucket.limit for bucket in self.app_buckets if bucket.limit), default=1.0)
+
+    def headroom_wait(self) -> float:
+        """
+        [info] Seconds until the app-level headroom next grows (a 429 hold ends or the tightest window frees a slot)
+        [return] 0.0 if no app window is in use
+        """
+        with self.lock:
+            now = self.clock.time()
+            if self.app_blocked_until > now:
+                return self.app_blocked_until - now
+            used = [(bucket.remaining(now) / bucket.limit, bucket) for bucket in self.app_buckets if bucket.limit and bucket.history]
+            if not used:
+                return 0.0
+            tightest = min(share for share, _ in used)
+            # headroom is the tightest window's share, it grows once every window tied at that share frees its oldest slot
+            return max(0.0, max(bucket.history[0] + bucket.period - now for share, bucket in used if share == tightest))
+
+    def discovered_rate_limits(self) -> dict:
+        """
+        [info] Limits learned from headers for endpoints missing from zephyrRateLimits.json
+        [return] Dictionary of method -> {"rateLimits": [...]} in zephyrRateLimits.json format
+        """
+        with self.lock:
+            return {
+                method: {"rateLimits": [f"{limit} requests every {period} seconds" for limit, period in limits]}
+                for method, limits in self.discovered_methods.items()
+            }
+
+    def stats(self) -> dict:
+        """
+        [info] Snapshot of limiter usage for logging / benchmarks
+        [return] Dictionary of admitted count, total wait, 429 count and app bucket remaining capacity
+        """
+        with self.lock:
+            now = self.clock.time()
+            return {
+                "admitted": self.admitted,
+                "total_wait": self.total_wait,
+                "throttled": self.throttled,
+                "app_remaining": {bucket.name: bucket.remaining(now) for bucket in self.app_buckets},
+            }
+
+
+############################
+### SHARED RATE LIMITERS ###
+############################
+_SHARED_RATE_LIMITERS = {}      # (routing value, api key) -> RateLimiter, None = default
+_SHARED_RATE_LIMITER_LOCK = threading.Lock()
+
+def get_rate_limiter(routing: str = None, api_key: str = None) -> RateLimiter:
+    """
+    [info] Process-wide rate limiter per routing value (and API key), shared by APIQueue and all riot_client services
+
+    Riot enforces app and method limits per routing value, so americas (ACCOUNT_V1 / MATCH_V5) and
+    na1 (SUMMONER_V4) each get independent buckets loaded from zephyrRateLimits.json. Limits are
+    also counted per key, so additional keys of the APIKeyPool get buckets of their own.
+    [param] routing: Routing value or host (ex. americas, na1, americas.api.riotgames.com), None for the default limiter
+    [param] api_key: API key the buckets belong to (default: None, the primary key)
+    [return] Shared RateLimiter instance for that routing value (created on first use)
+    """
+    key = (routing.split(".")[0].lower() if routing else None, api_key)
+    with _SHARED_RATE_LIMITER_LOCK:
+        if key not in _SHARED_RATE_LIMITERS:
+            _SHARED_RATE_LIMITERS[key] = RateLimiter.from_json()
+        return _SHARED_RATE_LIMITERS[key]
@@ -0,0 +1,154 @@
+# api_clients/riot_client/retry_scheduler.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import random
+import logging
+import threading
+from collections import deque
+
+# local imports
+from .rate_limiter import SystemClock
+
+RETRY_SERVER_ERROR = "server_error"     # 5XX
+RETRY_RATE_LIMITED = "rate_limited"     # 429, paced by the rate limiter's Retry-After hold
+RETRY_CONNECTION = "connection"         # connection reset / timeout, no response at all
+
+# decorrelated jitter: delay = min(cap, uniform(base, previous_delay * 3))
+# 429s wait out the Retry-After hold plus up to `jitter` of it so requeued calls do not fire in one burst
+RETRY_POLICIES = {
+    RETRY_SERVER_ERROR: {"base": 1.0, "cap": 30.0},
+    RETRY_CONNECTION: {"base": 0.5, "cap": 10.0},
+    RETRY_RATE_LIMITED: {"jitter": 0.1, "max_jitter": 1.0},
+}
+
+DEFAULT_BUDGET_RATIO = 0.1      # retries may add at most 10% on top of first attempts ...
+DEFAULT_MIN_RETRIES = 10        # ... plus this many per window so a quiet process can still retry
+DEFAULT_BUDGET_WINDOW = 10.0    # seconds of traffic the budget is computed over
+
+
+class RetryScheduler:
+    """
+    [info] Central retry policy shared by APIQueue, AsyncRiotClient and the riot_client/services loops
+
+    Decides whether a failed call is retried and after how long: 5XX and connection errors back off
+    with decorrelated jitter, 429s wait out the limiter's Retry-After hold plus a little jitter. A retry
+    budget caps retries at a percentage of recent traffic, so a degraded endpoint fails fast instead
+    of every caller retrying in lock-step and triggering more 429s. APIQueue parks delayed retries on
+    its per-priority ready-time heaps, the blocking service wrappers sleep for the returned delay.
+    """
+    def __init__(self, policies: dict = None, budget_ratio: float = DEFAULT_BUDGET_RATIO, min_retries: int = DEFAULT_MIN_RETRIES, budget_window: float = DEFAULT_BUDGET_WINDOW, clock=None) -> None:
+        """
+        [info] Initialize retry policies and budget
+        [param] policies: Dictionary of retry kind -> policy settings (default: RETRY_POLICIES)
+        [param] budget_ratio: Max retries as a fraction of first attempts within the window (default: 0.1)
+        [param] min_retries: Retries always allowed per window on top of the ratio (default: 10)
+        [param] budget_window: Sliding window in seconds (default: 10.0)
+        [param] clock: Clock providing time() (default: SystemClock, use VirtualClock for tests)
+        [return] None
+        """
+        self.policies = policies if policies else RETRY_POLICIES
+        self.budget_ratio = budget_ratio
+        self.min_retries = min_retries
+        self.budget_window = budget_window
+        self.clock = clock if clock else SystemClock()
+        self.lock = threading.Lock()
+        self.requests = deque()     # timestamps of first attempts
+        self.retries = deque()      # timestamps of budgeted retries
+        self.denied = 0
+        self.scheduled = {kind: 0 for kind in self.policies}
+
+    @staticmethod
+    def classify(status_code: int = None, error: Exception = None) -> str:
+        """
+        [info] Retry kind of a failed call
+        [param] status_code: HTTP status of the response (None if no response was received)
+        [param] error: Exception raised by the call, if any
+        [return] server_error / rate_limited / connection, or None if the failure is not retryable (ex. 404)
+        """
+        if status_code is None:
+            return RETRY_CONNECTION
+        if status_code == 429:
+            return RETRY_RATE_LIMITED
+        if 500 <= status_code < 600:
+            return RETRY_SERVER_ERROR
+        return None
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.budget_window
+        for timestamps in (self.requests, self.retries):
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+
+    def record_request(self) -> None:
+        """
+        [info] Count a first attempt towards the traffic the retry budget is based on
+        [return] None
+        """
+        with self.lock:
+            now = self.clock.time()
+            self._expire(now)
+            self.requests.append(now)
+
+    def next_delay(self, kind: str, previous_delay: float = None, retry_after: float = 0.0) -> float:
+        """
+        [info] Delay before the next attempt, or None if the retry budget is exhausted
+        [param] kind: Retry kind from classify()
+        [param] previous_delay: Delay used before the previous attempt of this call (default: None, first retry)
+        [param] retry_after: Rate limiter hold for 429s in seconds (default: 0.0)
+        [return] Seconds to wait before retrying, or None to give up
+        """
+        policy = self.policies[kind]
+        if kind == RETRY_RATE_LIMITED:
+            # 429s are paced by Retry-After and do not spend the budget, only spread them out
+            with self.lock:
+                self.scheduled[kind] += 1
+            return retry_after + random.uniform(0, min(policy["max_jitter"], retry_after * policy["jitter"]))
+
+        with self.lock:
+            now = self.clock.time()
+            self._expire(now)
+            if len(self.retries) >= self.min_retries + self.budget_ratio * len(self.requests):
+                self.denied += 1
+                logging.warning(f"[RetryScheduler] Retry budget exhausted ({len(self.retries)} retries / {len(self.requests)} requests in {self.budget_window:.0f}s), not retrying {kind}")
+                return None
+            self.retries.append(now)
+            self.scheduled[kind] += 1
+
+        base, cap = policy["base"], policy["cap"]
+        return min(cap, random.uniform(base, max(base, (previous_delay or base) * 3)))
+
+    def stats(self) -> dict:
+        """
+        [info] Retry counters for logging
+        [return] Dictionary of retries per kind, denied retries and current window traffic
+        """
+        with self.lock:
+            self._expire(self.clock.time())
+            return {
+                "scheduled": dict(self.scheduled),
+                "denied": self.denied,
+                "window_requests": len(self.requests),
+                "window_retries": len(self.retries),
+            }
+
+
+##############################
+### SHARED RETRY SCHEDULER ###
+##############################
+_SHARED_RETRY_SCHEDULER = None
+_SHARED_RETRY_SCHEDULER_LOCK = threading.Lock()
+
+def get_retry_scheduler() -> RetryScheduler:
+    """
+    [info] Process-wide retry scheduler (one retry budget across every Riot call)
+    [return] Shared RetryScheduler instance
+    """
+    global _SHARED_RETRY_SCHEDULER
+    with _SHARED_RETRY_SCHEDULER_LOCK:
+        if _SHARED_RETRY_SCHEDULER is None:
+            _SHARED_RETRY_SCHEDULER = RetryScheduler()
+        return _SHARED_RETRY_SCHEDULER
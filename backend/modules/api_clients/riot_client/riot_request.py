@@ -0,0 +1,142 @@
+# api_clients/riot_client/riot_request.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import time
+import logging
+import requests
+from urllib.parse import urlencode
+
+# local imports
+from .key_pool import get_key_pool, RETIRE_STATUS_CODES, MAX_KEY_ROTATIONS
+from .http_session import get_session_pool
+from .retry_scheduler import get_retry_scheduler, RETRY_RATE_LIMITED
+from .services import update_sys_path
+update_sys_path()
+from config.config import get_riot_api_config
+from modules.utils.circuit_breaker import get_riot_circuit_breaker
+
+MAX_RETRY_ATTEMPTS = int(get_riot_api_config("MAX_RETRY_ATTEMPTS", "3"))
+
+
+class RiotRetryPolicy:
+    """
+    [info] Per-call retry / circuit breaker bookkeeping shared by riot_get and AsyncRiotClient
+
+    One instance follows one logical call across its attempts: allow() gates each attempt on the
+    endpoint's circuit breaker and the attempt cap, failed() decides how long to wait before the next
+    one (Retry-After hold for 429s, immediately after a key was retired up to MAX_KEY_ROTATIONS times,
+    jittered backoff for 5XX / connection errors) or whether to give up. The sync and async loops only differ in how they sleep.
+
+    Usage:
+        policy = RiotRetryPolicy(region, method, caller)
+        while policy.allow():
+            ...send...
+            delay = policy.failed(status_code, hold, can_rotate_key)
+            if delay is None: break
+            time.sleep(delay)
+    """
+    def __init__(self, region: str, method: str, caller: str, max_attempts: int = MAX_RETRY_ATTEMPTS) -> None:
+        """
+        [info] Start tracking a call (counts it towards the shared retry budget)
+        [param] region: Routing value (ex. americas, na1)
+        [param] method: Rate limit method path template
+        [param] caller: Name of calling wrapper for log messages
+        [param] max_attempts: Max retries of 5XX / connection errors (default: MAX_RETRY_ATTEMPTS from config/api.env)
+        [return] None
+        """
+        self.method = method
+        self.caller = caller
+        self.max_attempts = max_attempts
+        self.retry_scheduler = get_retry_scheduler()
+        self.breaker = get_riot_circuit_breaker(region, method)
+        self.retries = 0
+        self.key_rotations = 0
+        self.retry_delay = None
+        self.retry_scheduler.record_request()
+
+    def allow(self) -> bool:
+        """
+        [info] Check whether another attempt may be sent
+        [return] False once retries are exhausted or the endpoint's circuit is open
+        """
+        if self.retries >= self.max_attempts:
+            logging.error(f"[{self.caller}] Failed after {self.max_attempts} attempts")
+            return False
+        if not self.breaker.allow():                                # endpoint degraded, fail fast instead of burning retries
+            logging.error(f"[{self.caller}] Circuit open for {self.method}, retry in {self.breaker.retry_after():.0f}s")
+            return False
+        return True
+
+    def succeeded(self) -> None:
+        # closes a half-open circuit
+        self.breaker.record_success()
+
+    def failed(self, status_code: int, hold: float = 0.0, can_rotate_key: bool = False, error: Exception = None) -> float:
+        """
+        [info] Account for a failed attempt and pick the wait before the next one
+        [param] status_code: HTTP status of the response (None if no response was received)
+        [param] hold: Seconds the rate limiter holds the call's scope (from observe_response)
+        [param] can_rotate_key: The attempt's key was retired by the pool and another pooled key is available
+        [param] error: Exception raised by the attempt, if any (for log messages)
+        [return] Seconds to wait before retrying (0.0 = right away), or None to give up
+        """
+        retry_kind = self.retry_scheduler.classify(status_code, error)
+        if retry_kind == RETRY_RATE_LIMITED:                        # rate limit exceeded, says nothing about endpoint health
+            self.breaker.release_trial()
+            return self.retry_scheduler.next_delay(retry_kind, retry_after=hold)  # Retry-After hold + jitter so callers don't wake in lock-step
+        if status_code in RETIRE_STATUS_CODES and can_rotate_key and self.key_rotations < MAX_KEY_ROTATIONS:
+            self.key_rotations += 1                                 # key retired by the pool, retry with the next one
+            self.breaker.release_trial()
+            return 0.0
+        if retry_kind is None:                                      # 4XX, retrying won't help
+            self.breaker.record_success()                           # endpoint answered, the request itself is bad
+            logging.error(f"[{self.caller}] ({status_code}) Request failed, not retryable: {error if error else self.method}")
+            return None
+        self.breaker.record_failure()                               # 5XX / connection error counts towards opening the circuit
+        self.retry_delay = self.retry_scheduler.next_delay(retry_kind, self.retry_delay)
+        if self.retry_delay is None:                                # retry budget exhausted, fail fast
+            logging.error(f"[{self.caller}] ({status_code}) Retry budget exhausted, giving up: {error if error else self.method}")
+            return None
+        self.retries += 1
+        logging.warning(f"[{self.caller}] [{retry_kind} - {status_code}] retrying in {self.retry_delay:.2f}s... ({self.retries}/{self.max_attempts})")
+        return self.retry_delay
+
+
+def riot_get(api_url: str, method: str, region: str, caller: str, params: dict = None, decode=None) -> tuple:
+    """
+    [info] Rate limited GET with 5XX / 429 retries through the shared key pool and the endpoint's circuit breaker
+    [param] api_url: Full request URL
+    [param] method: Rate limit method path template
+    [param] region: Routing value (ex. americas, na1)
+    [param] caller: Name of calling wrapper for log messages
+    [param] params: Extra query parameters (api_key is added automatically)
+    [param] decode: Function (response) -> parsed body, ex. lambda response: fast_loads(response.content) (default: response.json())
+    [return] Tuple of (status_code, json) or None if failed
+    """
+    key_pool = get_key_pool()
+    session_pool = get_session_pool()
+    policy = RiotRetryPolicy(region, method, caller)
+    while policy.allow():
+        api_key, response, hold = None, None, 0.0                   # response stays None if the connection itself fails
+        try:
+            api_key = key_pool.acquire(region, method)              # key with the most headroom, waits for its app + method capacity
+            response = session_pool.get(api_url, params=urlencode(dict(params or {}, api_key=api_key))) # make the request w/ API (pooled connection)
+            hold = key_pool.observe_response(api_key, region, method, response.status_code, response.headers) # sync the key's buckets w/ Riot's rate limit headers
+            response.raise_for_status()                             # check for any errors
+            policy.succeeded()
+            return response.status_code, decode(response) if decode else response.json() # return the json response
+        except requests.exceptions.RequestException as e:
+            status_code = response.status_code if response is not None else None
+            can_rotate_key = api_key is not None and key_pool.is_retired(api_key) and bool(key_pool.active_keys())
+            delay = policy.failed(status_code, hold, can_rotate_key, e)
+            if delay is None:
+                return None
+            time.sleep(delay)
+        except ValueError as e:                                     # truncated / malformed body from a custom decoder, retrying won't help
+            logging.error(f"[{caller}] ({response.status_code}) Issue decoding response: {e}")
+            return None
+    return None
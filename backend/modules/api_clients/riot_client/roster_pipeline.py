@@ -0,0 +1,247 @@
+# api_clients/riot_client/roster_pipeline.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import os
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# local imports
+from .services import update_sys_path
+update_sys_path()
+from modules.api_clients.riot_client.services.account_v1 import ACCOUNT_V1, DEFAULT_REGION_CODE
+from modules.api_clients.riot_client.services.summoner_v4 import SUMMONER_V4, DEFAULT_REGION_EXECUTION
+from modules.utils.file_utils import load_json_from_file
+from models.account_dto import AccountDTO
+
+GCS_TEAMS_FILE = "constants/gcsTeams.json"     # relative to backend/
+DEFAULT_ROSTER_WORKERS = 16                    # in-flight lookups, the shared key pool / rate limiters set the real pace
+EMPTY_VALUES = ("", "%", "NAME#TAG")           # placeholders used in gcsTeams.json for "not resolved yet"
+
+
+def as_list(value) -> list:
+    """
+    [info] Normalize a gcsTeams.json account field to a list (one entry per account)
+    [param] value: List, "a#1|b#2" string, single string or placeholder ("%" / "")
+    [return] List of values, empty if the field is a placeholder
+    """
+    if isinstance(value, list):
+        values = value
+    elif isinstance(value, str):
+        values = value.split("|")
+    else:
+        values = []
+    return [entry for entry in values if entry not in EMPTY_VALUES]
+
+
+class RosterPipeline:
+    """
+    [info] Concurrent roster resolution for every team in gcsTeams.json
+
+    Each account is a small dependency chain: Riot ID -> PUUID (ACCOUNT_V1, only for accounts
+    without one), then PUUID -> current Riot ID (ACCOUNT_V1) and PUUID -> summoner / account IDs
+    (SUMMONER_V4) in parallel. Every chain is started up front on one thread pool and follow-up
+    lookups are submitted the moment their PUUID is known, so all teams share the Riot budget and a
+    refresh takes roughly as long as the rate limits allow. Nothing is written until every lookup
+    has finished, then gcsTeams.json is replaced in a single atomic write. Accounts whose lookups
+    fail keep their previous values.
+
+    Usage:
+        report = RosterPipeline().run()
+        report = RosterPipeline().run(team_ids=["V8"], dry_run=True)
+    """
+    def __init__(self, teams_file: str = GCS_TEAMS_FILE, max_workers: int = DEFAULT_ROSTER_WORKERS, region: str = DEFAULT_REGION_CODE, platform: str = DEFAULT_REGION_EXECUTION) -> None:
+        """
+        [info] Initialize the pipeline
+        [param] teams_file: Teams json to resolve and rewrite (default: constants/gcsTeams.json)
+        [param] max_workers: Concurrent lookups (default: 16)
+        [param] region: Routing value for ACCOUNT_V1 (default: configured region, americas)
+        [param] platform: Routing value for SUMMONER_V4 (default: configured region execution, na1)
+        [return] None
+        """
+        self.teams_file = teams_file
+        self.max_workers = max_workers
+        self.region = region
+        self.platform = platform
+        self.lock = threading.Lock()
+        self.futures = []
+
+    def _submit(self, executor, fn, *args) -> None:
+        """
+        [info] Submit a pipeline stage and track its future
+        [param] executor: ThreadPoolExecutor
+        [param] fn: Stage function
+        [return] None
+        """
+        with self.lock:
+            self.futures.append(executor.submit(fn, *args))
+
+    def _resolve_puuid(self, executor, account: dict) -> None:
+        """
+        [info] Stage 1: Riot ID -> PUUID, then fan out stage 2 for the account
+        [param] executor: ThreadPoolExecutor running the pipeline
+        [param] account: Account record (riot_id, puuid, results, errors)
+        [return] None
+        """
+        game_name, _, tag_line = account["riot_id"].partition("#")
+        response = ACCOUNT_V1.get_account_by_riot_id(game_name, tag_line, region=self.region)
+        if not response:
+            account["errors"].append(f"puuid lookup failed for {account['riot_id']}")
+            return
+        account["puuid"] = AccountDTO.from_json(response[1]).puuid
+        self._fan_out(executor, account)
+
+    def _fan_out(self, executor, account: dict) -> None:
+        """
+        [info] Stage 2: PUUID-keyed lookups, independent of each other
+        [param] executor: ThreadPoolExecutor running the pipeline
+        [param] account: Account record with a resolved PUUID
+        [return] None
+        """
+        self._submit(executor, self._resolve_riot_id, account)
+        self._submit(executor, self._resolve_summoner_ids, account)
+
+    def _resolve_riot_id(self, account: dict) -> None:
+        """
+        [info] PUUID -> current Riot ID (players rename between splits)
+        [param] account: Account record with a resolved PUUID
+        [return] None
+        """
+        response = ACCOUNT_V1.get_account_by_puuid(account["puuid"], region=self.region)
+        if not response:
+            account["errors"].append(f"riot id lookup failed for {account['puuid']}")
+            return
+        account_dto = AccountDTO.from_json(response[1])
+        account["new_riot_id"] = f"{account_dto.gameName}#{account_dto.tagLine}"
+
+    def _resolve_summoner_ids(self, account: dict) -> None:
+        """
+        [info] PUUID -> encrypted summoner / account IDs
+        [param] account: Account record with a resolved PUUID
+        [return] None
+        """
+        response = SUMMONER_V4.get_summoner_info_by_puuid(account["puuid"], region=self.platform)
+        if not response:
+            account["errors"].append(f"summoner lookup failed for {account['puuid']}")
+            return
+        account["summoner_id"] = response[1].get("id")         # no longer returned by Riot for every key, keep the old value then
+        account["account_id"] = response[1].get("accountId")
+
+    @staticmethod
+    def _accounts(team_id: str, player_idx: int, player: dict) -> list:
+        """
+        [info] Account records of a player (one per Riot ID / PUUID)
+        [param] team_id: Team key in gcsTeams.json
+        [param] player_idx: Index of the player in the team's roster
+        [param] player: Roster entry
+        [return] List of account records
+        """
+        riot_ids = as_list(player.get("player_riot_id"))
+        puuids = as_list(player.get("player_puuid"))
+        summoner_ids = as_list(player.get("player_encrypted_summoner_id"))
+        account_ids = as_list(player.get("player_encrypted_account_id"))
+        count = len(puuids) if puuids else len(riot_ids)
+        return [
+            {
+                "team_id": team_id, "player_idx": player_idx, "account_idx": idx,
+                "riot_id": riot_ids[idx] if idx < len(riot_ids) else None,
+                "puuid": puuids[idx] if puuids else None,
+                "old_summoner_id": summoner_ids[idx] if idx < len(summoner_ids) else None,
+                "old_account_id": account_ids[idx] if idx < len(account_ids) else None,
+                "new_riot_id": None, "summoner_id": None, "account_id": None, "errors": [],
+            }
+            for idx in range(count)
+        ]
+
+    def run(self, team_ids: list = None, dry_run: bool = False) -> dict:
+        """
+        [info] Resolve every roster account concurrently and commit the results in one write
+        [param] team_ids: Only resolve these teams (default: None, every team in the file)
+        [param] dry_run: Resolve and report without writing the teams file (default: False)
+        [return] Dictionary with changes (list of change strings), errors, accounts and elapsed seconds
+        """
+        start = time.monotonic()
+        teams = load_json_from_file(self.teams_file)
+        accounts = []
+        for team_id, team in teams.items():
+            if team_ids and team_id not in team_ids:
+                continue
+            for player_idx, player in enumerate(team.get("rosters", [])):
+                player_accounts = self._accounts(team_id, player_idx, player)
+                if not player_accounts:
+                    logging.warning(f"[RosterPipeline] {team_id} player {player_idx} has no Riot ID or PUUID, skipped")
+                accounts.extend(player_accounts)
+
+        self.futures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="roster-pipeline") as executor:
+            for account in accounts:
+                if account["puuid"]:
+                    self._fan_out(executor, account)
+                elif account["riot_id"]:
+                    self._submit(executor, self._resolve_puuid, executor, account)
+            # stage 1 futures add stage 2 futures while running, wait until no new ones appear
+            waited = 0
+            while True:
+                with self.lock:
+                    pending = self.futures[waited:]
+                    waited = len(self.futures)
+                if not pending:
+                    break
+                for future in wait(pending).done:
+                    if future.exception():
+                        logging.error(f"[RosterPipeline] Lookup crashed: {future.exception()}")
+
+        changes = self._merge(teams, accounts)
+        errors = [f"[{account['team_id']}] {error}" for account in accounts for error in account["errors"]]
+        if changes and not dry_run:
+            self._save(teams)
+        report = {"changes": changes, "errors": errors, "accounts": len(accounts), "elapsed": time.monotonic() - start}
+        logging.info(f"[RosterPipeline] Resolved {len(accounts)} accounts in {report['elapsed']:.1f}s, {len(changes)} changes, {len(errors)} errors")
+        return report
+
+    @staticmethod
+    def _merge(teams: dict, accounts: list) -> list:
+        """
+        [info] Write resolved values back into the roster entries (failed lookups keep the old value)
+        [param] teams: Loaded gcsTeams.json content (modified in place)
+        [param] accounts: Resolved account records
+        [return] List of change strings (ex. "[V8] old#NA1 ~> new#NA1")
+        """
+        players = {}
+        for account in accounts:
+            players.setdefault((account["team_id"], account["player_idx"]), []).append(account)
+
+        changes = []
+        for (team_id, player_idx), player_accounts in players.items():
+            player = teams[team_id]["rosters"][player_idx]
+            fields = {
+                "player_puuid": [account["puuid"] for account in player_accounts],
+                "player_riot_id": [account["new_riot_id"] or account["riot_id"] for account in player_accounts],
+                "player_encrypted_summoner_id": [account["summoner_id"] or account["old_summoner_id"] for account in player_accounts],
+                "player_encrypted_account_id": [account["account_id"] or account["old_account_id"] for account in player_accounts],
+            }
+            for field, values in fields.items():
+                if None in values:
+                    continue    # an account is still unresolved, keep the field as it was
+                old_values = as_list(player.get(field))
+                if values != old_values:
+                    changes.append(f"[{team_id}] {field}: {old_values or '%'} ~> {values}")
+                    player[field] = values
+        return changes
+
+    def _save(self, teams: dict) -> None:
+        """
+        [info] Atomically replace the teams file
+        [param] teams: Updated gcsTeams.json content
+        [return] None
+        """
+        tmp_path = f"{self.teams_file}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(teams, f, indent=4)
+        os.replace(tmp_path, self.teams_file)
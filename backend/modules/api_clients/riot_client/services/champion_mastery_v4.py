@@ -0,0 +1,86 @@
+###############
+### IMPORTS ###
+###############
+
+# system imports
+from concurrent.futures import ThreadPoolExecutor
+
+# local imports
+from . import update_sys_path
+update_sys_path()
+from config.config import get_riot_api_config
+from modules.api_clients.riot_client.riot_request import riot_get
+from modules.api_clients.riot_client.single_flight import coalesce_calls
+
+# access API Environment Variables
+DEFAULT_REGION_EXECUTION = get_riot_api_config("DEFAULT_REGION_EXECUTION", "na1") # NA1
+
+DEFAULT_BATCH_WORKERS = 8     # concurrent lookups in batch helpers (the key pool's limiters still pace them)
+
+###########################
+### CHAMPION_MASTERY_V4 ###
+###########################
+class CHAMPION_MASTERY_V4:
+    """
+    [info] Riot Champion Mastery API v4 wrapper for fetching champion mastery points / levels
+    """
+
+    @staticmethod
+    @coalesce_calls("champion-mastery-v4:by-puuid")
+    def get_champion_masteries_by_puuid(puuid: str, region: str = DEFAULT_REGION_EXECUTION) -> list:
+        """
+        [info] Access every champion mastery of a player by their PUUID from CHAMPION_MASTERY_V4 API Portal
+        [param] puuid: Player's unique identifier
+        [param] region: Region execution code for API request (default: configured region)
+        [return] Tuple of (status_code, masteries_json) with a ChampionMasteryDTO list sorted by points, or None if failed
+        """
+        api_url = f"https://{region}.api.riotgames.com/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}"
+        method = "/lol/champion-mastery/v4/champion-masteries/by-puuid/{encryptedPUUID}"
+        return riot_get(api_url, method, region, "get_champion_masteries_by_puuid")
+
+    @staticmethod
+    @coalesce_calls("champion-mastery-v4:by-champion")
+    def get_champion_mastery_by_puuid_and_champion(puuid: str, champion_id: int, region: str = DEFAULT_REGION_EXECUTION) -> dict:
+        """
+        [info] Access a player's mastery of one champion from CHAMPION_MASTERY_V4 API Portal
+        [param] puuid: Player's unique identifier
+        [param] champion_id: Champion key (ex. 266 for Aatrox, see Constants.get_champion_name)
+        [param] region: Region execution code for API request (default: configured region)
+        [return] Tuple of (status_code, mastery_json) containing a ChampionMasteryDTO, or None if failed / never played
+        """
+        api_url = f"https://{region}.api.riotgames.com/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/by-champion/{champion_id}"
+        method = "/lol/champion-mastery/v4/champion-masteries/by-puuid/{encryptedPUUID}/by-champion/{championId}"
+        return riot_get(api_url, method, region, "get_champion_mastery_by_puuid_and_champion")
+
+    @staticmethod
+    @coalesce_calls("champion-mastery-v4:top")
+    def get_top_champion_masteries_by_puuid(puuid: str, count: int = 3, region: str = DEFAULT_REGION_EXECUTION) -> list:
+        """
+        [info] Access a player's highest mastery champions from CHAMPION_MASTERY_V4 API Portal
+        [param] puuid: Player's unique identifier
+        [param] count: Number of champions to return (default: 3)
+        [param] region: Region execution code for API request (default: configured region)
+        [return] Tuple of (status_code, masteries_json) with the top ChampionMasteryDTO list, or None if failed
+        """
+        api_url = f"https://{region}.api.riotgames.com/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/top"
+        method = "/lol/champion-mastery/v4/champion-masteries/by-puuid/{encryptedPUUID}/top"
+        return riot_get(api_url, method, region, "get_top_champion_masteries_by_puuid", params={'count': count})
+
+    @staticmethod
+    def get_champion_masteries_by_puuids(puuids: list, top: int = None, region: str = DEFAULT_REGION_EXECUTION, max_workers: int = DEFAULT_BATCH_WORKERS) -> dict:
+        """
+        [info] Fetch champion masteries for many players at once (ex. a team's champion pools)
+        [param] puuids: List of player PUUIDs
+        [param] top: Only fetch each player's top N champions (default: None, every champion)
+        [param] region: Region execution code for API request (default: configured region)
+        [param] max_workers: Concurrent lookups, paced by the shared key pool / rate limiters (default: 8)
+        [return] Dictionary of puuid -> (status_code, masteries_json) or None if that lookup failed
+        """
+        def fetch(puuid: str):
+            if top:
+                return CHAMPION_MASTERY_V4.get_top_champion_masteries_by_puuid(puuid, count=top, region=region)
+            return CHAMPION_MASTERY_V4.get_champion_masteries_by_puuid(puuid, region=region)
+
+        puuids = list(dict.fromkeys(puuids))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="champion-mastery-v4") as executor:
+            return dict(zip(puuids, executor.map(fetch, puuids)))
@@ -0,0 +1,103 @@
+###############
+### IMPORTS ###
+###############
+
+# system imports
+from concurrent.futures import ThreadPoolExecutor
+
+# local imports
+from . import update_sys_path
+update_sys_path()
+from config.config import get_riot_api_config
+from modules.api_clients.riot_client.riot_request import riot_get
+from modules.api_clients.riot_client.single_flight import coalesce_calls
+
+# access API Environment Variables
+DEFAULT_REGION_EXECUTION = get_riot_api_config("DEFAULT_REGION_EXECUTION", "na1") # NA1
+
+RANKED_SOLO_QUEUE = "RANKED_SOLO_5x5"
+RANKED_FLEX_QUEUE = "RANKED_FLEX_SR"
+APEX_TIERS = ("MASTER", "GRANDMASTER", "CHALLENGER")  # single division, shown without one
+DIVISIONS = {"I": "1", "II": "2", "III": "3", "IV": "4"}
+DEFAULT_BATCH_WORKERS = 8     # concurrent lookups in batch helpers (the key pool's limiters still pace them)
+
+#################
+### LEAGUE_V4 ###
+#################
+class LEAGUE_V4:
+    """
+    [info] Riot League API v4 wrapper for fetching ranked entries (tier, division, LP, wins / losses)
+    """
+
+    @staticmethod
+    @coalesce_calls("league-v4:by-puuid")
+    def get_league_entries_by_puuid(puuid: str, region: str = DEFAULT_REGION_EXECUTION) -> list:
+        """
+        [info] Access a player's ranked entries (one per ranked queue) by their PUUID from LEAGUE_V4 API Portal
+        [param] puuid: Player's unique identifier
+        [param] region: Region execution code for API request (default: configured region)
+        [return] Tuple of (status_code, entries_json) with a LeagueEntryDTO list (empty if unranked), or None if failed
+        """
+        api_url = f"https://{region}.api.riotgames.com/lol/league/v4/entries/by-puuid/{puuid}"
+        method = "/lol/league/v4/entries/by-puuid/{encryptedPUUID}"
+        return riot_get(api_url, method, region, "get_league_entries_by_puuid")
+
+    @staticmethod
+    @coalesce_calls("league-v4:by-summoner")
+    def get_league_entries_by_summoner(summoner_id: str, region: str = DEFAULT_REGION_EXECUTION) -> list:
+        """
+        [info] Access a player's ranked entries by their encrypted summoner ID from LEAGUE_V4 API Portal
+        [param] summoner_id: Encrypted summoner ID (see SUMMONER_V4.get_summoner_info_by_puuid)
+        [param] region: Region execution code for API request (default: configured region)
+        [return] Tuple of (status_code, entries_json) with a LeagueEntryDTO list (empty if unranked), or None if failed
+        """
+        api_url = f"https://{region}.api.riotgames.com/lol/league/v4/entries/by-summoner/{summoner_id}"
+        method = "/lol/league/v4/entries/by-summoner/{encryptedSummonerId}"
+        return riot_get(api_url, method, region, "get_league_entries_by_summoner")
+
+    @staticmethod
+    def get_league_entries_by_puuids(puuids: list, region: str = DEFAULT_REGION_EXECUTION, max_workers: int = DEFAULT_BATCH_WORKERS) -> dict:
+        """
+        [info] Fetch ranked entries for many players at once (ex. every rostered account before a tournament day)
+        [param] puuids: List of player PUUIDs
+        [param] region: Region execution code for API request (default: configured region)
+        [param] max_workers: Concurrent lookups, paced by the shared key pool / rate limiters (default: 8)
+        [return] Dictionary of puuid -> (status_code, entries_json) or None if that lookup failed
+        """
+        puuids = list(dict.fromkeys(puuids))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="league-v4") as executor:
+            results = executor.map(lambda puuid: LEAGUE_V4.get_league_entries_by_puuid(puuid, region=region), puuids)
+            return dict(zip(puuids, results))
+
+    @staticmethod
+    def get_current_rank(entries: list, queue: str = RANKED_SOLO_QUEUE) -> tuple:
+        """
+        [info] Summarize a player's rank in one queue, same shape as LeagueOfGraphsScraper.scrape_player_current_rank
+        [param] entries: LeagueEntryDTO list from get_league_entries_by_puuid / by_summoner
+        [param] queue: Ranked queue type (default: RANKED_SOLO_5x5)
+        [return] tuple: (rank_string, wins, losses, winrate) ex. ("Gold 2 45 LP", 30, 25, 54.55), ("UNRANKED", "0", "0", "0") if unranked
+        """
+        entry = next((entry for entry in entries or [] if entry.get("queueType") == queue), None)
+        if entry is None:
+            return "UNRANKED", "0", "0", "0"
+        tier = entry["tier"].title()
+        if entry["tier"] not in APEX_TIERS:
+            tier += " " + DIVISIONS.get(entry["rank"], entry["rank"])
+        wins, losses = entry.get("wins", 0), entry.get("losses", 0)
+        winrate = round(wins / (wins + losses) * 100, 2) if wins + losses else 0
+        return f"{tier} {entry.get('leaguePoints', 0)} LP", wins, losses, winrate
+
+    @staticmethod
+    def get_current_ranks_by_puuids(puuids: list, queue: str = RANKED_SOLO_QUEUE, region: str = DEFAULT_REGION_EXECUTION, max_workers: int = DEFAULT_BATCH_WORKERS) -> dict:
+        """
+        [info] Batched rank refresh, API replacement for scraping League of Graphs one profile at a time
+        [param] puuids: List of player PUUIDs
+        [param] queue: Ranked queue type (default: RANKED_SOLO_5x5)
+        [param] region: Region execution code for API request (default: configured region)
+        [param] max_workers: Concurrent lookups (default: 8)
+        [return] Dictionary of puuid -> (rank_string, wins, losses, winrate), (-1, -1, -1, -1) if the lookup failed
+        """
+        ranks = {}
+        for puuid, result in LEAGUE_V4.get_league_entries_by_puuids(puuids, region, max_workers).items():
+            ranks[puuid] = LEAGUE_V4.get_current_rank(result[1], queue) if result else (-1, -1, -1, -1)
+        return ranks
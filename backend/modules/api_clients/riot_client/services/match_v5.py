@@ -3,18 +3,30 @@
 ###############
 
 # system imports
-import requests
-from urllib.parse import urlencode
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # local imports
 from . import update_sys_path 
 update_sys_path()
 from config.config import get_riot_api_config
-from modules.utils.time_utils import get_current_epoch_timestamp, get_epoch_timestamp
+from modules.api_clients.riot_client.riot_request import riot_get
+from modules.api_clients.riot_client.single_flight import coalesce_calls
+from modules.api_clients.riot_client.match_cache import get_match_cache
+from modules.utils.json_projection import fast_loads, as_projection
+from modules.utils.time_utils import get_current_epoch_timestamp, get_epoch_timestamp, get_time_windows
 
 # access API Environment Variables
-RIOT_API_KEY = get_riot_api_config("RIOT_API_KEY")
-DEFAULT_REGION_CODE = get_riot_api_config("DEFAULT_REGION_CODE")
+DEFAULT_REGION_CODE = get_riot_api_config("DEFAULT_REGION_CODE", "americas")
+
+MAX_MATCH_IDS_PER_PAGE = 100     # MATCH_V5 by-puuid/ids hard cap on count
+
+
+class IncompleteMatchListError(RuntimeError):
+    """
+    [info] Raised by iter_match_ids_by_puuid(raise_on_error=True) when a page request fails mid-walk,
+    so callers can tell a truncated listing from a player's complete history
+    """
 
 ################
 ### MATCH_V5 ###
@@ -25,13 +37,14 @@ class MATCH_V5:
     """
     
     @staticmethod
+    @coalesce_calls("match-v5:ids-by-puuid")
     def get_match_ids_by_puuid(puuid: str, startTime: int = None, endTime: int = None, queue: int = None, type: str = None, start: int = None, count: int = None, region: str = DEFAULT_REGION_CODE) -> list:
         """
         [info] Access match IDs by player PUUID from MATCH_V5 API Portal
         [param] puuid: Player's unique identifier to lookup match history
         [param] startTime: Epoch timestamp in seconds (starts June 16th, 2021)
         [param] endTime: Epoch timestamp in seconds (default: current time)
-        [param] queue: Filter by queue ID (see queues.json)
+        [param] queue: Filter by queue ID, see queues.json (default: 420, ranked solo / duo)
         [param] type: Filter by match type
         [param] start: Start index for pagination (default: 0)
         [param] count: Number of matches to return (default: 20, max: 100)
@@ -50,14 +63,13 @@ class MATCH_V5:
         if not start:
             start = 0
 
-        if not queue:
-            queue = 420 # ranked solo / duo
+        if queue is None:
+            queue = 420 # ranked solo / duo (0 = custom games is a valid filter)
 
         # if not type:
         #     type = "RANKED_SOLO_5x5"
 
         params = {
-            'api_key': RIOT_API_KEY,
             'puuid': puuid,
             'startTime': startTime,
             'endTime': endTime,
@@ -130,36 +142,121 @@ class MATCH_V5:
         """
 
         api_url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        method = "/lol/match/v5/matches/by-puuid/{puuid}/ids"
 
-        try:
-            response = requests.get(api_url, params=urlencode(params))  # make the request w/ API 
-            response.raise_for_status()                                 # check for any errors
-            return response.status_code, response.json()                # return the json response
-        except requests.exceptions.RequestException as e:
-            print(f"Issue fetching MatchDTO from API: {e}")
-            return None
+        return riot_get(api_url, method, region, "get_match_ids_by_puuid", params=params)
         
     @staticmethod
-    def get_match_by_id(match_id: str, region: str = DEFAULT_REGION_CODE) -> dict:
+    def iter_match_ids_by_puuid(puuid: str, startTime: int = None, endTime: int = None, queue: int = None, page_size: int = MAX_MATCH_IDS_PER_PAGE, window_days: int = None, stop_when=None, max_matches: int = None, prefetch: bool = True, raise_on_error: bool = False, region: str = DEFAULT_REGION_CODE):
+        """
+        [info] Lazily walk a player's match history (newest first), yielding match IDs as pages arrive
+        [param] puuid: Player's unique identifier to lookup match history
+        [param] startTime: Epoch timestamp in seconds, oldest match to include (default: June 17th, 2021)
+        [param] endTime: Epoch timestamp in seconds, newest match to include (default: current time)
+        [param] queue: Filter by queue ID (default: 420, ranked solo / duo)
+        [param] page_size: Match IDs requested per page (default: 100, max: 100)
+        [param] window_days: Also split [startTime, endTime] into windows of this many days (default: None, one window)
+        [param] stop_when: Predicate called with each match ID, iteration stops before the first ID it returns True for
+        [param] max_matches: Stop after yielding this many match IDs (default: None, no limit)
+        [param] prefetch: Request the next page while the caller is still consuming the current one (default: True)
+        [param] raise_on_error: Raise IncompleteMatchListError instead of stopping quietly when a page request fails (default: False)
+        [param] region: Region code for API request (default: configured region)
+        [return] Generator of match IDs (strings), stops early (or raises, see raise_on_error) if a page request fails
+
+        Usage:
+            for match_id in MATCH_V5.iter_match_ids_by_puuid(puuid, startTime=split_start):
+                MATCH_V5.get_match_by_id(match_id)
+        """
+        if not startTime:
+            startTime = get_epoch_timestamp(6, 17, 2021)
+
+        if not endTime:
+            endTime = get_current_epoch_timestamp()
+
+        page_size = min(page_size, MAX_MATCH_IDS_PER_PAGE)
+        windows = iter(get_time_windows(startTime, endTime, window_days * 24 * 60 * 60 if window_days else None))
+
+        def fetch_page(window: tuple, start: int):
+            return MATCH_V5.get_match_ids_by_puuid(puuid, startTime=window[0], endTime=window[1], queue=queue, start=start, count=page_size, region=region)
+
+        window, page_start = next(windows, None), 0
+        if window is None:                              # empty range (startTime >= endTime)
+            return
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="match-id-prefetch")
+        pending = executor.submit(fetch_page, window, page_start)
+        yielded = 0
+        try:
+            while pending is not None:
+                page = pending.result()
+                pending = None
+                if not page:
+                    if raise_on_error:
+                        raise IncompleteMatchListError(f"Failed to fetch match ID page (window {window}, start {page_start}) for {puuid}")
+                    logging.warning(f"[iter_match_ids_by_puuid] Stopping early, failed to fetch page for {puuid}")
+                    return
+                match_ids = page[1]
+
+                # a full page means more IDs in this window, a short page means move on to the next window
+                next_page = None
+                if len(match_ids) >= page_size:
+                    page_start += page_size
+                    next_page = (window, page_start)
+                else:
+                    window, page_start = next(windows, None), 0
+                    if window is not None:
+                        next_page = (window, page_start)
+
+                if next_page and prefetch:
+                    pending = executor.submit(fetch_page, *next_page)
+
+                for match_id in match_ids:
+                    if stop_when and stop_when(match_id):
+                        return
+                    yield match_id
+                    yielded += 1
+                    if max_matches and yielded >= max_matches:
+                        return
+
+                if next_page and not prefetch:
+                    pending = executor.submit(fetch_page, *next_page)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def get_match_by_id(match_id: str, region: str = DEFAULT_REGION_CODE, use_cache: bool = True, projection=None) -> dict:
         """
         [info] Access detailed match data by match ID from MATCH_V5 API Portal
         [param] match_id: Unique match identifier (string)
         [param] region: Region code for API request (default: configured region)
+        [param] use_cache: Read-through / write-through the on-disk match cache (default: True)
+        [param] projection: Only return these paths, Projection or iterable of paths (ex. MATCH_DRAFT_PROJECTION) (default: None, whole match)
         [return] Tuple of (status_code, match_json) containing MatchDTO, or None if failed
         """
-        params = {
-            'api_key': RIOT_API_KEY
-        }
+        return MATCH_V5._get_match_by_id(match_id, region, use_cache, as_projection(projection))
+
+    @staticmethod
+    @coalesce_calls("match-v5:by-id")
+    def _get_match_by_id(match_id: str, region: str, use_cache: bool, projection) -> dict:
+        # coalesced on a compiled (hashable) Projection, a list of paths would break the single-flight key
+        # finished matches never change, serve from the on-disk cache when possible
+        if use_cache:
+            cached_match = get_match_cache().get(match_id, projection)
+            if cached_match is not None:
+                return 200, cached_match
 
         api_url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/{match_id}"
+        method = "/lol/match/v5/matches/{matchId}"
 
-        try:
-            response = requests.get(api_url, params=urlencode(params))  # make the request w/ API 
-            response.raise_for_status()                                 # check for any errors
-            return response.status_code, response.json()                # return the json response
-        except requests.exceptions.RequestException as e:
-            print(f"Issue fetching MatchDTO from API: {e}")
+        # orjson when installed, stdlib json otherwise (decode errors are logged by riot_get and return None)
+        result = riot_get(api_url, method, region, "get_match_by_id", decode=lambda response: fast_loads(response.content))
+        if result is None:
             return None
+        status_code, match_json = result
+        if use_cache:
+            get_match_cache().put(match_id, match_json)                 # write-through for future runs (whole match)
+        return status_code, projection.apply(match_json) if projection else match_json
         
 
 # (1) Getting a given player’s puuid by their player name.
@@ -2,21 +2,17 @@
 ### IMPORTS ###
 ###############
 
-# system imports
-import requests, time
-from urllib.parse import urlencode
-
 # local imports
 from . import update_sys_path 
 update_sys_path()
 from config.config import get_riot_api_config
+from modules.api_clients.riot_client.riot_request import riot_get
+from modules.api_clients.riot_client.single_flight import coalesce_calls
+from modules.api_clients.riot_client.ttl_cache import get_lookup_cache
 
 # access API Environment Variables
-RIOT_API_KEY = get_riot_api_config("RIOT_API_KEY")
-DEFAULT_REGION_CODE = get_riot_api_config("DEFAULT_REGION_CODE") # americas
-DEFAULT_REGION_EXECUTION = get_riot_api_config("DEFAULT_REGION_EXECUTION") # NA1
-MAX_RETRY_ATTEMPTS = int(get_riot_api_config("MAX_RETRY_ATTEMPTS"))
-RETRY_DELAY = int(get_riot_api_config("RETRY_DELAY"))
+DEFAULT_REGION_CODE = get_riot_api_config("DEFAULT_REGION_CODE", "americas") # americas
+DEFAULT_REGION_EXECUTION = get_riot_api_config("DEFAULT_REGION_EXECUTION", "na1") # NA1
 
 ###################
 ### SUMMONER_V4 ###
@@ -27,37 +23,29 @@ class SUMMONER_V4:
     """
 
     @staticmethod   
-    def get_summoner_info_by_puuid(puuid: str = None, region: str = DEFAULT_REGION_EXECUTION) -> dict:
+    @coalesce_calls("summoner-v4:by-puuid")
+    def get_summoner_info_by_puuid(puuid: str = None, region: str = DEFAULT_REGION_EXECUTION, use_cache: bool = True) -> dict:
         """
         [info] Access accountID, summonerID, summonerLevel by their PUUID from SUMMONER_V4 API Portal
         [param] puuid: Player's unique identifier to lookup summoner info
         [param] region: Region execution code for API request (default: configured region)
+        [param] use_cache: Serve / store the result in the persisted TTL lookup cache (default: True)
         [return] Tuple of (status_code, summoner_json) containing IDs & level, or None if failed
         """
         if not puuid:
             puuid = input("Enter player puuid: ")
 
-        params = {
-            'api_key': RIOT_API_KEY
-        }
+        # encrypted summoner / account IDs practically never change, check the lookup cache first
+        cache_key = f"{region}:{puuid}"
+        if use_cache:
+            cached_summoner = get_lookup_cache().get("summoner-v4:by-puuid", cache_key, refresh_fn=lambda: SUMMONER_V4.get_summoner_info_by_puuid(puuid, region, use_cache=False))
+            if cached_summoner is not None:
+                return 200, cached_summoner
 
         api_url = f"https://{region}.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{puuid}"
+        method = "/lol/summoner/v4/summoners/by-puuid/{encryptedPUUID}"
 
-        retries = 0
-        while retries < MAX_RETRY_ATTEMPTS:
-            try:
-                response = requests.get(api_url, params=urlencode(params))  # make the request w/ API 
-                response.raise_for_status()                                 # check for any errors
-                return response.status_code, response.json()                # return the json response
-            except requests.exceptions.RequestException as e:
-                if 500 <= response.status_code < 600:                        # checking for 5XX error
-                    print(f"[Server Error - {response.status_code}] retrying... ({retries + 1}/{MAX_RETRY_ATTEMPTS})")
-                    retries += 1
-                    time.sleep(RETRY_DELAY)
-                elif response.status_code == 429: # rate limit exceeded
-                    time.sleep(RETRY_DELAY * 3)
-                else:
-                    print(f"[get_summoner_info_by_puuid] ({response.status_code})Issue fetching SummonerDTO from API: {e}")
-                    return None
-        print(f"Failed to fetch SummonerDTO after {MAX_RETRY_ATTEMPTS} attempts")
-        return None
\ No newline at end of file
+        result = riot_get(api_url, method, region, "get_summoner_info_by_puuid")
+        if result and use_cache:
+            get_lookup_cache().put("summoner-v4:by-puuid", cache_key, result[1])  # persist for future runs
+        return result
\ No newline at end of file
@@ -0,0 +1,156 @@
+# api_clients/riot_client/single_flight.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import asyncio
+import inspect
+import functools
+import threading
+
+
+class SingleFlight:
+    """
+    [info] Coalesces concurrent identical calls (threads) into one in-flight execution
+
+    The first caller for a key runs the function, every caller that arrives while it is still
+    running waits for and receives the same result (or exception). Results are not cached once
+    the call finishes, that is the job of the match / lookup caches.
+    """
+    def __init__(self) -> None:
+        """
+        [info] Initialize empty in-flight table
+        [return] None
+        """
+        self.lock = threading.Lock()
+        self.in_flight = {}     # key -> _Call
+        self.executed = 0
+        self.coalesced = 0
+
+    class _Call:
+        def __init__(self) -> None:
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def do(self, key, fn):
+        """
+        [info] Run fn once per key among concurrent callers
+        [param] key: Hashable call identity (ex. ("account-v1:by-puuid", region, puuid))
+        [param] fn: Zero-arg function performing the call
+        [return] Result of fn (shared by all coalesced callers)
+        """
+        with self.lock:
+            call = self.in_flight.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._Call()
+                self.in_flight[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+            call.done.set()
+
+    def stats(self) -> dict:
+        """
+        [info] Counters for logging
+        [return] Dictionary of executed / coalesced calls and current in-flight count
+        """
+        with self.lock:
+            return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self.in_flight)}
+
+
+class AsyncSingleFlight:
+    """
+    [info] asyncio version of SingleFlight, concurrent coroutines await one shared task per key
+    """
+    def __init__(self) -> None:
+        """
+        [info] Initialize empty in-flight table
+        [return] None
+        """
+        self.in_flight = {}     # key -> asyncio.Task
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key, coroutine_fn):
+        """
+        [info] Await coroutine_fn() once per key among concurrent callers
+        [param] key: Hashable call identity (ex. request url + params)
+        [param] coroutine_fn: Zero-arg function returning a coroutine
+        [return] Result of the shared coroutine
+        """
+        task = self.in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(coroutine_fn())
+            self.in_flight[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        # shield: one cancelled waiter must not cancel the request for everybody else
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        """
+        [info] Counters for logging
+        [return] Dictionary of executed / coalesced calls and current in-flight count
+        """
+        return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self.in_flight)}
+
+
+############################
+### SHARED SINGLE FLIGHT ###
+############################
+_SHARED_SINGLE_FLIGHT = SingleFlight()
+
+def get_single_flight() -> SingleFlight:
+    """
+    [info] Process-wide SingleFlight shared by the riot_client/services wrappers
+    [return] Shared SingleFlight instance
+    """
+    return _SHARED_SINGLE_FLIGHT
+
+def coalesce_calls(endpoint: str):
+    """
+    [info] Decorator coalescing concurrent identical calls of a service wrapper
+    [param] endpoint: Endpoint name prefixed to the call key (ex. match-v5:by-id)
+    [return] Decorator keyed by (endpoint, bound arguments with defaults applied)
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return fn(*args, **kwargs)      # bad call, let the function raise its usual error
+            bound.apply_defaults()              # f(x), f(x, "americas") and f(x, region="americas") share one key
+            key = (endpoint, tuple(bound.arguments.items()))
+            try:
+                hash(key)
+            except TypeError:
+                return fn(*args, **kwargs)      # unhashable argument (ex. a list), run uncoalesced instead of failing
+            return _SHARED_SINGLE_FLIGHT.do(key, lambda: fn(*args, **kwargs))
+        return wrapper
+    return decorator
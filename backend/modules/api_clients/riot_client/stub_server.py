@@ -0,0 +1,407 @@
+# api_clients/riot_client/stub_server.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import os
+import json
+import random
+import asyncio
+import hashlib
+import logging
+import threading
+from aiohttp import web
+
+# local imports
+from .rate_limiter import parse_rate_limit
+from .services import update_sys_path
+update_sys_path()
+from modules.utils.file_utils import load_json_from_file
+
+FIXTURE_DIRS = ("../data/official_tourney_games", "../data/custom_examples")     # relative to backend/
+RATE_LIMITS_JSON_PATH = "constants/zephyrRateLimits.json"
+DEFAULT_APP_LIMITS = [(20, 1), (100, 120)]     # development key: 20 requests / 1s, 100 requests / 2min
+DEFAULT_STUB_HOST = "127.0.0.1"
+DEFAULT_STUB_PORT = 8787
+
+LEAGUE_TIERS = ["IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "EMERALD", "DIAMOND", "MASTER"]
+LEAGUE_DIVISIONS = ["IV", "III", "II", "I"]
+
+# route -> handler name, route templates match zephyrRateLimits.json so method limits line up
+ROUTES = {
+    "/riot/account/v1/accounts/by-riot-id/{gameName}/{tagLine}": "account_by_riot_id",
+    "/riot/account/v1/accounts/by-puuid/{puuid}": "account_by_puuid",
+    "/lol/summoner/v4/summoners/by-puuid/{encryptedPUUID}": "summoner_by_puuid",
+    "/lol/match/v5/matches/by-puuid/{puuid}/ids": "match_ids_by_puuid",
+    "/lol/match/v5/matches/{matchId}": "match_by_id",
+    "/lol/league/v4/entries/by-puuid/{encryptedPUUID}": "league_entries_by_puuid",
+    "/lol/league/v4/entries/by-summoner/{encryptedSummonerId}": "league_entries_by_summoner",
+}
+
+
+class FixedWindow:
+    """
+    [info] Riot style fixed rate limit window (count resets when the window expires)
+    """
+    def __init__(self, limit: int, period: int) -> None:
+        self.limit = limit
+        self.period = period
+        self.started = None
+        self.count = 0
+
+    def hit(self, now: float) -> float:
+        """
+        [info] Count a request against the window
+        [param] now: Current loop time
+        [return] 0.0 if within the limit, else seconds until the window resets
+        """
+        if self.started is None or now - self.started >= self.period:
+            self.started, self.count = now, 0
+        self.count += 1
+        if self.count > self.limit:
+            return self.started + self.period - now
+        return 0.0
+
+
+class RiotStubServer:
+    """
+    [info] Local stand-in for the Riot API serving recorded fixtures, with rate limits and fault injection
+
+    Serves account-v1, summoner-v4, match-v5 and league-v4 routes from the match json files in
+    data/official_tourney_games and data/custom_examples (accounts / summoners are taken from match
+    participants, league entries are derived deterministically from the PUUID). Every response
+    carries X-App-Rate-Limit / X-Method-Rate-Limit headers with per-key counts, exceeding a window
+    returns 429 + Retry-After, and latency, 5XX bursts, service 429s and rejected keys can be
+    injected, so APIQueue, AsyncRiotClient and the service wrappers can be load tested offline.
+
+    Usage (point the sync wrappers at it with RIOT_API_BASE_URL=http://127.0.0.1:8787 in config/api.env):
+        server = RiotStubServer(latency=(0.02, 0.08), error_rate=0.01)
+        base_url = server.start_in_thread()
+        ...
+        server.stop_thread()
+    """
+    def __init__(self, fixture_dirs: tuple = FIXTURE_DIRS, host: str = DEFAULT_STUB_HOST, port: int = DEFAULT_STUB_PORT, latency: tuple = (0.0, 0.0), app_limits: list = DEFAULT_APP_LIMITS, method_limits: dict = None, error_rate: float = 0.0, error_burst: int = 3, error_status: int = 503, service_429_rate: float = 0.0, rejected_keys: tuple = (), seed: int = None) -> None:
+        """
+        [info] Load fixtures and fault injection settings
+        [param] fixture_dirs: Directories with recorded MatchDTO json files (default: official tourney games + custom examples)
+        [param] host: Interface to bind (default: 127.0.0.1)
+        [param] port: Port to bind, 0 picks a free one (default: 8787)
+        [param] latency: (min, max) seconds added to every response (default: (0.0, 0.0))
+        [param] app_limits: [(limit, period)] app windows per API key, None or [] disables them (default: 20/1s, 100/120s)
+        [param] method_limits: Method template -> [(limit, period)] (default: zephyrRateLimits.json)
+        [param] error_rate: Probability that a request starts a 5XX burst on its route (default: 0.0)
+        [param] error_burst: Consecutive 5XX responses per burst (default: 3)
+        [param] error_status: Status code returned during bursts (default: 503)
+        [param] service_429_rate: Probability of a 429 without Retry-After (underlying service limit) (default: 0.0)
+        [param] rejected_keys: API keys answered with 403 (ex. to test key pool retirement) (default: none)
+        [param] seed: Random seed for reproducible latency / faults (default: None)
+        [return] None
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.app_limits = list(app_limits or [])
+        self.method_limits = method_limits if method_limits is not None else self._load_method_limits()
+        self.error_rate = error_rate
+        self.error_burst = error_burst
+        self.error_status = error_status
+        self.service_429_rate = service_429_rate
+        self.rejected_keys = set(rejected_keys)
+        self.random = random.Random(seed)
+        self.windows = {}           # (api key, scope) -> [FixedWindow]
+        self.bursts = {}            # route -> remaining 5XX responses
+        self.counters = {"requests": 0, "ok": 0, "not_found": 0, "rate_limited": 0, "service_429": 0, "server_error": 0, "rejected": 0}
+        self.runner = None
+        self.loop = None
+        self.thread = None
+
+        self.matches = {}           # match ID -> MatchDTO
+        self.accounts = {}          # puuid -> participant
+        self.riot_ids = {}          # "gamename#tagline" (lowercase) -> puuid
+        self.summoners = {}         # encrypted summoner ID -> puuid
+        self.match_ids = {}         # puuid -> [(gameEndTimestamp, queueId, match ID)]
+        for fixture_dir in fixture_dirs:
+            self._load_fixtures(fixture_dir)
+
+    @staticmethod
+    def _load_method_limits() -> dict:
+        limits = {}
+        for service_name, methods in load_json_from_file(RATE_LIMITS_JSON_PATH).items():
+            if service_name == "overall" or not isinstance(methods, dict):
+                continue
+            for method, method_info in methods.items():
+                limits[method] = [parse_rate_limit(rate_limit_str) for rate_limit_str in method_info.get("rateLimits", [])]
+        return limits
+
+    def _load_fixtures(self, fixture_dir: str) -> None:
+        """
+        [info] Index every MatchDTO json of a directory (overview / non-match files are skipped)
+        [param] fixture_dir: Directory path
+        [return] None
+        """
+        if not os.path.isdir(fixture_dir):
+            logging.warning(f"[RiotStubServer] Fixture directory not found: {fixture_dir}")
+            return
+        for file in sorted(os.listdir(fixture_dir)):
+            if not file.endswith(".json"):
+                continue
+            with open(os.path.join(fixture_dir, file)) as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or "metadata" not in data or "info" not in data:
+                continue
+            match = {"metadata": data["metadata"], "info": data["info"]}    # drop local annotations (team_ids, ...)
+            match_id = match["metadata"]["matchId"]
+            if match_id in self.matches:
+                continue
+            self.matches[match_id] = match
+            for participant in match["info"]["participants"]:
+                puuid = participant["puuid"]
+                self.accounts[puuid] = participant
+                self.riot_ids[f"{participant['riotIdGameName']}#{participant['riotIdTagline']}".lower()] = puuid
+                self.summoners[participant["summonerId"]] = puuid
+                self.match_ids.setdefault(puuid, []).append((match["info"]["gameEndTimestamp"], match["info"]["queueId"], match_id))
+
+    def puuids(self) -> list:
+        """
+        [info] PUUIDs known to the stub (every participant of the fixture matches)
+        [return] Sorted list of PUUIDs
+        """
+        return sorted(self.accounts)
+
+    ################
+    ### HANDLERS ###
+    ################
+    @staticmethod
+    def _not_found() -> web.Response:
+        return web.json_response({"status": {"message": "Data not found", "status_code": 404}}, status=404)
+
+    def account_by_riot_id(self, request) -> web.Response:
+        puuid = self.riot_ids.get(f"{request.match_info['gameName']}#{request.match_info['tagLine']}".lower())
+        return self.account_by_puuid(request, puuid)
+
+    def account_by_puuid(self, request, puuid: str = None) -> web.Response:
+        participant = self.accounts.get(puuid or request.match_info.get("puuid"))
+        if participant is None:
+            return self._not_found()
+        return web.json_response({"puuid": participant["puuid"], "gameName": participant["riotIdGameName"], "tagLine": participant["riotIdTagline"]})
+
+    def summoner_by_puuid(self, request) -> web.Response:
+        participant = self.accounts.get(request.match_info["encryptedPUUID"])
+        if participant is None:
+            return self._not_found()
+        return web.json_response({
+            "id": participant["summonerId"],
+            "accountId": participant["summonerId"],
+            "puuid": participant["puuid"],
+            "profileIconId": participant["profileIcon"],
+            "revisionDate": max(end for end, _, _ in self.match_ids[participant["puuid"]]),
+            "summonerLevel": participant["summonerLevel"],
+        })
+
+    def match_ids_by_puuid(self, request) -> web.Response:
+        query = request.query
+        start_time = int(query.get("startTime", 0)) * 1000
+        end_time = int(query["endTime"]) * 1000 if "endTime" in query else None
+        queue = int(query["queue"]) if "queue" in query else None
+        start, count = int(query.get("start", 0)), int(query.get("count", 20))
+        # recorded games are customs (queue 0), like Riot a queue with no games returns an empty list
+        entries = sorted(self.match_ids.get(request.match_info["puuid"], []), reverse=True)
+        if queue is not None:
+            entries = [entry for entry in entries if entry[1] == queue]
+        match_ids = [match_id for end, _, match_id in entries if end >= start_time and (end_time is None or end <= end_time)]
+        return web.json_response(match_ids[start:start + count])
+
+    def match_by_id(self, request) -> web.Response:
+        match = self.matches.get(request.match_info["matchId"])
+        return web.json_response(match) if match else self._not_found()
+
+    def league_entries_by_puuid(self, request, puuid: str = None) -> web.Response:
+        puuid = puuid or request.match_info.get("encryptedPUUID")
+        participant = self.accounts.get(puuid)
+        if participant is None:
+            return self._not_found()
+        # deterministic fake rank so repeated runs see the same data
+        digest = hashlib.sha1(puuid.encode()).digest()
+        if digest[0] % 5 == 0:
+            return web.json_response([])    # unranked
+        tier = LEAGUE_TIERS[digest[1] % len(LEAGUE_TIERS)]
+        wins, losses = 20 + digest[3] % 80, 20 + digest[4] % 80
+        return web.json_response([{
+            "leagueId": hashlib.sha1(tier.encode()).hexdigest(),
+            "queueType": "RANKED_SOLO_5x5",
+            "tier": tier,
+            "rank": "I" if tier == "MASTER" else LEAGUE_DIVISIONS[digest[2] % len(LEAGUE_DIVISIONS)],
+            "summonerId": participant["summonerId"],
+            "puuid": puuid,
+            "leaguePoints": digest[5] % 100,
+            "wins": wins,
+            "losses": losses,
+            "veteran": False, "inactive": False, "freshBlood": False, "hotStreak": False,
+        }])
+
+    def league_entries_by_summoner(self, request) -> web.Response:
+        puuid = self.summoners.get(request.match_info["encryptedSummonerId"])
+        return self.league_entries_by_puuid(request, puuid) if puuid else self._not_found()
+
+    #######################
+    ### FAULTS / LIMITS ###
+    #######################
+    def _limit_headers(self, api_key: str, scope: str, limits: list, now: float) -> tuple:
+        """
+        [info] Count a request against a scope's windows
+        [param] api_key: Key the windows belong to
+        [param] scope: "app" or a method template
+        [param] limits: [(limit, period)] of the scope
+        [param] now: Current loop time
+        [return] Tuple of (limit header, count header, seconds until the exceeded window resets or 0.0)
+        """
+        windows = self.windows.setdefault((api_key, scope), [FixedWindow(limit, period) for limit, period in limits])
+        retry_after = max((window.hit(now) for window in windows), default=0.0)
+        limit_header = ",".join(f"{window.limit}:{window.period}" for window in windows)
+        count_header = ",".join(f"{window.count}:{window.period}" for window in windows)
+        return limit_header, count_header, retry_after
+
+    @web.middleware
+    async def middleware(self, request, handler):
+        """
+        [info] Latency, key checks, rate limit headers / 429s and 5XX bursts around every route
+        """
+        self.counters["requests"] += 1
+        if self.latency[1] > 0:
+            await asyncio.sleep(self.random.uniform(*self.latency))
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else None
+        if route not in ROUTES:
+            self.counters["not_found"] += 1
+            return self._not_found()
+
+        api_key = request.query.get("api_key") or request.headers.get("X-Riot-Token")
+        if not api_key:
+            self.counters["rejected"] += 1
+            return web.json_response({"status": {"message": "Unauthorized", "status_code": 401}}, status=401)
+        if api_key in self.rejected_keys:
+            self.counters["rejected"] += 1
+            return web.json_response({"status": {"message": "Forbidden", "status_code": 403}}, status=403)
+
+        now = asyncio.get_running_loop().time()
+        headers = {}
+        app_limit, app_count, app_wait = self._limit_headers(api_key, "app", self.app_limits, now)
+        method_limit, method_count, method_wait = self._limit_headers(api_key, route, self.method_limits.get(route, []), now)
+        if app_limit:
+            headers.update({"X-App-Rate-Limit": app_limit, "X-App-Rate-Limit-Count": app_count})
+        if method_limit:
+            headers.update({"X-Method-Rate-Limit": method_limit, "X-Method-Rate-Limit-Count": method_count})
+
+        if app_wait > 0 or method_wait > 0:
+            self.counters["rate_limited"] += 1
+            limit_type = "application" if app_wait >= method_wait else "method"
+            headers.update({"Retry-After": str(max(1, int(max(app_wait, method_wait) + 0.999))), "X-Rate-Limit-Type": limit_type})
+            return web.json_response({"status": {"message": "Rate limit exceeded", "status_code": 429}}, status=429, headers=headers)
+
+        if self.service_429_rate and self.random.random() < self.service_429_rate:
+            self.counters["service_429"] += 1
+            return web.json_response({"status": {"message": "Rate limit exceeded", "status_code": 429}}, status=429, headers=headers)
+
+        if self.bursts.get(route, 0) == 0 and self.error_rate and self.random.random() < self.error_rate:
+            self.bursts[route] = self.error_burst
+        if self.bursts.get(route, 0) > 0:
+            self.bursts[route] -= 1
+            self.counters["server_error"] += 1
+            return web.json_response({"status": {"message": "Service unavailable", "status_code": self.error_status}}, status=self.error_status, headers=headers)
+
+        response = await handler(request)
+        if response.status == 404:
+            self.counters["not_found"] += 1
+        else:
+            self.counters["ok"] += 1
+        response.headers.update(headers)
+        return response
+
+    @staticmethod
+    def _route(handler):
+        async def route(request):
+            return handler(request)
+        return route
+
+    #################
+    ### LIFECYCLE ###
+    #################
+    async def start(self) -> str:
+        """
+        [info] Start serving on the running event loop
+        [return] Base URL (ex. http://127.0.0.1:8787)
+        """
+        app = web.Application(middlewares=[self.middleware])
+        for route, handler_name in ROUTES.items():
+            app.router.add_get(route, self._route(getattr(self, handler_name)))
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]     # resolve port 0
+        logging.info(f"[RiotStubServer] Serving {len(self.matches)} matches / {len(self.accounts)} accounts on {self.base_url}")
+        return self.base_url
+
+    async def stop(self) -> None:
+        """
+        [info] Stop serving
+        [return] None
+        """
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start_in_thread(self) -> str:
+        """
+        [info] Start the server on its own event loop thread (for blocking callers: APIQueue, service wrappers)
+        [return] Base URL (ex. http://127.0.0.1:8787)
+        """
+        started = threading.Event()
+        start_errors = []           # start() failure (ex. port already in use), re-raised in the caller
+        self.loop = asyncio.new_event_loop()
+
+        def serve():
+            asyncio.set_event_loop(self.loop)
+            try:
+                self.loop.run_until_complete(self.start())
+            except Exception as e:
+                start_errors.append(e)
+                return
+            finally:
+                started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=serve, name="riot-stub-server", daemon=True)
+        self.thread.start()
+        started.wait()
+        if start_errors:
+            self.thread.join()
+            self.loop.close()
+            self.loop = None
+            raise start_errors[0]
+        return self.base_url
+
+    def stop_thread(self) -> None:
+        """
+        [info] Stop a server started with start_in_thread()
+        [return] None
+        """
+        if self.loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.loop = None
+
+    def stats(self) -> dict:
+        """
+        [info] Response counters for load test reports
+        [return] Dictionary of requests, ok, not_found, rate_limited, service_429, server_error, rejected
+        """
+        return dict(self.counters)
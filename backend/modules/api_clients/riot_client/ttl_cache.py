@@ -0,0 +1,228 @@
+# api_clients/riot_client/ttl_cache.py
+
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# local imports
+from .services import update_sys_path
+update_sys_path()
+from config.config import get_riot_api_config
+
+LOOKUP_CACHE_FILE = "../data/cache/riot_lookups.json"     # relative to backend/
+DEFAULT_MAX_ENTRIES = 5000
+
+# per-endpoint TTLs in seconds (Riot IDs change rarely, encrypted summoner / account IDs practically never)
+LOOKUP_TTLS = {
+    "account-v1:by-riot-id": 24 * 60 * 60,
+    "account-v1:by-puuid": 24 * 60 * 60,
+    "summoner-v4:by-puuid": 7 * 24 * 60 * 60,
+}
+DEFAULT_TTL = 60 * 60
+
+
+class TTLCache:
+    """
+    [info] Size-bounded LRU cache with per-endpoint TTLs, persisted to a json file between runs
+
+    Entries past their TTL are refetched synchronously. With background_refresh enabled, an entry
+    that is stale by less than one extra TTL is served immediately while a background thread
+    revalidates it (stale-while-revalidate).
+    """
+    def __init__(self, file_name: str = LOOKUP_CACHE_FILE, ttls: dict = None, max_entries: int = DEFAULT_MAX_ENTRIES, background_refresh: bool = False) -> None:
+        """
+        [info] Load a persisted cache (or start empty)
+        [param] file_name: Json file the cache is persisted to (default: ../data/cache/riot_lookups.json)
+        [param] ttls: Dictionary of endpoint -> TTL seconds (default: LOOKUP_TTLS)
+        [param] max_entries: Max entries kept before evicting least recently used (default: 5000)
+        [param] background_refresh: Serve slightly stale entries while revalidating in background (default: False)
+        [return] None
+        """
+        self.file_name = file_name
+        self.ttls = ttls if ttls else dict(LOOKUP_TTLS)
+        self.max_entries = max_entries
+        self.background_refresh = background_refresh
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()     # "endpoint|key" -> {"value": json, "stored_at": epoch seconds}
+        self.refreshing = set()
+        self.executor = None
+        self.dirty = False
+
+        # counters
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        """
+        [info] Load persisted entries (oldest first so LRU order survives restarts)
+        [return] None
+        """
+        if not os.path.exists(self.file_name):
+            return
+        try:
+            with open(self.file_name) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"[TTLCache] Ignoring unreadable cache file {self.file_name}: {e}")
+            return
+        for cache_key, entry in data.get("entries", []):
+            self.entries[cache_key] = entry
+        self._evict()
+
+    def _ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, DEFAULT_TTL)
+
+    def _evict(self) -> None:
+        """
+        [info] Drop least recently used entries beyond max_entries (caller holds lock)
+        [return] None
+        """
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, endpoint: str, key: str, refresh_fn=None):
+        """
+        [info] Look up a cached value
+        [param] endpoint: Endpoint name used for the TTL (ex. account-v1:by-puuid)
+        [param] key: Lookup key within the endpoint (ex. region:puuid)
+        [param] refresh_fn: Zero-arg function returning (status_code, json) or None, used for background revalidation
+        [return] Cached json or None if missing / expired
+        """
+        cache_key = f"{endpoint}|{key}"
+        with self.lock:
+            entry = self.entries.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return None
+            age = time.time() - entry["stored_at"]
+            ttl = self._ttl(endpoint)
+            if age <= ttl:
+                self.entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry["value"]
+            if not (self.background_refresh and refresh_fn and age <= 2 * ttl):
+                self.misses += 1
+                return None
+            self.entries.move_to_end(cache_key)
+            self.stale_hits += 1
+            schedule_refresh = cache_key not in self.refreshing
+            if schedule_refresh:
+                self.refreshing.add(cache_key)
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ttl-cache-refresh")
+            value = entry["value"]
+
+        if schedule_refresh:
+            self.executor.submit(self._refresh, endpoint, key, refresh_fn)
+        return value
+
+    def _refresh(self, endpoint: str, key: str, refresh_fn) -> None:
+        """
+        [info] Background revalidation of a stale entry
+        [param] endpoint: Endpoint name
+        [param] key: Lookup key
+        [param] refresh_fn: Zero-arg function returning (status_code, json) or None
+        [return] None
+        """
+        try:
+            result = refresh_fn()
+            if result:
+                self.put(endpoint, key, result[1])
+        except Exception as e:
+            logging.warning(f"[TTLCache] Background refresh failed for {endpoint}|{key}: {e}")
+        finally:
+            with self.lock:
+                self.refreshing.discard(f"{endpoint}|{key}")
+
+    def put(self, endpoint: str, key: str, value) -> None:
+        """
+        [info] Store a value (refreshes its TTL and LRU position)
+        [param] endpoint: Endpoint name used for the TTL (ex. summoner-v4:by-puuid)
+        [param] key: Lookup key within the endpoint
+        [param] value: Json serializable value
+        [return] None
+        """
+        cache_key = f"{endpoint}|{key}"
+        with self.lock:
+            self.entries[cache_key] = {"value": value, "stored_at": time.time()}
+            self.entries.move_to_end(cache_key)
+            self._evict()
+            self.dirty = True
+
+    def invalidate(self, endpoint: str, key: str) -> None:
+        """
+        [info] Remove a single entry
+        [param] endpoint: Endpoint name
+        [param] key: Lookup key
+        [return] None
+        """
+        with self.lock:
+            if self.entries.pop(f"{endpoint}|{key}", None) is not None:
+                self.dirty = True
+
+    def save(self) -> None:
+        """
+        [info] Atomically persist entries to the cache file (LRU order preserved)
+        [return] None
+        """
+        with self.lock:
+            if not self.dirty:
+                return
+            entries = list(self.entries.items())
+            self.dirty = False
+        os.makedirs(os.path.dirname(self.file_name) or ".", exist_ok=True)
+        tmp_path = f"{self.file_name}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"entries": entries}, f)
+        os.replace(tmp_path, self.file_name)
+
+    def stats(self) -> dict:
+        """
+        [info] Cache counters for logging
+        [return] Dictionary of hits, stale hits, misses, evictions and entry count
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+            }
+
+
+###########################
+### SHARED LOOKUP CACHE ###
+###########################
+_SHARED_LOOKUP_CACHE = None
+_SHARED_LOOKUP_CACHE_LOCK = threading.Lock()
+
+def get_lookup_cache() -> TTLCache:
+    """
+    [info] Process-wide TTL cache for ACCOUNT_V1 / SUMMONER_V4 lookups (saved at exit)
+    [return] Shared TTLCache instance (stale-while-revalidate if LOOKUP_BACKGROUND_REFRESH=true in config/api.env)
+    """
+    global _SHARED_LOOKUP_CACHE
+    with _SHARED_LOOKUP_CACHE_LOCK:
+        if _SHARED_LOOKUP_CACHE is None:
+            background_refresh = get_riot_api_config("LOOKUP_BACKGROUND_REFRESH")
+            _SHARED_LOOKUP_CACHE = TTLCache(
+                background_refresh=(background_refresh or "").strip().lower() in ("1", "true", "yes"),
+            )
+            atexit.register(_SHARED_LOOKUP_CACHE.save)
+        return _SHARED_LOOKUP_CACHE
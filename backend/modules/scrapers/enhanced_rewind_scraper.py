@@ -60,6 +60,7 @@ class RateLimitManager:
         self.request_history: deque = deque()
         self.last_captcha_time: Optional[datetime] = None
         self.adaptive_delay = 30  # Start with 30 second delays
+        self.circuit_breaker = LeagueChampScraper.CIRCUIT_BREAKER  # shared with every rewind.lol scraper
         
     def can_make_request(self) -> Tuple[bool, str]:
         """
@@ -67,6 +68,10 @@ class RateLimitManager:
         
         [return] Tuple[bool, str]: (can_make_request, reason_if_not)
         """
+        # Check whether rewind.lol tripped the circuit ("Too many requests in the queue")
+        if self.circuit_breaker.retry_after() > 0:
+            return False, f"Circuit open, rewind.lol queue is full ({self.circuit_breaker.retry_after():.0f}s left)"
+        
         # Check concurrent limit
         if len(self.active_requests) >= self.concurrent_limit:
             return False, f"Concurrent limit reached ({len(self.active_requests)}/{self.concurrent_limit})"
@@ -136,6 +141,9 @@ class RateLimitManager:
         
         [return] int: Delay in seconds
         """
+        if self.circuit_breaker.retry_after() > 0:
+            return int(self.circuit_breaker.retry_after()) + 1
+        
         if self.last_captcha_time and (datetime.now() - self.last_captcha_time) < timedelta(minutes=10):
             return self.adaptive_delay
         
@@ -154,6 +162,7 @@ class ProfileManager:
     def __init__(self, driver):
         self.driver = driver
         self.base_url = "https://rewind.lol/"
+        self.circuit_breaker = LeagueChampScraper.CIRCUIT_BREAKER
         
         # XPath constants based on your specifications
         self.SEARCH_INPUT_XPATH = "/html/body/main/div/div/div/form/div/input"
@@ -183,6 +192,11 @@ class ProfileManager:
         [param] riot_id: str - Riot ID to search for
         [return] ProfileStatus: Current status of the profile
         """
+        if not self.circuit_breaker.allow():
+            print(f"{ColorPrint.RED}[Profile Search] Circuit open, skipping {riot_id} "
+                  f"(retry in {self.circuit_breaker.retry_after():.0f}s){ColorPrint.RESET}")
+            return ProfileStatus.RATE_LIMITED
+        
         try:
             print(f"{ColorPrint.CYAN}[Profile Search] Searching for {riot_id}{ColorPrint.RESET}")
             
@@ -221,28 +235,34 @@ class ProfileManager:
             # Check for profile creation needed
             if self.PROFILE_CREATION_TEXT in page_source:
                 print(f"{ColorPrint.YELLOW}[Profile Search] Profile needs creation for {riot_id}{ColorPrint.RESET}")
+                self.circuit_breaker.record_success()
                 return ProfileStatus.NEEDS_CREATION
             
             # Check for rate limiting errors
             if self.QUEUE_ERROR_TEXT in page_source or self.TOO_MANY_REQUESTS_TEXT in page_source:
                 print(f"{ColorPrint.RED}[Profile Search] Rate limited for {riot_id}{ColorPrint.RESET}")
+                self.circuit_breaker.record_failure()
                 return ProfileStatus.RATE_LIMITED
             
             # Check for reCAPTCHA
             if "recaptcha" in page_source.lower():
                 print(f"{ColorPrint.RED}[Profile Search] reCAPTCHA triggered for {riot_id}{ColorPrint.RESET}")
+                self.circuit_breaker.record_failure()
                 return ProfileStatus.RATE_LIMITED
             
             # If we're on a profile page, profile exists
             if "user_champions" in self.driver.current_url or "Champions Played" in page_source:
                 print(f"{ColorPrint.GREEN}[Profile Search] Profile exists for {riot_id}{ColorPrint.RESET}")
+                self.circuit_breaker.record_success()
                 return ProfileStatus.EXISTS
             
             print(f"{ColorPrint.RED}[Profile Search] Unknown status for {riot_id}{ColorPrint.RESET}")
+            self.circuit_breaker.release_trial()    # says nothing about rewind.lol's queue, free a half-open trial slot
             return ProfileStatus.ERROR
             
         except Exception as e:
             print(f"{ColorPrint.RED}[Profile Search] Error searching for {riot_id}: {e}{ColorPrint.RESET}")
+            self.circuit_breaker.release_trial()
             return ProfileStatus.ERROR
     
     def create_profile(self, riot_id: str) -> bool:
@@ -267,13 +287,16 @@ class ProfileManager:
             
             if "recaptcha" in page_source.lower():
                 print(f"{ColorPrint.RED}[Profile Creation] reCAPTCHA triggered during creation{ColorPrint.RESET}")
+                self.circuit_breaker.record_failure()
                 return False
             
             if self.QUEUE_ERROR_TEXT in page_source or self.TOO_MANY_REQUESTS_TEXT in page_source:
                 print(f"{ColorPrint.RED}[Profile Creation] Rate limited during creation{ColorPrint.RESET}")
+                self.circuit_breaker.record_failure()
                 return False
             
             print(f"{ColorPrint.GREEN}[Profile Creation] Creation initiated for {riot_id}{ColorPrint.RESET}")
+            self.circuit_breaker.record_success()
             return True
             
         except Exception as e:
@@ -302,13 +325,16 @@ class ProfileManager:
             
             if "recaptcha" in page_source.lower():
                 print(f"{ColorPrint.RED}[Profile Update] reCAPTCHA triggered during update{ColorPrint.RESET}")
+                self.circuit_breaker.record_failure()
                 return False
             
             if self.QUEUE_ERROR_TEXT in page_source or self.TOO_MANY_REQUESTS_TEXT in page_source:
                 print(f"{ColorPrint.RED}[Profile Update] Rate limited during update{ColorPrint.RESET}")
+                self.circuit_breaker.record_failure()
                 return False
             
             print(f"{ColorPrint.GREEN}[Profile Update] Update initiated for {riot_id}{ColorPrint.RESET}")
+            self.circuit_breaker.record_success()
             return True
             
         except Exception as e:
@@ -13,6 +13,7 @@ import time, sys, csv, os
 # pretty printing and color
 import modules.utils.color_utils as ColorPrint
 from modules.utils.file_utils import load_json_from_file
+from modules.utils.circuit_breaker import get_circuit_breaker
 
 # Selenium WebDriver Options
 from selenium import webdriver
@@ -65,6 +66,9 @@ class LeagueChampScraper:
     BROWSER = "chrome"
     WEBSITE_TIMEOUT = 5
     POSITION_LIST = ["top", "jng", "mid", "bot", "sup"]
+    CIRCUIT_BREAKER = get_circuit_breaker("rewind.lol", failure_threshold=2, recovery_timeout=300)  # opened by "Too many requests in the queue" pages
+    TOO_MANY_REQUESTS_TEXT = "Too many requests in the queue from this IP Address"
+    SEARCH_RESULT_DELAY = 2     # seconds for the search result page to load before checking it for rate limit errors
 
     @staticmethod
     def input(inputType: str = None):
@@ -113,6 +117,9 @@ class LeagueChampScraper:
         
         [return] int: 1 for success, -1 for error
         """
+        if not LeagueChampScraper.CIRCUIT_BREAKER.allow():
+            print(f"Error: rewind.lol is rate limiting this IP, retry in {LeagueChampScraper.CIRCUIT_BREAKER.retry_after():.0f}s")
+            return -1 # error
         zephyr_print(f"Entering Player IGN: {player_ign}")
         try:
             status = LeagueChampScraper.select_region()
@@ -121,9 +128,17 @@ class LeagueChampScraper:
             search_box = LeagueChampScraper.DRIVER.find_element(By.CLASS_NAME, 'main__interface-menu-input')
             search_box.send_keys(player_ign + Keys.RETURN)  # Send query and hit Enter
 
+            # "Too many requests" pages count towards opening the breaker, anything else closes it
+            time.sleep(LeagueChampScraper.SEARCH_RESULT_DELAY)
+            if LeagueChampScraper.TOO_MANY_REQUESTS_TEXT in LeagueChampScraper.DRIVER.page_source:
+                print(f"{ColorPrint.RED}Error: rewind.lol is rate limiting this IP ({player_ign}){ColorPrint.RESET}")
+                LeagueChampScraper.CIRCUIT_BREAKER.record_failure()
+                return -1 # error
+            LeagueChampScraper.CIRCUIT_BREAKER.record_success()
             return 1 # success
         except Exception as e:
             print(f"Error: {e}")
+            LeagueChampScraper.CIRCUIT_BREAKER.release_trial()  # driver error, says nothing about rewind.lol's queue
             return -1 # error
     
     @staticmethod
@@ -473,7 +488,9 @@ class LeagueChampScraper:
             zephyr_print(f"{ColorPrint.RED}Updating Player Champion History for {profile}{ColorPrint.RESET}")
 
             # access updated player champion history table + store into csv
-            LeagueChampScraper.load_player_profile(profile)
+            if LeagueChampScraper.load_player_profile(profile) == -1:
+                print(f"{ColorPrint.RED}Skipping {profile}, profile could not be loaded{ColorPrint.RESET}")
+                continue
             LeagueChampScraper.access_player_champion_history()
 
             # create directory {team_id} if it doesn't exist
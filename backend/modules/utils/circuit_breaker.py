@@ -0,0 +1,169 @@
+import time, threading
+
+# breaker lifecycle: closed (calls flow) -> open (fail fast) -> half_open (one trial call) -> closed | open
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5       # consecutive failures that trip the breaker
+DEFAULT_RECOVERY_TIMEOUT = 30.0     # seconds the breaker stays open before letting a trial call through
+
+class CircuitOpenError(Exception):
+    """
+    [info] Raised / returned when a call is rejected because its breaker is open
+    """
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"Circuit '{name}' is open, retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """
+    [info] Closed / open / half-open circuit breaker for one endpoint or site
+
+    Counts consecutive failures (5XX, connection errors, "too many requests" pages). Once the
+    threshold is hit the breaker opens and allow() rejects calls until the recovery timeout has
+    passed, then a single trial call is let through: success closes the breaker, failure re-opens
+    it. A trial that never reports back is considered lost after another recovery timeout.
+    """
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT, clock=None) -> None:
+        """
+        [info] Initialize a closed breaker
+        [param] name: Endpoint / site identifier used in logs (ex. riot:americas:/lol/match/v5/matches/{matchId})
+        [param] failure_threshold: Consecutive failures that open the breaker (default: 5)
+        [param] recovery_timeout: Seconds to stay open before a half-open trial (default: 30.0)
+        [param] clock: Object providing time() (default: None, wall clock)
+        [return] None
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.state = STATE_CLOSED
+        self.failures = 0               # consecutive failures while closed
+        self.opened_at = None
+        self.trial_started = None       # half-open trial call in flight
+        self.rejected = 0
+        self.trips = 0
+
+    def _now(self) -> float:
+        return self.clock.time() if self.clock else time.time()
+
+    def allow(self) -> bool:
+        """
+        [info] Check whether a call may be sent now (claims the trial slot when half-open)
+        [return] True if the call should go ahead, False to fail fast
+        """
+        with self.lock:
+            now = self._now()
+            if self.state == STATE_OPEN and now - self.opened_at >= self.recovery_timeout:
+                self.state = STATE_HALF_OPEN
+                self.trial_started = None
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_HALF_OPEN and (self.trial_started is None or now - self.trial_started >= self.recovery_timeout):
+                self.trial_started = now
+                return True
+            self.rejected += 1
+            return False
+
+    def retry_after(self) -> float:
+        """
+        [info] Seconds until the breaker lets a trial call through
+        [return] 0.0 when closed / half-open, otherwise remaining open time
+        """
+        with self.lock:
+            if self.state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.opened_at + self.recovery_timeout - self._now())
+
+    def check(self) -> None:
+        """
+        [info] allow() that raises instead of returning False
+        [return] None
+        """
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_after())
+
+    def record_success(self) -> None:
+        """
+        [info] Report a healthy response (closes a half-open breaker, resets the failure count)
+        [return] None
+        """
+        with self.lock:
+            if self.state != STATE_CLOSED:
+                print(f"[CircuitBreaker] '{self.name}' recovered, closing")
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self.trial_started = None
+
+    def record_failure(self) -> None:
+        """
+        [info] Report a failed call (opens the breaker at the threshold or when a half-open trial fails)
+        [return] None
+        """
+        with self.lock:
+            self.failures += 1
+            if self.state == STATE_HALF_OPEN or (self.state == STATE_CLOSED and self.failures >= self.failure_threshold):
+                self.state = STATE_OPEN
+                self.opened_at = self._now()
+                self.trial_started = None
+                self.trips += 1
+                print(f"[CircuitBreaker] '{self.name}' opened after {self.failures} failures, failing fast for {self.recovery_timeout:.0f}s")
+
+    def release_trial(self) -> None:
+        """
+        [info] Give back a half-open trial slot without judging the endpoint (ex. the trial call was rate limited)
+        [return] None
+        """
+        with self.lock:
+            if self.state == STATE_HALF_OPEN:
+                self.trial_started = None
+
+    def stats(self) -> dict:
+        """
+        [info] Breaker state for logging
+        [return] Dictionary of state, consecutive failures, trips and rejected calls
+        """
+        with self.lock:
+            return {"state": self.state, "failures": self.failures, "trips": self.trips, "rejected": self.rejected}
+
+###############################
+### SHARED CIRCUIT BREAKERS ###
+###############################
+_SHARED_CIRCUIT_BREAKERS = {}
+_SHARED_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+def get_circuit_breaker(name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT) -> CircuitBreaker:
+    """
+    [info] Process-wide breaker for an endpoint or site (settings only apply when it is first created)
+    [param] name: Endpoint / site identifier (ex. riot:americas:/lol/match/v5/matches/{matchId}, rewind.lol)
+    [param] failure_threshold: Consecutive failures that open the breaker (default: 5)
+    [param] recovery_timeout: Seconds to stay open before a half-open trial (default: 30.0)
+    [return] Shared CircuitBreaker instance
+    """
+    with _SHARED_CIRCUIT_BREAKERS_LOCK:
+        if name not in _SHARED_CIRCUIT_BREAKERS:
+            _SHARED_CIRCUIT_BREAKERS[name] = CircuitBreaker(name, failure_threshold, recovery_timeout)
+        return _SHARED_CIRCUIT_BREAKERS[name]
+
+def get_riot_circuit_breaker(region: str, method: str) -> CircuitBreaker:
+    """
+    [info] Shared breaker for one Riot endpoint on one routing value
+    [param] region: Routing value or host (ex. americas, na1.api.riotgames.com)
+    [param] method: Rate limit method path template (ex. /lol/match/v5/matches/{matchId})
+    [return] Shared CircuitBreaker instance
+    """
+    routing = (region or "").split(".")[0].lower()
+    return get_circuit_breaker(f"riot:{routing}:{method}")
+
+def circuit_breaker_stats() -> dict:
+    """
+    [info] State of every shared breaker
+    [return] Dictionary of breaker name -> stats
+    """
+    with _SHARED_CIRCUIT_BREAKERS_LOCK:
+        breakers = list(_SHARED_CIRCUIT_BREAKERS.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
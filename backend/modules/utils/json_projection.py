@@ -0,0 +1,151 @@
+###############
+### IMPORTS ###
+###############
+
+# system imports
+import json
+
+# optional fast parser (pip install orjson), stdlib json is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson else "json"
+
+# fields parse_custom_match_info_by_team_id / draft analytics read from a MatchDTO (+ tourney annotations)
+MATCH_DRAFT_PROJECTION = (
+    "metadata.matchId",
+    "metadata.participants",
+    "info.gameCreation",
+    "info.gameDuration",
+    "info.gameVersion",
+    "info.teams[].teamId",
+    "info.teams[].win",
+    "info.teams[].bans",
+    "info.participants[].puuid",
+    "info.participants[].teamId",
+    "info.participants[].championId",
+    "info.participants[].championName",
+    "info.participants[].individualPosition",
+    "info.participants[].teamPosition",
+    "info.participants[].lane",
+    "info.participants[].role",
+    "info.participants[].riotIdGameName",
+    "info.participants[].riotIdTagline",
+    "info.participants[].summonerName",
+    "info.participants[].summonerId",
+    "info.participants[].win",
+    "team_ids",
+    "winning_team_id",
+)
+
+
+def fast_loads(raw):
+    """
+    [info] Parse json text / bytes with the fastest available backend
+    [param] raw: str or bytes
+    [return] Parsed json
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class Projection:
+    """
+    [info] Compiled field projection, keeps only the listed paths of a parsed json document
+
+    Paths are dotted keys, `[]` maps the rest of the path over a list:
+        "metadata.participants"              -> whole value
+        "info.teams[].bans"                  -> bans of every team
+        "info.participants[].championName"   -> one field of every participant
+    Missing keys are skipped, so the result is a smaller document of the same shape that the
+    existing dict code (and MatchDTO.from_json) reads unchanged. The source is still parsed in
+    full (neither orjson nor json can skip paths), projecting only shrinks what stays in memory.
+    """
+    def __init__(self, paths: tuple) -> None:
+        """
+        [info] Compile the projection paths into a lookup tree
+        [param] paths: Iterable of dotted paths
+        [return] None
+        """
+        self.paths = tuple(paths)
+        self.tree = {}      # key -> [is_list, subtree] (subtree None = keep the whole value)
+        for path in self.paths:
+            node = self.tree
+            parts = path.split(".")
+            for idx, part in enumerate(parts):
+                is_list = part.endswith("[]")
+                key = part[:-2] if is_list else part
+                last = idx == len(parts) - 1
+                entry = node.get(key)
+                if entry is None:
+                    entry = node[key] = [is_list, None if last else {}]
+                elif last:
+                    entry[1] = None                 # whole value wins over a narrower path
+                if entry[1] is None:
+                    break
+                node = entry[1]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Projection) and self.paths == other.paths
+
+    def __hash__(self) -> int:
+        # usable in single-flight / cache keys, equal path lists coalesce
+        return hash(self.paths)
+
+    def apply(self, data):
+        """
+        [info] Project a parsed json document
+        [param] data: Parsed json (dict)
+        [return] New dict with only the projected paths
+        """
+        return self._project(data, self.tree)
+
+    @classmethod
+    def _project(cls, value, tree: dict):
+        if not isinstance(value, dict):
+            return value
+        projected = {}
+        for key, (is_list, subtree) in tree.items():
+            if key not in value:
+                continue
+            child = value[key]
+            if subtree is None or child is None:
+                projected[key] = child
+            elif is_list:
+                projected[key] = [cls._project(entry, subtree) for entry in child]
+            else:
+                projected[key] = cls._project(child, subtree)
+        return projected
+
+
+def as_projection(projection) -> Projection:
+    # accept a compiled Projection, an iterable of paths, or None
+    if projection is None or isinstance(projection, Projection):
+        return projection
+    return Projection(projection)
+
+
+def loads_projected(raw, projection=None):
+    """
+    [info] Parse json text / bytes and keep only the projected paths
+    [param] raw: str or bytes
+    [param] projection: Projection or iterable of paths (default: None, keep everything)
+    [return] Parsed (projected) json
+    """
+    data = fast_loads(raw)
+    projection = as_projection(projection)
+    return projection.apply(data) if projection else data
+
+
+def load_json_projected(file_name: str, projection=None):
+    """
+    [info] Load a json file with the fast parser, keeping only the projected paths
+    [param] file_name: Path to the JSON file to load
+    [param] projection: Projection or iterable of paths (default: None, keep everything)
+    [return] Parsed (projected) json
+    """
+    with open(file_name, "rb") as f:
+        return loads_projected(f.read(), projection)
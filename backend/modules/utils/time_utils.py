@@ -15,4 +15,22 @@ def get_current_epoch_timestamp() -> int:
     [info] Get current time as epoch timestamp
     [return] Current epoch timestamp as integer
     """
-    return int(time.time())
\ No newline at end of file
+    return int(time.time())
+
+def get_time_windows(start_timestamp: int, end_timestamp: int, window_seconds: int = None) -> list:
+    """
+    [info] Split an epoch range into consecutive windows, newest first
+    [param] start_timestamp: Range start as epoch timestamp
+    [param] end_timestamp: Range end as epoch timestamp
+    [param] window_seconds: Window length in seconds (default: None, one window covering the range)
+    [return] List of (window_start, window_end) tuples ordered newest to oldest
+    """
+    if not window_seconds:
+        return [(start_timestamp, end_timestamp)]
+    windows = []
+    window_end = end_timestamp
+    while window_end > start_timestamp:
+        window_start = max(start_timestamp, window_end - window_seconds)
+        windows.append((window_start, window_end))
+        window_end = window_start
+    return windows
@@ -0,0 +1,140 @@
+###############
+### IMPORTS ###
+###############
+
+# global imports
+import time, random, logging
+from queue import Queue
+from threading import Event, Thread
+
+# local imports
+from __init__ import update_sys_path
+update_sys_path()
+from modules.api_clients.riot_client.api_queue import APIQueue
+from modules.api_clients.riot_client.api_object import APIObject
+from modules.api_clients.riot_client.rate_limiter import RateLimiter
+from modules.utils.color_utils import info_print
+
+############
+### EX 1 ###
+############
+
+# Compare p50 / p99 dispatch latency and worker CPU of the event-driven APIQueue vs the old busy-poll loop
+# ... run from backend/ : python samples/api_queue_benchmark.py
+
+NUM_REQUESTS = 200
+MAX_ARRIVAL_GAP = 0.05      # requests arrive every 0 - 50 ms (bursty roster refresh traffic)
+IDLE_SECONDS = 3.0          # idle period used to measure worker CPU with an empty queue
+REQUEST_INTERVAL = 0.01     # min spacing between requests (the old loop spins while waiting on it)
+
+logging.getLogger().setLevel(logging.WARNING)
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+class BenchmarkAPIObject(APIObject):
+    """
+    [info] APIObject that records its dispatch time instead of calling the Riot API
+    """
+    def __init__(self, done_event: Event, latencies: list, expected: int, priority: str = None) -> None:
+        super().__init__(url="http://localhost/benchmark", params={}, callback=lambda response: None, method="benchmark", priority=priority)
+        self.enqueue_time = time.perf_counter()
+        self.done_event = done_event
+        self.latencies = latencies
+        self.expected = expected
+
+    def make_request(self):
+        self.latencies.append(time.perf_counter() - self.enqueue_time)
+        if len(self.latencies) >= self.expected:
+            self.done_event.set()
+        return FakeResponse()
+
+class LegacyAPIQueue:
+    """
+    [info] Previous busy-poll worker (queue.empty() spin + 1s idle sleep), kept for comparison only
+    """
+    def __init__(self, rate_limit: int, interval: float, rate_limiter=None) -> None:
+        self.queue = Queue()
+        self.interval = interval
+        self.last_request_time = time.time()
+        self.stop_event = Event()
+        self.processing_thread = Thread(target=self.process_queue, daemon=True)
+        self.processing_thread.start()
+
+    def add_to_queue(self, api_object, delay: float = 0.0) -> None:
+        self.queue.put(api_object)
+
+    def stop(self, timeout: float = None) -> None:
+        self.stop_event.set()
+        self.processing_thread.join(timeout)
+
+    def process_queue(self) -> None:
+        while not self.stop_event.is_set():
+            if not self.queue.empty():
+                current_time = time.time()
+                if current_time - self.last_request_time >= self.interval:
+                    api_object = self.queue.get()
+                    if api_object is None:
+                        continue
+                    api_object.make_request()
+                    self.last_request_time = current_time
+            else:
+                time.sleep(1)
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def run_benchmark(queue_class, label: str) -> None:
+    # unlimited limiter so only the worker loop itself is measured
+    api_queue = queue_class(rate_limit=0, interval=REQUEST_INTERVAL, rate_limiter=RateLimiter({}))
+    if queue_class is APIQueue:
+        api_queue._shard("http://localhost/benchmark")     # start the worker before measuring idle CPU
+
+    # idle CPU: process CPU time consumed while the queue sits empty
+    cpu_start = time.process_time()
+    time.sleep(IDLE_SECONDS)
+    idle_cpu = (time.process_time() - cpu_start) / IDLE_SECONDS * 100
+
+    done_event = Event()
+    latencies = []
+    random.seed(7)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    for _ in range(NUM_REQUESTS):
+        api_queue.add_to_queue(BenchmarkAPIObject(done_event, latencies, NUM_REQUESTS))
+        time.sleep(random.uniform(0, MAX_ARRIVAL_GAP))
+    done_event.wait(timeout=30)
+    busy_cpu = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start) * 100
+    api_queue.stop(timeout=2)
+
+    info_print(f"idle CPU {idle_cpu:5.1f}% | busy CPU {busy_cpu:5.1f}% | p50 {percentile(latencies, 50) * 1000:8.2f} ms | p99 {percentile(latencies, 99) * 1000:8.2f} ms | dispatched {len(latencies)}/{NUM_REQUESTS}", header=label)
+
+run_benchmark(LegacyAPIQueue, "busy-poll   ")
+run_benchmark(APIQueue, "event-driven")
+
+############
+### EX 2 ###
+############
+
+# Interactive lookups arriving behind a backfill burst: per-class wait times with priority lanes
+
+NUM_BACKFILL = 300
+NUM_INTERACTIVE = 20
+
+def run_priority_benchmark() -> None:
+    api_queue = APIQueue(rate_limit=0, interval=REQUEST_INTERVAL, rate_limiter=RateLimiter({}))
+    done_event = Event()
+    latencies = []
+    for _ in range(NUM_BACKFILL):
+        api_queue.add_to_queue(BenchmarkAPIObject(done_event, latencies, NUM_BACKFILL + NUM_INTERACTIVE, priority="backfill"))
+    for _ in range(NUM_INTERACTIVE):
+        api_queue.add_to_queue(BenchmarkAPIObject(done_event, latencies, NUM_BACKFILL + NUM_INTERACTIVE, priority="interactive"))
+        time.sleep(REQUEST_INTERVAL * 5)
+    done_event.wait(timeout=30)
+    for priority, stats in api_queue.stats()["localhost"].items():
+        if stats["dispatched"]:
+            info_print(f"dispatched {stats['dispatched']:4d} | p50 wait {stats['p50_wait'] * 1000:8.2f} ms | p95 wait {stats['p95_wait'] * 1000:8.2f} ms", header=f"{priority:<12}")
+    api_queue.stop(timeout=2)
+
+run_priority_benchmark()
@@ -14,6 +14,7 @@ update_sys_path()
 
 from modules.api_clients.riot_client.services.account_v1 import ACCOUNT_V1
 from modules.api_clients.riot_client.services.summoner_v4 import SUMMONER_V4
+from modules.api_clients.riot_client.roster_pipeline import RosterPipeline
 
 from constants.constants import Constants
 from models.account_dto import AccountDTO
@@ -21,6 +22,27 @@ from models.summoner_dto import SummonerDTO
 from models.league_draft_dto import LeagueDraftDTO
 from modules.utils.file_utils import save_json_to_file
 
+def update_all_team_rosters(team_ids: list = None, dry_run: bool = False):
+    """
+    [info] Resolve PUUIDs, Riot IDs and summoner / account IDs for every team concurrently (no prompts)
+    [param] team_ids: Only refresh these teams (default: None, all teams in gcsTeams.json)
+    [param] dry_run: Print the changes without rewriting gcsTeams.json (default: False)
+    [return] None
+    """
+    report = RosterPipeline().run(team_ids=team_ids, dry_run=dry_run)
+
+    for change in report["changes"]:
+        print(f"[UPDATED] {change}")
+    for error in report["errors"]:
+        print(f"[ERROR] {error}")
+    print(f"\nResolved {report['accounts']} accounts in {report['elapsed']:.1f}s ({len(report['changes'])} changes)")
+
+    # mirror each refreshed team into its own output json (same as update_team_roster_info)
+    if not dry_run:
+        teams = Constants().GCS_TEAMS
+        for team_id in (team_ids if team_ids else teams.keys()):
+            save_json_to_file(teams[team_id], f"constants/teams/{team_id}.json")
+
 def update_team_roster_info(team_id: str = None):
 
     if not team_id:
@@ -426,7 +448,8 @@ def update_player_summoner_and_account_ids(roster_json):
 
 
 
-update_team_roster_info("V8")
+if __name__ == "__main__":
+    update_all_team_rosters()
 
 
 # player_riot_id format 
@@ -0,0 +1,57 @@
+###############
+### IMPORTS ###
+###############
+
+# global imports
+import time
+
+# local imports
+from __init__ import update_sys_path
+update_sys_path()
+from modules.api_clients.riot_client.rate_limiter import RateLimiter, VirtualClock
+from modules.utils.color_utils import info_print, success_print, error_print
+
+############
+### EX 1 ###
+############
+
+# Benchmark admission math of the shared rate limiter on a virtual clock (no sleeping)
+# ... run from backend/ : python samples/rate_limiter_benchmark.py
+
+MATCH_METHOD = "/lol/match/v5/matches/{matchId}"
+ACCOUNT_METHOD = "/riot/account/v1/accounts/by-puuid/{puuid}"
+NUM_REQUESTS = 1000
+
+clock = VirtualClock()
+rate_limiter = RateLimiter.from_json(clock=clock)
+
+admit_times = []
+cpu_start = time.perf_counter()
+for request_idx in range(NUM_REQUESTS):
+    method = MATCH_METHOD if request_idx % 2 == 0 else ACCOUNT_METHOD
+    rate_limiter.acquire(method)
+    admit_times.append(clock.time())
+cpu_elapsed = time.perf_counter() - cpu_start
+
+# theoretical floor: the tightest app window decides how long NUM_REQUESTS must take
+floor_seconds = max(((NUM_REQUESTS - 1) // bucket.limit) * bucket.period for bucket in rate_limiter.app_buckets)
+
+info_print(f"Requests admitted: {NUM_REQUESTS}", header="Rate Limiter")
+info_print(f"Virtual time elapsed: {clock.time():.2f}s (floor {floor_seconds:.2f}s)", header="Rate Limiter")
+info_print(f"Effective throughput: {NUM_REQUESTS / max(clock.time(), 1e-9):.3f} req/s", header="Rate Limiter")
+info_print(f"Admission cost: {cpu_elapsed / NUM_REQUESTS * 1e6:.2f} us/request", header="Rate Limiter")
+
+# verify no app window ever held more than its limit
+violations = 0
+for bucket in rate_limiter.app_buckets:
+    window_start = 0
+    for window_end in range(len(admit_times)):
+        while admit_times[window_end] - admit_times[window_start] >= bucket.period:
+            window_start += 1
+        if window_end - window_start + 1 > bucket.limit:
+            violations += 1
+
+if violations:
+    error_print(f"{violations} window violations detected")
+else:
+    success_print("No rate limit window violations")
@@ -0,0 +1,89 @@
+###############
+### IMPORTS ###
+###############
+
+# global imports
+import time, asyncio
+
+# local imports
+from __init__ import update_sys_path
+update_sys_path()
+from modules.api_clients.riot_client.async_client import AsyncRiotClient
+from modules.api_clients.riot_client.rate_limiter import RateLimiter
+from modules.api_clients.riot_client.stub_server import RiotStubServer
+from modules.utils.color_utils import info_print, success_print
+
+# Offline load tests of AsyncRiotClient against the local Riot stub server (no API key needed)
+# ... run from backend/ : python samples/riot_async_load_test.py
+
+STUB_LATENCY = (0.02, 0.08)     # simulated round trip per request (seconds)
+NUM_PLAYERS = 80
+MATCHES_PER_PLAYER = 5
+MAX_CONCURRENCY = 20
+CUSTOM_QUEUE = 0                # fixtures are recorded tourney customs
+
+# both runs download each unique match once (teammates share games), so the speedup only measures concurrency
+async def run_sequential(client, puuids):
+    match_ids = []
+    for puuid in puuids:
+        _, player_match_ids = await client.get_match_ids_by_puuid(puuid, queue=CUSTOM_QUEUE, count=MATCHES_PER_PLAYER)
+        match_ids += player_match_ids
+    downloaded = 0
+    for match_id in dict.fromkeys(match_ids):
+        if await client.get_match_by_id(match_id):
+            downloaded += 1
+    return downloaded
+
+async def run_fan_out(client, puuids):
+    match_id_results = await client.get_match_ids_for_players(puuids, queue=CUSTOM_QUEUE, count=MATCHES_PER_PLAYER)
+    match_ids = [match_id for result in match_id_results.values() if result for match_id in result[1]]
+    matches = await client.get_matches_by_ids(list(dict.fromkeys(match_ids)))
+    return sum(1 for result in matches.values() if result)
+
+############
+### EX 1 ###
+############
+
+# concurrency only: stub without rate limits or faults, fixture players from data/official_tourney_games
+async def ex_1():
+    server = RiotStubServer(port=0, latency=STUB_LATENCY, app_limits=[], method_limits={}, seed=0)
+    base_url = await server.start()
+    puuids = server.puuids()[:NUM_PLAYERS]
+
+    # unlimited limiter: the stub has no key budget, so this measures concurrency only
+    async with AsyncRiotClient(max_concurrency=1, rate_limiter=RateLimiter({}), base_url=base_url, api_key="stub") as client:
+        start = time.perf_counter()
+        downloaded = await run_sequential(client, puuids)
+        sequential_time = time.perf_counter() - start
+    info_print(f"{downloaded} unique matches in {sequential_time:.2f}s", header="sequential")
+
+    async with AsyncRiotClient(max_concurrency=MAX_CONCURRENCY, rate_limiter=RateLimiter({}), base_url=base_url, api_key="stub") as client:
+        start = time.perf_counter()
+        downloaded = await run_fan_out(client, puuids)
+        fan_out_time = time.perf_counter() - start
+    info_print(f"{downloaded} unique matches in {fan_out_time:.2f}s (max {MAX_CONCURRENCY} in flight)", header="fan-out   ")
+
+    success_print(f"Speedup: {sequential_time / fan_out_time:.1f}x")
+    await server.stop()
+
+############
+### EX 2 ###
+############
+
+# dev key budget + faults: 20 req / 1s app limit (the 2 min window is lifted so the run stays short),
+# 1% of requests start a burst of 3 x 503 and 1% get a service 429, the client's limiter learns the rest from headers
+async def ex_2():
+    server = RiotStubServer(port=0, latency=STUB_LATENCY, app_limits=[(20, 1)], error_rate=0.01, service_429_rate=0.01, seed=0)
+    base_url = await server.start()
+    puuids = server.puuids()[:12]     # stays under the limiter's 100 req / 2 min window from zephyrRateLimits.json
+
+    async with AsyncRiotClient(max_concurrency=MAX_CONCURRENCY, rate_limiter=RateLimiter.from_json(), base_url=base_url, api_key="stub") as client:
+        start = time.perf_counter()
+        downloaded = await run_fan_out(client, puuids)
+        elapsed = time.perf_counter() - start
+    info_print(f"{downloaded} matches in {elapsed:.2f}s under a 20 req / 1s budget", header="rate limited")
+    info_print(f"{server.stats()}", header="stub stats  ")
+    await server.stop()
+
+asyncio.run(ex_1())
+asyncio.run(ex_2())
@@ -0,0 +1,24 @@
+###############
+### IMPORTS ###
+###############
+
+# local imports
+from __init__ import update_sys_path
+update_sys_path()
+from modules.api_clients.riot_client.match_cache import get_match_cache
+from modules.utils.color_utils import info_print, success_print
+
+############
+### EX 1 ###
+############
+
+# Seed the on-disk match cache with the hand-saved MatchDTOs so MATCH_V5.get_match_by_id never re-downloads them
+# ... run from backend/ : python samples/seed_match_cache.py
+
+match_cache = get_match_cache()
+for directory in ["../data/official_tourney_games", "../data/custom_examples"]:
+    imported = match_cache.import_directory(directory)
+    info_print(f"Imported {imported} matches from {directory}", header="Match Cache")
+
+stats = match_cache.stats()
+success_print(f"{stats['entries']} matches cached ({stats['raw_bytes'] / 1e6:.1f} MB raw -> {stats['stored_bytes'] / 1e6:.1f} MB on disk)")